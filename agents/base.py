@@ -1,11 +1,14 @@
 """Base agent framework for News Town."""
 import asyncio
+import logging
+import time
+from collections import deque
 from abc import ABC, abstractmethod
 from typing import Optional, Any
 from uuid import UUID, uuid4
-from datetime import datetime
 from enum import Enum
-from db import db, event_store, task_queue, Task, TaskStatus
+from db import db, event_appender, task_queue, Task, TaskStage, TaskStatus
+from db.tasks import task_channel
 from config.logging import get_logger
 from config.settings import settings
 
@@ -33,30 +36,48 @@ class BaseAgent(ABC):
 
     def __init__(self, role: AgentRole):
         self.role = role
-        self.agent_id: UUID = uuid4()
+        self.agent_id = uuid4()
         self.status = AgentStatus.IDLE
         self.task_count = 0
         self.success_count = 0
         self._running = False
+        self._new_task_event = asyncio.Event()
+        self._listen_conn = None
+        self._task_channel: asyncio.Queue[Task] = asyncio.Queue(
+            maxsize=settings.max_inflight_tasks
+        )
+        self._active_tasks = 0
+        self._slot_freed = asyncio.Event()  # Set whenever a dispatch worker finishes a task
+        self._shutdown_done: Optional[asyncio.Event] = None  # Set once run() has wound down
+        self._last_heartbeat_at = 0.0  # time.monotonic() of last agent-row write
+        self._task_durations: deque[float] = deque(maxlen=128)  # Recent handle_task seconds
+
+    @property
+    def agent_id(self) -> UUID:
+        return self._agent_id
+
+    @agent_id.setter
+    def agent_id(self, value: UUID) -> None:
+        self._agent_id = value
+        self._agent_id_str = str(value)  # Formatted once, reused by every log call
 
     async def register(self) -> None:
         """Register agent in database."""
         await db.execute(
             """
             INSERT INTO agents (id, role, status, last_heartbeat)
-            VALUES ($1, $2, $3, $4)
+            VALUES ($1, $2, $3, now())
             ON CONFLICT (id) DO UPDATE
-            SET last_heartbeat = $4, status = $3
+            SET last_heartbeat = now(), status = $3
             """,
             self.agent_id,
             self.role.value,
             self.status.value,
-            datetime.utcnow(),
         )
         
         logger.info(
             "Agent registered",
-            agent_id=str(self.agent_id),
+            agent_id=self._agent_id_str,
             role=self.role.value,
         )
 
@@ -65,13 +86,73 @@ class BaseAgent(ABC):
         await db.execute(
             """
             UPDATE agents
-            SET last_heartbeat = $2, status = $3
+            SET last_heartbeat = now(), status = $2
             WHERE id = $1
             """,
             self.agent_id,
-            datetime.utcnow(),
             self.status.value,
         )
+        self._last_heartbeat_at = time.monotonic()
+
+    async def heartbeat_if_stale(self, interval: Optional[float] = None) -> None:
+        """Heartbeat unless a write within `interval` seconds already refreshed the agent row."""
+        if interval is None:
+            interval = settings.heartbeat_min_interval_seconds
+        if time.monotonic() - self._last_heartbeat_at >= interval:
+            await self.heartbeat()
+
+    def _heartbeat_interval(self) -> float:
+        """Periodic heartbeat interval, backed off while the agent is idle."""
+        if self.status == AgentStatus.IDLE:
+            return settings.idle_heartbeat_backoff_seconds
+        return settings.agent_heartbeat_interval_seconds
+
+    async def listen_for_tasks(self) -> None:
+        """Subscribe to new-task notifications for this agent's role.
+        
+        Falls back to plain interval polling if the listener can't be set up.
+        """
+        try:
+            self._listen_conn = await db.listen(
+                task_channel(self.role.value),
+                self._on_task_notification,
+            )
+        except Exception as e:
+            logger.warning(
+                "Task listener unavailable, falling back to polling",
+                agent_id=self._agent_id_str,
+                error=str(e),
+            )
+
+    def _on_task_notification(self, conn, pid, channel, payload) -> None:
+        """asyncpg listener callback - wake the run loop."""
+        self._new_task_event.set()
+
+    async def wait_for_tasks(self) -> None:
+        """Wait for a new-task notification, at most one poll interval.
+        
+        The timeout is a safety net for missed notifications and for tasks
+        that become pending again without an INSERT (e.g. stall recovery).
+        """
+        try:
+            await asyncio.wait_for(
+                self._new_task_event.wait(),
+                timeout=settings.task_poll_interval_seconds,
+            )
+        except asyncio.TimeoutError:
+            pass
+        self._new_task_event.clear()
+
+    async def wait_for_free_slot(self) -> None:
+        """Wait for a dispatch worker to finish a task, at most one heartbeat interval."""
+        self._slot_freed.clear()
+        try:
+            await asyncio.wait_for(
+                self._slot_freed.wait(),
+                timeout=self._heartbeat_interval(),
+            )
+        except asyncio.TimeoutError:
+            pass
 
     async def log_event(
         self,
@@ -79,8 +160,8 @@ class BaseAgent(ABC):
         event_type: str,
         data: dict[str, Any],
     ) -> int:
-        """Log an event for a story."""
-        return await event_store.append(
+        """Log an event for a story (batched with concurrent appends)."""
+        return await event_appender.submit(
             story_id=story_id,
             event_type=event_type,
             data=data,
@@ -92,113 +173,255 @@ class BaseAgent(ABC):
         """Handle a task - must be implemented by subclasses."""
         pass
 
+    async def complete_task(self, task: Task, output: dict[str, Any]) -> None:
+        """Mark a task as completed and log the completion event.
+
+        Subclasses may override this to persist stage results together with
+        the task completion.
+        """
+        # Mark task as completed (also refreshes our heartbeat)
+        await task_queue.complete_and_heartbeat(
+            task.id, output, self.agent_id, self._status_after_task().value
+        )
+        self._last_heartbeat_at = time.monotonic()
+
+        # Log completion event
+        await self.log_event(
+            task.story_id,
+            f"task.completed.{task.stage.value}",
+            {"task_id": str(task.id), "output": output},
+        )
+
     async def process_task(self, task: Task) -> None:
         """Process a task with error handling."""
-        self.status = AgentStatus.WORKING
-        await self.heartbeat()
+        self._active_tasks += 1
+        if self.status != AgentStatus.WORKING:
+            self.status = AgentStatus.WORKING
+            await self.heartbeat()
+        else:
+            await self.heartbeat_if_stale()
         
         try:
             logger.info(
                 "Processing task",
-                agent_id=str(self.agent_id),
+                agent_id=self._agent_id_str,
                 task_id=str(task.id),
                 stage=task.stage.value,
             )
             
-            # Handle the task
-            output = await self.handle_task(task)
-            
-            # Mark task as completed
-            await task_queue.complete(task.id, output)
-            
-            # Log completion event
-            await self.log_event(
-                task.story_id,
-                f"task.completed.{task.stage.value}",
-                {"task_id": str(task.id), "output": output},
-            )
+            # Handle the task, bounded so a hung provider can't pin this worker
+            timeout = self._task_timeout(task)
+            started = time.monotonic()
+            try:
+                output = await asyncio.wait_for(self.handle_task(task), timeout=timeout)
+            except asyncio.TimeoutError:
+                raise RuntimeError(f"Task timed out after {timeout}s")
+            finally:
+                self._task_durations.append(time.monotonic() - started)
             
+            # Don't abandon the completion write if we're cancelled mid-way
+            await asyncio.shield(self.complete_task(task, output))
+
             self.task_count += 1
             self.success_count += 1
             
             logger.info(
                 "Task completed successfully",
-                agent_id=str(self.agent_id),
+                agent_id=self._agent_id_str,
                 task_id=str(task.id),
             )
             
+        except asyncio.CancelledError as e:
+            if asyncio.current_task().cancelling():
+                raise
+            # A cancellation that leaked out of a shared computation, not one
+            # aimed at this worker - fail the task rather than lose the worker
+            await self._fail_task(task, e)
+        
         except Exception as e:
-            logger.error(
-                "Task failed",
-                agent_id=str(self.agent_id),
-                task_id=str(task.id),
-                error=str(e),
-                exc_info=True,
-            )
-            
-            # Mark task as failed
-            await task_queue.fail(task.id, str(e))
-            
-            # Log failure event
-            await self.log_event(
-                task.story_id,
-                f"task.failed.{task.stage.value}",
-                {"task_id": str(task.id), "error": str(e)},
-            )
-            
-            self.task_count += 1
+            await self._fail_task(task, e)
         
         finally:
-            self.status = AgentStatus.IDLE
-            await self.heartbeat()
+            self._active_tasks -= 1
+            if self._active_tasks == 0:
+                self.status = AgentStatus.IDLE
+            await self.heartbeat_if_stale()
+
+    async def _fail_task(self, task: Task, error: BaseException) -> None:
+        """Mark a task as failed and log the failure event."""
+        message = str(error) or type(error).__name__
+        logger.error(
+            "Task failed",
+            agent_id=self._agent_id_str,
+            task_id=str(task.id),
+            error=message,
+            exc_info=logger.is_enabled_for(logging.DEBUG),
+        )
+        
+        # Mark task as failed (also refreshes our heartbeat)
+        await task_queue.fail_and_heartbeat(
+            task.id, message, self.agent_id, self._status_after_task().value
+        )
+        self._last_heartbeat_at = time.monotonic()
+        
+        # Log failure event
+        await self.log_event(
+            task.story_id,
+            f"task.failed.{task.stage.value}",
+            {"task_id": str(task.id), "error": message},
+        )
+        
+        self.task_count += 1
+
+    def _task_timeout(self, task: Task) -> float:
+        """Watchdog timeout for handling a task of this stage."""
+        if task.stage == TaskStage.REVIEW:
+            return settings.review_timeout_seconds
+        return settings.task_timeout_seconds
+
+    def task_duration_percentiles(self) -> dict[str, float]:
+        """p50/p99 of recent handle_task durations in seconds (empty if none yet)."""
+        if not self._task_durations:
+            return {}
+        ordered = sorted(self._task_durations)
+        last = len(ordered) - 1
+        return {
+            "p50": ordered[min(last, int(0.5 * len(ordered)))],
+            "p99": ordered[min(last, int(0.99 * len(ordered)))],
+        }
+
+    def _status_after_task(self) -> AgentStatus:
+        """Agent status once the task currently finishing is done."""
+        return AgentStatus.IDLE if self._active_tasks <= 1 else AgentStatus.WORKING
 
     async def run(self) -> None:
-        """Main agent loop - poll for tasks and process them."""
+        """Main agent loop - poll for tasks and process them concurrently.
+        
+        One poll loop claims tasks onto an in-memory channel; a pool of
+        dispatch workers drains it, so claim latency overlaps with the
+        (LLM-bound) handle_task calls. Each round claims only as many tasks
+        as there are free workers, so idle agents of the same role can pick
+        up the rest.
+        
+        On stop, claiming ends, tasks already being handled are allowed to
+        finish, and claimed tasks no worker has started go back to pending.
+        """
         self._running = True
+        self._shutdown_done = asyncio.Event()
         await self.register()
+        await self.listen_for_tasks()
         
         logger.info(
             "Agent started",
-            agent_id=str(self.agent_id),
+            agent_id=self._agent_id_str,
             role=self.role.value,
         )
         
-        heartbeat_counter = 0
+        workers = [
+            asyncio.create_task(self._dispatch_loop())
+            for _ in range(settings.max_concurrent_tasks)
+        ]
         
+        try:
+            await self._poll_loop()
+        finally:
+            try:
+                await self._release_unstarted_tasks()
+                # Let in-flight tasks finish before the workers go away
+                await self._task_channel.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                self._shutdown_done.set()
+
+    async def _release_unstarted_tasks(self) -> None:
+        """Return claimed tasks still waiting in the channel to the pending queue."""
+        unstarted = []
+        while not self._task_channel.empty():
+            unstarted.append(self._task_channel.get_nowait().id)
+            self._task_channel.task_done()
+        if not unstarted:
+            return
+        try:
+            await task_queue.release_many(unstarted, self.agent_id)
+        except Exception as e:
+            logger.error(
+                "Failed to release unstarted tasks",
+                agent_id=self._agent_id_str,
+                count=len(unstarted),
+                error=str(e),
+            )
+
+    def _free_worker_slots(self) -> int:
+        """Dispatch workers not busy with, or about to pick up, a claimed task."""
+        return settings.max_concurrent_tasks - self._active_tasks - self._task_channel.qsize()
+
+    async def _dispatch_loop(self) -> None:
+        """Worker - process claimed tasks from the channel."""
+        while True:
+            task = await self._task_channel.get()
+            try:
+                await self.process_task(task)
+            finally:
+                self._task_channel.task_done()
+                self._slot_freed.set()
+
+    async def _poll_loop(self) -> None:
+        """Producer - claim task batches onto the channel."""
         while self._running:
             try:
-                # Claim a task
-                task = await task_queue.claim(self.agent_id, self.role.value)
+                free_slots = self._free_worker_slots()
+                if free_slots <= 0:
+                    # Every worker is busy - claim nothing until one frees up
+                    await self.wait_for_free_slot()
+                    await self.heartbeat_if_stale(self._heartbeat_interval())
+                    continue
                 
-                if task:
-                    await self.process_task(task)
+                # Claim a batch of tasks, no larger than the idle worker count
+                tasks = await task_queue.claim_many(
+                    self.agent_id,
+                    self.role.value,
+                    min(settings.claim_batch_size, free_slots),
+                )
+                
+                if tasks:
+                    for task in tasks:
+                        await self._task_channel.put(task)
                 else:
-                    # No tasks available - wait
-                    await asyncio.sleep(settings.task_poll_interval_seconds)
+                    # No tasks available - wait for a notification
+                    await self.wait_for_tasks()
                 
-                # Periodic heartbeat
-                heartbeat_counter += 1
-                if heartbeat_counter >= settings.agent_heartbeat_interval_seconds:
-                    await self.heartbeat()
-                    heartbeat_counter = 0
+                # Periodic heartbeat, unless task writes refreshed the row recently
+                await self.heartbeat_if_stale(self._heartbeat_interval())
                     
             except Exception as e:
                 logger.error(
                     "Agent loop error",
-                    agent_id=str(self.agent_id),
+                    agent_id=self._agent_id_str,
                     error=str(e),
-                    exc_info=True,
+                    exc_info=logger.is_enabled_for(logging.DEBUG),
                 )
                 await asyncio.sleep(5)
 
     async def stop(self) -> None:
-        """Stop the agent."""
+        """Stop the agent, waiting for tasks it is handling to finish."""
         self._running = False
+        self._new_task_event.set()
+        self._slot_freed.set()
+        
+        if self._shutdown_done is not None:
+            await self._shutdown_done.wait()
         self.status = AgentStatus.OFFLINE
+        
+        if self._listen_conn is not None:
+            await self._listen_conn.close()
+            self._listen_conn = None
+        
         await self.heartbeat()
         
         logger.info(
             "Agent stopped",
-            agent_id=str(self.agent_id),
+            agent_id=self._agent_id_str,
             role=self.role.value,
         )
@@ -1,18 +1,87 @@
 """Editor agent - reviews and verifies articles."""
 from typing import Any, List, Dict, Optional
-import json
 import asyncio
+import re
+import time
 from uuid import UUID
 from agents.base import BaseAgent, AgentRole
 from db import Task, TaskStage, db
 from db.articles import article_store
 from config.logging import get_logger
 from config.settings import settings
-from ingestion.search_fallback import get_search
-import anthropic
+from ingestion.search_fallback import get_search, source_domain
+from cache import TTLCache, cache_key
 
 logger = get_logger(__name__)
 
+# Claim checks are a pure function of (claim, context) - share results across
+# editor instances and coalesce concurrent checks of the same claim.
+_claim_support_cache = TTLCache(maxsize=10_000, ttl=3600)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_claim(claim: str) -> str:
+    """Normalize a claim for duplicate detection."""
+    return _WHITESPACE_RE.sub(" ", claim.strip().lower().rstrip(".!?"))
+
+
+# Static prompt text, built once at import rather than per review
+EDITOR_SYSTEM_PROMPT = "You are a professional news editor enforcing strict AP Style guidelines."
+FACT_CHECK_SYSTEM_PROMPT = "You are an expert fact-checker. Be pedantic and thorough."
+
+ANALYZE_PROMPT_HEADER = (
+    "Analyze the following news article draft for quality and AP Style adherence.\n\n"
+    "Article:\n"
+)
+ANALYZE_PROMPT_FOOTER = (
+    "\n\nInstructions:\n"
+    "1. Extract max 10 key factual claims for verification.\n"
+    "2. Assess tone (Objective, Biased, Sensationalist, Dry).\n"
+    "3. Check for AP Style violations (e.g., date formats, title capitalization, "
+    "number usage, Oxford commas - AP doesn't use them).\n"
+    "4. Identify grammatical or structural issues.\n"
+    "5. Provide a style score (0.0 to 1.0) based on overall quality and AP adherence.\n"
+)
+
+CLAIM_CHECK_PROMPT_FOOTER = "\n\nDoes the context support the claim? Be strict.\n"
+
+CLAIM_BATCH_PROMPT_HEADER = (
+    "For each numbered claim below, does its own context support it? Be strict.\n"
+    "Return one verdict per claim, in the same order.\n\n"
+)
+
+# Structured-output schemas for the editor's LLM calls
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "claims": {"type": "array", "items": {"type": "string"}, "maxItems": 10},
+        "tone": {"type": "string", "enum": ["Objective", "Biased", "Sensationalist", "Dry"]},
+        "ap_violations": {"type": "array", "items": {"type": "string"}},
+        "style_issues": {"type": "array", "items": {"type": "string"}},
+        "grammar_issues": {"type": "array", "items": {"type": "string"}},
+        "score": {"type": "number", "minimum": 0, "maximum": 1},
+    },
+    "required": ["claims", "tone", "ap_violations", "style_issues", "grammar_issues", "score"],
+}
+
+CLAIM_SUPPORT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "supported": {"type": "boolean"},
+        "reason": {"type": "string"},
+    },
+    "required": ["supported", "reason"],
+}
+
+CLAIM_BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "verdicts": {"type": "array", "items": CLAIM_SUPPORT_SCHEMA},
+    },
+    "required": ["verdicts"],
+}
+
 
 class EditorAgent(BaseAgent):
     """Editor agent that reviews, verifies, and scores articles."""
@@ -23,6 +92,8 @@ class EditorAgent(BaseAgent):
         from agents.llm import chat_service
         self.chat_service = chat_service
         self.search_provider_instance = None # Lazy load
+        # Bound claim-verification fan-out so search providers aren't rate limited
+        self._verify_semaphore = asyncio.Semaphore(settings.verify_concurrency)
 
     @property
     def search_provider(self):
@@ -37,17 +108,49 @@ class EditorAgent(BaseAgent):
         else:
             raise ValueError(f"Editor cannot handle stage: {task.stage}")
 
+    async def complete_task(self, task: Task, output: dict[str, Any]) -> None:
+        """Persist the review, complete the task and log its event atomically."""
+        if task.stage != TaskStage.REVIEW:
+            await super().complete_task(task, output)
+            return
+
+        from db.governance import article_review_store
+
+        article_id = task.input.get("article_id")  # Usually None for drafts
+        analysis = output.get("analysis", {})
+        await article_review_store.create_with_completion(
+            task_id=task.id,
+            task_output=output,
+            event_type=f"task.completed.{task.stage.value}",
+            agent_status=self._status_after_task().value,
+            story_id=task.story_id,
+            editor_agent_id=self.agent_id,
+            score=output["score"],
+            decision=output["decision"],
+            article_id=UUID(article_id) if article_id else None,
+            verification_score=output.get("verification_score"),
+            style_score=output.get("style_score"),
+            feedback=output.get("feedback"),
+            meta={
+                "tone": analysis.get("tone"),
+                "claims_count": len(analysis.get("claims", [])),
+                "ap_style_violations": len(analysis.get("ap_violations", [])),
+            },
+        )
+        self._last_heartbeat_at = time.monotonic()
+
     # ... (review_article method) ...
 
     async def review_article(self, task: Task) -> dict[str, Any]:
-        """Review an article draft with advanced AP style check and persistence."""
-        from db.governance import article_review_store
-        
+        """Review an article draft with advanced AP style check.
+
+        The review is persisted by ``complete_task`` together with the task
+        completion.
+        """
         draft = task.input.get("draft", {})
         article_text = draft.get("article", "")
         headline = draft.get("headline", "")
-        article_id = task.input.get("article_id") # Usually None for drafts
-        
+
         logger.info(
             "Advanced Review started",
             story_id=str(task.story_id),
@@ -83,28 +186,8 @@ class EditorAgent(BaseAgent):
             analysis, verification_results, score, decision
         )
         
-        # 6. PERSIST to article_reviews
-        try:
-            await article_review_store.create(
-                story_id=task.story_id,
-                editor_agent_id=self.agent_id,
-                score=score,
-                decision=decision,
-                article_id=UUID(article_id) if article_id else None,
-                verification_score=verification_score,
-                style_score=style_score,
-                feedback=feedback,
-                meta={
-                    "tone": analysis.get("tone"),
-                    "claims_count": len(analysis.get("claims", [])),
-                    "ap_style_violations": len(analysis.get("ap_violations", []))
-                }
-            )
-        except Exception as e:
-            logger.error("Failed to persist review", error=str(e))
-
         logger.info(
-            "Review completed and persisted",
+            "Review completed",
             decision=decision,
             score=score,
             story_id=str(task.story_id)
@@ -122,100 +205,141 @@ class EditorAgent(BaseAgent):
 
     async def _analyze_text(self, text: str) -> dict[str, Any]:
         """Analyze text for claims, tone, and strict AP Style standards."""
-        prompt = f"""Analyze the following news article draft for quality and AP Style adherence.
-        
-        Article:
-        {text}
-        
-        Instructions:
-        1. Extract max 10 key factual claims for verification.
-        2. Assess tone (Objective, Biased, Sensationalist, Dry).
-        3. Check for AP Style violations (e.g., date formats, title capitalization, number usage, Oxford commas - AP doesn't use them).
-        4. Identify grammatical or structural issues.
-        5. Provide a style score (0.0 to 1.0) based on overall quality and AP adherence.
-        
-        Return JSON format:
-        {{
-            "claims": ["claim 1", "claim 2"],
-            "tone": "Objective",
-            "ap_violations": ["violation 1", "violation 2"],
-            "style_issues": ["issue 1"],
-            "grammar_issues": ["issue 1"],
-            "score": 0.85
-        }}
-        """
+        prompt = f"{ANALYZE_PROMPT_HEADER}{text}{ANALYZE_PROMPT_FOOTER}"
         
         try:
-            content = await self.chat_service.generate(
-                system="You are a professional news editor enforcing strict AP Style guidelines.",
+            return await self.chat_service.generate(
+                system=EDITOR_SYSTEM_PROMPT,
                 messages=[{"role": "user", "content": prompt}],
-                max_tokens=1000,
+                max_tokens=750,
+                json_schema=ANALYSIS_SCHEMA,
             )
-            # Extract JSON from response
-            start = content.find("{")
-            end = content.rfind("}") + 1
-            if start != -1 and end != -1:
-                json_str = content[start:end]
-                return json.loads(json_str)
-            return {"claims": [], "tone": "Unknown", "score": 0.5, "ap_violations": []}
         except Exception as e:
             logger.error("Text analysis failed", error=str(e))
             return {"claims": [], "tone": "Unknown", "score": 0.5, "ap_violations": []}
 
     async def _verify_claims(self, claims: List[str]) -> dict[str, Any]:
-        """Verify claims using search."""
-        results = {}
-        verified_count = 0
-        
+        """Verify claims: search for context concurrently, then check them in one LLM call."""
         # Phase 4.1: Multi-pass check - verify more claims for deeper reliability
         limit = 7 
         claims_to_check = claims[:limit]
         
+        # Verify each distinct claim once; repeats (e.g. intro and conclusion) share the result
+        canonical: dict[str, str] = {}
         for claim in claims_to_check:
-            try:
-                search_results = await self.search_provider.search(claim, max_results=3)
-                context = "\n".join([r.snippet for r in search_results])
-                check = await self._check_claim_support(claim, context)
-                
-                results[claim] = check
-                if check["supported"]:
-                    verified_count += 1
-                    
-            except Exception as e:
-                logger.warning("Claim verification failed", claim=claim, error=str(e))
+            canonical.setdefault(_normalize_claim(claim), claim)
+        unique_claims = list(canonical.values())
+        
+        contexts = await asyncio.gather(
+            *[self._search_context(claim) for claim in unique_claims],
+            return_exceptions=True,
+        )
+        
+        results = {}
+        pending = []  # (claim, context) pairs not answered by the cache
+        for claim, context in zip(unique_claims, contexts):
+            if isinstance(context, BaseException):
+                logger.warning("Claim verification failed", claim=claim, error=str(context))
                 results[claim] = {"supported": False, "reason": "Verification failed"}
+                continue
+            
+            cached = _claim_support_cache.get(cache_key(claim, context))
+            if cached is not None:
+                results[claim] = cached
+            else:
+                pending.append((claim, context))
+        
+        if len(pending) == 1:
+            claim, context = pending[0]
+            results[claim] = await self._check_claim_support(claim, context)
+        elif pending:
+            results.update(await self._check_claims_batch(pending))
+        
+        details = {
+            claim: results[canonical[_normalize_claim(claim)]] for claim in claims_to_check
+        }
+        verified_count = sum(
+            1 for claim in claims_to_check if details[claim].get("supported")
+        )
         
         return {
             "claims_checked": len(claims_to_check),
             "verified_count": verified_count,
-            "details": results
+            "details": details
         }
 
+    async def _search_context(self, claim: str) -> str:
+        """Search for context on a single claim."""
+        async with self._verify_semaphore:
+            search_results = await self.search_provider.search(claim, max_results=3)
+            return "\n".join([r.snippet for r in search_results])
+
     async def _check_claim_support(self, claim: str, context: str) -> dict[str, Any]:
-        """Check if context supports the claim."""
-        prompt = f"""Claim: {claim}
-        
-        Context:
-        {context}
-        
-        Does the context support the claim? Be strict.
-        Return JSON: {{ "supported": true/false, "reason": "..." }}
-        """
-         
+        """Check if context supports the claim (cached per claim/context pair)."""
         try:
-            content = await self.chat_service.generate(
-                system="You are an expert fact-checker. Be pedantic and thorough.",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=200,
+            return await _claim_support_cache.get_or_compute(
+                cache_key(claim, context),
+                lambda: self._ask_claim_support(claim, context),
             )
-            start = content.find("{")
-            end = content.rfind("}") + 1
-            if start != -1 and end != -1:
-                return json.loads(content[start:end])
+        except ValueError:
             return {"supported": False, "reason": "LLM output parse error"}
-        except:
+        except Exception:
             return {"supported": False, "reason": "LLM check failed"}
 
+    async def _ask_claim_support(self, claim: str, context: str) -> dict[str, Any]:
+        """Ask the LLM whether context supports the claim."""
+        prompt = f"Claim: {claim}\n\nContext:\n{context}{CLAIM_CHECK_PROMPT_FOOTER}"
+        
+        return await self.chat_service.generate(
+            system=FACT_CHECK_SYSTEM_PROMPT,
+            messages=[{"role": "user", "content": prompt}],
+            model=self.chat_service.fastcheck_model,
+            max_tokens=120,
+            json_schema=CLAIM_SUPPORT_SCHEMA,
+        )
+
+    async def _check_claims_batch(
+        self, pairs: List[tuple[str, str]]
+    ) -> dict[str, dict[str, Any]]:
+        """Check several (claim, context) pairs with a single LLM request."""
+        try:
+            verdicts = await self._ask_claims_batch(pairs)
+        except ValueError:
+            return {claim: {"supported": False, "reason": "LLM output parse error"} for claim, _ in pairs}
+        except Exception:
+            return {claim: {"supported": False, "reason": "LLM check failed"} for claim, _ in pairs}
+        
+        results = {}
+        for (claim, context), verdict in zip(pairs, verdicts):
+            # The schema only guides the model - malformed verdicts fail that
+            # claim and aren't cached, so a retry asks again
+            if not isinstance(verdict, dict) or not isinstance(verdict.get("supported"), bool):
+                results[claim] = {"supported": False, "reason": "LLM output parse error"}
+                continue
+            _claim_support_cache.set(cache_key(claim, context), verdict)
+            results[claim] = verdict
+        return results
+
+    async def _ask_claims_batch(self, pairs: List[tuple[str, str]]) -> List[dict[str, Any]]:
+        """Ask the LLM whether each context supports its claim, one verdict per pair."""
+        numbered = "\n\n".join(
+            f"[{i}] Claim: {claim}\nContext:\n{context}"
+            for i, (claim, context) in enumerate(pairs, 1)
+        )
+        prompt = f"{CLAIM_BATCH_PROMPT_HEADER}{numbered}\n"
+        
+        response = await self.chat_service.generate(
+            system=FACT_CHECK_SYSTEM_PROMPT,
+            messages=[{"role": "user", "content": prompt}],
+            model=self.chat_service.fastcheck_model,
+            max_tokens=120 * len(pairs),
+            json_schema=CLAIM_BATCH_SCHEMA,
+        )
+        verdicts = response.get("verdicts", [])
+        if len(verdicts) != len(pairs):
+            raise ValueError(f"Expected {len(pairs)} verdicts, got {len(verdicts)}")
+        return verdicts
+
     def _calculate_score(self, analysis: dict, verification: dict) -> tuple[float, float, float]:
         """Calculate overall quality score."""
         style_base_score = analysis.get("score", 0.5)
@@ -265,14 +389,9 @@ class EditorAgent(BaseAgent):
         if not sources:
             return 0.0
         
-        from urllib.parse import urlparse
-        domains = set()
-        for s in sources:
-            url = s.get("url")
-            if url:
-                netloc = urlparse(url).netloc
-                if netloc:
-                    domains.add(netloc)
+        # Sources carry a precomputed domain; older records only have the url
+        domains = {s.get("domain") or source_domain(s.get("url") or "") for s in sources}
+        domains.discard("")
         
         # 1 domain = 0.0, 2 domains = 0.5, 3+ domains = 1.0
         if len(domains) <= 1: return 0.0
@@ -1,5 +1,8 @@
 """LLM abstraction layer."""
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
+import re
+import orjson
+import httpx
 import openai
 import anthropic
 from config.settings import settings
@@ -7,6 +10,33 @@ from config.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Structural tokens for locating an embedded JSON value: whole string literals
+# (so braces inside strings are skipped) or an open/close bracket.
+_JSON_TOKENS = {
+    "{": re.compile(r'"(?:[^"\\]|\\.)*"|[{}]', re.S),
+    "[": re.compile(r'"(?:[^"\\]|\\.)*"|[\[\]]', re.S),
+}
+
+
+def extract_json(text: str, opener: str = "{") -> Any:
+    """Parse the first complete JSON object (or array, with opener="[") in an LLM response.
+
+    Raises ValueError if the response contains no complete JSON value.
+    """
+    start = text.find(opener)
+    if start == -1:
+        raise ValueError("No JSON found in LLM output")
+    depth = 0
+    for match in _JSON_TOKENS[opener].finditer(text, start):
+        token = match.group()
+        if token == opener:
+            depth += 1
+        elif token[0] != '"':
+            depth -= 1
+            if depth == 0:
+                return orjson.loads(text[start:match.end()])
+    raise ValueError("Unterminated JSON in LLM output")
+
 
 class ChatService:
     """
@@ -18,22 +48,63 @@ class ChatService:
     """
 
     def __init__(self):
-        self.provider = "anthropic"
-        self.client: Any = None
+        self.provider = "local" if settings.local_llm_base_url else "anthropic"
+        # SDK and HTTP clients are built on first use, so importing this module
+        # (or a process that never generates) doesn't set up connection pools
+        self._client: Any = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> Any:
+        """Provider SDK client, built on first access."""
+        if self._client is None:
+            self._client = self._build_client()
+        return self._client
+
+    @client.setter
+    def client(self, value: Any) -> None:
+        self._client = value
+
+    def _build_client(self) -> Any:
+        """Create the SDK client for the configured provider."""
+        # One pooled keep-alive (HTTP/2 over TLS) client shared by every agent's
+        # LLM calls, so bursts of claim checks reuse connections
+        self._http_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=settings.llm_max_connections,
+                max_keepalive_connections=settings.llm_max_connections // 2,
+            ),
+            timeout=httpx.Timeout(600.0, connect=5.0),
+        )
         
-        if settings.local_llm_base_url:
-            self.provider = "local"
+        if self.provider == "local":
             logger.info(f"Initializing ChatService with LOCAL provider at {settings.local_llm_base_url}")
-            self.client = openai.AsyncOpenAI(
+            return openai.AsyncOpenAI(
                 base_url=settings.local_llm_base_url,
                 api_key="sk-local-key",  # Usually ignored by local runners
+                http_client=self._http_client,
             )
-        else:
-            self.provider = "anthropic"
-            logger.info("Initializing ChatService with ANTHROPIC provider")
-            self.client = anthropic.AsyncAnthropic(
-                api_key=settings.anthropic_api_key,
-            )
+        
+        logger.info("Initializing ChatService with ANTHROPIC provider")
+        return anthropic.AsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            http_client=self._http_client,
+        )
+
+    @property
+    def fastcheck_model(self) -> str:
+        """Small, cheap model for narrow classification-style checks."""
+        if self.provider == "local":
+            return settings.local_llm_fastcheck_model or settings.local_llm_model
+        return settings.claude_fastcheck_model
+
+    async def close(self) -> None:
+        """Close the shared HTTP connection pool, if it was ever opened."""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        self._client = None
 
     async def generate(
         self,
@@ -42,7 +113,8 @@ class ChatService:
         model: str = "",
         max_tokens: int = 1000,
         temperature: float = 0.7,
-    ) -> str:
+        json_schema: Optional[Dict[str, Any]] = None,
+    ) -> Any:
         """
         Generate a response from the LLM.
         
@@ -52,15 +124,26 @@ class ChatService:
             model: Model name override (optional)
             max_tokens: Max output tokens
             temperature: Sampling temperature
+            json_schema: JSON schema the response must follow (optional)
             
         Returns:
-            Generated text content
+            Generated text content, or the parsed object if json_schema is set
         """
         try:
             if self.provider == "anthropic":
                 # Use configured model or default to Sonnet
                 target_model = model or settings.claude_model
                 
+                # Structured output: force a single tool call whose input is the result
+                extra: Dict[str, Any] = {}
+                if json_schema:
+                    extra["tools"] = [{
+                        "name": "emit",
+                        "description": "Emit the structured result.",
+                        "input_schema": json_schema,
+                    }]
+                    extra["tool_choice"] = {"type": "tool", "name": "emit"}
+                
                 # Anthropic expects system as a separate parameter, not in messages
                 response = await self.client.messages.create(
                     model=target_model,
@@ -68,12 +151,18 @@ class ChatService:
                     temperature=temperature,
                     system=system,
                     messages=messages,
+                    **extra,
                 )
+                if json_schema:
+                    for block in response.content:
+                        if block.type == "tool_use":
+                            return block.input
+                    raise ValueError("No structured output in LLM response")
                 return response.content[0].text
                 
             elif self.provider == "local":
-                # Use configured local model, ignoring the specific model requested (which is likely optimal for Anthropic/OpenAI)
-                target_model = settings.local_llm_model
+                # Use the requested model (e.g. fastcheck_model) or the configured local model
+                target_model = model or settings.local_llm_model
                 
                 # Convert system prompt to a message for OpenAI format
                 full_messages = []
@@ -81,20 +170,84 @@ class ChatService:
                     full_messages.append({"role": "system", "content": system})
                 full_messages.extend(messages)
                 
+                extra = {}
+                if json_schema:
+                    extra["response_format"] = {
+                        "type": "json_schema",
+                        "json_schema": {"name": "emit", "schema": json_schema},
+                    }
+                
                 response = await self.client.chat.completions.create(
                     model=target_model,
                     max_tokens=max_tokens,
                     temperature=temperature,
                     messages=full_messages,
+                    **extra,
                 )
-                return response.choices[0].message.content
+                content = response.choices[0].message.content
+                if json_schema:
+                    return orjson.loads(content)
+                return content
                 
         except Exception as e:
-            logger.error(f"LLM generation failed ({self.provider}): {e}")
+            logger.error("LLM generation failed", provider=self.provider, error=str(e))
             raise
 
         return ""
 
+    async def stream(
+        self,
+        messages: List[Dict[str, str]],
+        system: str = "",
+        model: str = "",
+        max_tokens: int = 1000,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a text response from the LLM as it is generated.
+        
+        Same arguments as generate(). Closing the iterator early (or cancelling
+        the consuming task) aborts the request, so no further tokens are billed.
+        
+        Yields:
+            Text chunks in arrival order
+        """
+        try:
+            if self.provider == "anthropic":
+                async with self.client.messages.stream(
+                    model=model or settings.claude_model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    system=system,
+                    messages=messages,
+                ) as response:
+                    async for text in response.text_stream:
+                        yield text
+                        
+            elif self.provider == "local":
+                full_messages = []
+                if system:
+                    full_messages.append({"role": "system", "content": system})
+                full_messages.extend(messages)
+                
+                response = await self.client.chat.completions.create(
+                    model=model or settings.local_llm_model,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    messages=full_messages,
+                    stream=True,
+                )
+                try:
+                    async for chunk in response:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            yield chunk.choices[0].delta.content
+                finally:
+                    await response.close()
+                    
+        except Exception as e:
+            logger.error("LLM streaming failed", provider=self.provider, error=str(e))
+            raise
+
 
 # Global instance
 chat_service = ChatService()
@@ -1,6 +1,9 @@
 """Publisher agent - orchestrates multi-channel publishing."""
+import asyncio
+import logging
 from typing import Any, List
 from uuid import UUID
+from pydantic import BaseModel
 from agents.base import BaseAgent, AgentRole
 from db import Task, TaskStage
 from db.articles import article_store
@@ -13,6 +16,13 @@ from config.logging import get_logger
 logger = get_logger(__name__)
 
 
+class PublishInput(BaseModel):
+    """Validated input of a publish task."""
+    article_id: UUID
+    channels: List[str] = ["rss"]
+    recipients: List[str] = []  # Email channel only
+
+
 class PublisherAgent(BaseAgent):
     """Publisher agent that distributes articles to various channels."""
 
@@ -29,11 +39,10 @@ class PublisherAgent(BaseAgent):
 
     async def publish(self, task: Task) -> dict[str, Any]:
         """Publish an article to specified channels."""
-        article_id = task.input.get("article_id")
-        channels = task.input.get("channels", ["rss"])  # Default to RSS
-        
-        if not article_id:
-            raise ValueError("article_id required for publishing")
+        # Raises a ValidationError (a ValueError) if article_id is missing or malformed
+        inp = PublishInput.model_validate(task.input)
+        article_id = inp.article_id
+        channels = inp.channels
         
         logger.info(
             "Publishing article",
@@ -41,78 +50,25 @@ class PublisherAgent(BaseAgent):
             channels=channels,
         )
         
-        # Get article
-        article = await article_store.get(UUID(article_id))
+        # Get article, and anything a previous attempt already published
+        article, prior = await asyncio.gather(
+            article_store.get_article_cached(article_id),
+            publication_store.list_by_article(article_id),
+        )
         if not article:
             raise ValueError(f"Article {article_id} not found")
         
-        # Publish to each channel
-        results = {}
-        for channel in channels:
-            try:
-                if channel == "rss":
-                    result = await rss_publisher.publish(article)
-                    results[channel] = {
-                        "success": result.success,
-                        "publication_id": str(result.publication_id) if result.publication_id else None,
-                        "error": result.error,
-                    }
-                    
-                elif channel == "email":
-                    # Email requires recipients
-                    recipients = task.input.get("recipients", [])
-                    if not recipients:
-                        results[channel] = {
-                            "success": False,
-                            "error": "No recipients specified for email"
-                        }
-                        continue
-                    
-                    if email_publisher:
-                        batch_results = await email_publisher.send_batch(article, recipients)
-                        success_count = sum(1 for r in batch_results.values() if r.success)
-                        results[channel] = {
-                            "success": success_count > 0,
-                            "sent": success_count,
-                            "total": len(recipients),
-                        }
-                    else:
-                        results[channel] = {
-                            "success": False,
-                            "error": "Email publisher not configured (missing SendGrid API key)"
-                        }
-
-                elif channel == "bluesky":
-                    if bluesky_publisher:
-                        result = await bluesky_publisher.publish(article)
-                        results[channel] = {
-                            "success": result.success,
-                            "publication_id": str(result.publication_id) if result.publication_id else None,
-                            "error": result.error,
-                        }
-                    else:
-                        results[channel] = {
-                            "success": False,
-                            "error": "Bluesky publisher not configured (missing handle or app password)"
-                        }
-                
-                else:
-                    results[channel] = {
-                        "success": False,
-                        "error": f"Unknown channel: {channel}"
-                    }
-                    
-            except Exception as e:
-                logger.error(
-                    "Channel publishing failed",
-                    channel=channel,
-                    error=str(e),
-                    exc_info=True,
-                )
-                results[channel] = {
-                    "success": False,
-                    "error": str(e),
-                }
+        published: dict[str, list] = {}
+        for publication in prior:
+            if publication.status == "published":
+                published.setdefault(publication.channel, []).append(publication)
+        
+        # Publish to all channels concurrently (errors are caught per channel)
+        pairs = await asyncio.gather(*[
+            self._publish_channel(inp, article, channel, published.get(channel, []))
+            for channel in channels
+        ])
+        results = dict(pairs)
         
         # Log publication event
         await self.log_event(
@@ -141,3 +97,85 @@ class PublisherAgent(BaseAgent):
             "results": results,
             "success_count": success_count,
         }
+
+    async def _publish_channel(
+        self, inp: PublishInput, article: Any, channel: str, prior: List[Any]
+    ) -> tuple[str, dict[str, Any]]:
+        """Publish an article to a single channel, returning (channel, result).
+        
+        prior holds this article's live publications on the channel; a retried
+        task reuses them instead of posting (or emailing) the article again.
+        """
+        try:
+            if prior and channel in ("rss", "bluesky"):
+                return channel, {
+                    "success": True,
+                    "publication_id": str(prior[0].id),
+                    "error": None,
+                    "already_published": True,
+                }
+            
+            if channel == "rss":
+                result = await rss_publisher.publish(article)
+                return channel, {
+                    "success": result.success,
+                    "publication_id": str(result.publication_id) if result.publication_id else None,
+                    "error": result.error,
+                }
+                
+            elif channel == "email":
+                # Email requires recipients
+                recipients = inp.recipients
+                if not recipients:
+                    return channel, {
+                        "success": False,
+                        "error": "No recipients specified for email"
+                    }
+                
+                if email_publisher:
+                    already_sent = {(p.metadata or {}).get("recipient") for p in prior}
+                    pending = [r for r in recipients if r not in already_sent]
+                    batch_results = (
+                        await email_publisher.send_batch(article, pending) if pending else {}
+                    )
+                    success_count = sum(1 for r in batch_results.values() if r.success)
+                    success_count += len(recipients) - len(pending)
+                    return channel, {
+                        "success": success_count > 0,
+                        "sent": success_count,
+                        "total": len(recipients),
+                    }
+                return channel, {
+                    "success": False,
+                    "error": "Email publisher not configured (missing SendGrid API key)"
+                }
+
+            elif channel == "bluesky":
+                if bluesky_publisher:
+                    result = await bluesky_publisher.publish(article)
+                    return channel, {
+                        "success": result.success,
+                        "publication_id": str(result.publication_id) if result.publication_id else None,
+                        "error": result.error,
+                    }
+                return channel, {
+                    "success": False,
+                    "error": "Bluesky publisher not configured (missing handle or app password)"
+                }
+            
+            return channel, {
+                "success": False,
+                "error": f"Unknown channel: {channel}"
+            }
+                
+        except Exception as e:
+            logger.error(
+                "Channel publishing failed",
+                channel=channel,
+                error=str(e),
+                exc_info=logger.is_enabled_for(logging.DEBUG),
+            )
+            return channel, {
+                "success": False,
+                "error": str(e),
+            }
@@ -1,13 +1,123 @@
 """Reporter agent - researches and writes stories."""
+import asyncio
+import re
+from itertools import chain
 from typing import Any
 from agents.base import BaseAgent, AgentRole
+from cache import TTLCache, cache_key
 from db import Task, TaskStage
+from db.memory import memory_store
 from config.logging import get_logger
 from config.settings import settings
-import anthropic
+from ingestion import entity_batcher, search_service
+from ingestion.search_fallback import canonical_url, source_domain
+from jinja2 import Template
 
 logger = get_logger(__name__)
 
+# Prompt templates, compiled once at import rather than rebuilt per call
+DRAFT_PROMPT = Template("""Title: {{ detection_data.title }}
+Original Summary: {{ detection_data.summary }}
+Source URL: {{ detection_data.url }}
+
+Research Findings:
+- Verified: {{ verified }}
+- Number of independent sources: {{ sources|length }}
+- People: {{ (entities.people or [])[:5]|join(', ') or 'None' }}
+- Orgs: {{ (entities.organizations or [])[:5]|join(', ') or 'None' }}
+
+Key facts:
+{% for fact in facts[:5] %}
+- {{ fact.claim }}
+{% endfor %}
+
+Additional sources:
+{% for source in sources[1:4] %}
+- {{ source.title }}: {{ source.snippet[:100] }}...
+{% endfor %}
+{% if historical_context %}
+
+Historical Context/Related Stories:
+{% for item in historical_context %}
+- {{ item.content }}
+{% endfor %}
+{% endif %}
+
+Write a clear, factual news article (200-400 words).
+Include a headline and article body.
+Cite sources appropriately.
+If historical context is provided, mention it to add depth (e.g., "This follows...").
+""", trim_blocks=True, keep_trailing_newline=True)
+
+ANSWER_PROMPT = Template("""You are a research assistant.
+Story: {{ context.title }}
+Context: {{ context.summary }}
+
+Question: {{ question }}
+
+Sources:
+{% for source in context.sources[:5] %}
+- {{ source.title or 'Untitled' }}: {{ (source.snippet or source.full_content or 'No content')[:150] }}
+{% endfor %}
+{% if context.historical_context %}
+
+Historical Context:
+{% for item in context.historical_context[:2] %}
+- {{ item.content[:150] }}...
+{% endfor %}
+{% endif %}
+
+Answer the question based on findings.
+""", trim_blocks=True, keep_trailing_newline=True)
+
+# Source reliability tiers, matched against a source's domain and its parents
+_HIGH_RELIABILITY_DOMAINS = frozenset({"reuters.com", "apnews.com", "nytimes.com", "bbc.co.uk"})
+_LOW_RELIABILITY_DOMAINS = frozenset({"twitter.com", "facebook.com", "reddit.com", "blogspot.com"})
+_HIGH_RELIABILITY_TLD = re.compile(r"\.(?:gov|edu)(?:\.[a-z]{2})?$")
+
+# Completed drafts, revisions and prompt answers, keyed by the exact prompt.
+# Retried tasks and re-asked questions reuse the text instead of paying for a
+# new generation; concurrent identical requests are coalesced.
+_completion_cache = TTLCache(maxsize=512, ttl=4 * 3600)
+
+# Source snippets are trimmed once when research is compiled; prompts only
+# ever quote the first 100-150 characters, so the rest is dead weight in the
+# persisted task output and every stage that deserializes it.
+_SNIPPET_CHARS = 200
+
+# Below this much title+summary text an embedding or NER pass has nothing to
+# work with, so memory recall and spaCy extraction are skipped
+_MIN_SEMANTIC_TEXT_CHARS = 20
+
+# Structured-output schemas for the reporter's research LLM calls
+ENTITIES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "people": {"type": "array", "items": {"type": "string"}},
+        "organizations": {"type": "array", "items": {"type": "string"}},
+        "locations": {"type": "array", "items": {"type": "string"}},
+        "key_events": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["people", "organizations", "locations", "key_events"],
+}
+
+QUERIES_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "queries": {"type": "array", "items": {"type": "string"}, "maxItems": 3},
+    },
+    "required": ["queries"],
+}
+
+
+def _in_domains(host: str, domains: frozenset) -> bool:
+    """Whether host, or any parent domain of it, is in domains."""
+    while host:
+        if host in domains:
+            return True
+        host = host.partition(".")[2]
+    return False
+
 
 class ReporterAgent(BaseAgent):
     """Reporter agent that researches and drafts articles."""
@@ -17,6 +127,8 @@ class ReporterAgent(BaseAgent):
         # Use ChatService abstraction
         from agents.llm import chat_service
         self.chat_service = chat_service
+        # Bound search fan-out across concurrent research tasks so providers aren't rate limited
+        self._search_semaphore = asyncio.Semaphore(settings.research_search_concurrency)
 
     async def handle_task(self, task: Task) -> dict[str, Any]:
         """Handle research or draft tasks."""
@@ -37,6 +149,8 @@ class ReporterAgent(BaseAgent):
         title = detection_data.get("title", "")
         summary = detection_data.get("summary", "")
         original_url = detection_data.get("url", "")
+        # Same text the scout embedded/extracted, so NER and embedding caches hit
+        research_text = f"{title}. {summary}"
         
         logger.info(
             "Phase 4.5 Research started",
@@ -44,33 +158,23 @@ class ReporterAgent(BaseAgent):
             title=title,
         )
         
-        from ingestion import search_service, entity_extractor
-        from ingestion.embeddings import embedding_service
-        from db.human_oversight import human_prompt_store, source_store
-        from db.memory import memory_store
-        
         # Phase 1: Discovery & Initial Extraction
-        initial_entities_list = entity_extractor.extract(f"{title}. {summary}") if entity_extractor else []
-        
-        # LLM entity refinement
-        refined_entities = await self._refine_entities(
-            title=title, 
-            summary=summary, 
-            initial_entities=initial_entities_list
+        # Entity extraction + refinement (spaCy, then LLM), memory recall
+        # (vector DB) and discovery search (web) are independent - run them
+        # concurrently, with spaCy off the event loop
+        refined_entities, historical_context, discovery_results = await asyncio.gather(
+            self._extract_and_refine_entities(title, summary, research_text),
+            self._recall_similar_stories(task, research_text),
+            self._search(title, num_results=5),
+            return_exceptions=True,
         )
-        
-        # Contextual Memory Retrieval
-        historical_context = []
-        try:
-            embedding = embedding_service.embed(f"{title}. {summary}")
-            similar_memories = await memory_store.find_similar_stories(embedding, limit=3)
-            for memory in similar_memories:
-                if str(memory["story_id"]) != str(task.story_id):
-                    historical_context.append(memory)
-        except Exception: pass
-
-        # Discovery Search
-        discovery_results = await search_service.search(title, num_results=5)
+        if isinstance(refined_entities, BaseException):
+            refined_entities = {"people": [], "organizations": [], "locations": []}
+        if isinstance(historical_context, BaseException):
+            historical_context = []
+        if isinstance(discovery_results, BaseException):
+            logger.warning("Discovery search failed", error=str(discovery_results))
+            discovery_results = []
         
         # Phase 2: Deep Dive (Investigative Questions)
         investigative_questions = await self._generate_investigative_questions(
@@ -80,31 +184,43 @@ class ReporterAgent(BaseAgent):
             discovery_snippets=[r.snippet for r in discovery_results[:3]]
         )
         
-        deep_results = []
-        for query in investigative_questions[:2]: # Multi-hop: deep dive into specific leads
-            results = await search_service.search(query, num_results=2)
-            deep_results.extend(results)
+        # Multi-hop: deep dive into specific leads, all queries at once
+        deep_searches = await asyncio.gather(
+            *[self._search(query, num_results=2) for query in investigative_questions[:2]],
+            return_exceptions=True,
+        )
+        deep_results = [
+            r for results in deep_searches
+            if not isinstance(results, BaseException)
+            for r in results
+        ]
 
-        # Merge and Corroborate
-        all_results = discovery_results + deep_results
+        # Merge and Corroborate - the same page often comes back with tracking
+        # params or a different scheme, so dedupe on the canonical URL
+        seen = {canonical_url(original_url)}
         unique_results = {}
-        for r in all_results:
-            if r.url != original_url: unique_results[r.url] = r
+        for r in chain(discovery_results, deep_results):
+            key = canonical_url(r.url)
+            if key not in seen:
+                seen.add(key)
+                unique_results[key] = r
 
         sources = [{
             "url": original_url,
+            "domain": source_domain(original_url),
             "title": title,
-            "snippet": summary[:200],
+            "snippet": summary[:_SNIPPET_CHARS],
             "type": "original"
         }]
         
         for r in unique_results.values():
             sources.append({
                 "url": r.url,
+                "domain": r.source,
                 "title": r.title,
-                "snippet": r.snippet,
+                "snippet": r.snippet[:_SNIPPET_CHARS],
                 "type": "corroboration",
-                "reliability_score": self._score_reliability(r.url) 
+                "reliability_score": self._score_reliability(r.source),
             })
 
         # Facts & Prompts (Phase 2 logic continues...)
@@ -126,25 +242,58 @@ class ReporterAgent(BaseAgent):
             "historical_context": historical_context
         }
 
+    async def _search(self, query: str, num_results: int) -> list:
+        """Web search, bounded by the reporter's search concurrency."""
+        async with self._search_semaphore:
+            return await search_service.search(query, num_results=num_results)
+
+    async def _recall_similar_stories(self, task: Task, text: str) -> list:
+        """Find related past stories in memory (contextual memory retrieval)."""
+        if len(text.strip(" .")) < _MIN_SEMANTIC_TEXT_CHARS:
+            return []
+        
+        # Deferred: pulls in torch/sentence-transformers, which not every
+        # deployment of the agents package needs at import time
+        from ingestion.embeddings import embedding_service
+        
+        historical_context = []
+        try:
+            # Usually cached from the scout's dedupe check; misses encode off the event loop
+            embedding = await embedding_service.embed_async(text)
+            similar_memories = await memory_store.find_similar_stories(embedding, limit=3)
+            for memory in similar_memories:
+                if str(memory["story_id"]) != str(task.story_id):
+                    historical_context.append(memory)
+        except Exception: pass
+        return historical_context
+
+    async def _extract_and_refine_entities(self, title: str, summary: str, text: str) -> dict:
+        """Extract entities with spaCy (batched, off the event loop), then refine them with the LLM."""
+        initial_entities = []
+        if entity_batcher and len(text.strip(" .")) >= _MIN_SEMANTIC_TEXT_CHARS:
+            initial_entities = await entity_batcher.extract(text)
+        return await self._refine_entities(
+            title=title,
+            summary=summary,
+            initial_entities=initial_entities,
+        )
+
     async def _refine_entities(self, title: str, summary: str, initial_entities: list) -> dict:
         """Use LLM to refine, deduplicate and disambiguate entities."""
-        entity_text = ", ".join([f"{e.text} ({e.label_})" for e in initial_entities])
+        # Repeat mentions collapse to one, in first-seen order, so the prompt stays stable
+        entity_text = ", ".join(dict.fromkeys(f"{e.text} ({e.label_})" for e in initial_entities))
         prompt = f"""Story: {title}
 Context: {summary}
 Initial Entities identified: {entity_text}
 
 Task: Refine this list. Deduplicate, fix miscategorizations, and verify relevance.
-Return JSON: {{"people": [], "organizations": [], "locations": [], "key_events": []}}
 """
         try:
-            content = await self.chat_service.generate(
+            return await self.chat_service.generate(
                 system="You are a meticulous data journalist.",
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": prompt}],
+                json_schema=ENTITIES_SCHEMA,
             )
-            # Standard JSON extraction
-            start, end = content.find("{"), content.rfind("}") + 1
-            if start != -1 and end != -1:
-                return json.loads(content[start:end])
         except Exception: pass
         return {"people": [], "organizations": [], "locations": []}
 
@@ -157,62 +306,73 @@ Early findings: {context}
 Entities: {entities}
 
 Task: Generate 3 specific search queries to find missing details or corroboration for this story.
-Return JSON list: ["query 1", "query 2", "query 3"]
 """
         try:
-            content = await self.chat_service.generate(
+            response = await self.chat_service.generate(
                 system="You are an investigative reporter.",
-                messages=[{"role": "user", "content": prompt}]
+                messages=[{"role": "user", "content": prompt}],
+                json_schema=QUERIES_SCHEMA,
             )
-            start, end = content.find("["), content.rfind("]") + 1
-            if start != -1 and end != -1:
-                return json.loads(content[start:end])
+            return response["queries"]
         except Exception: pass
         return [f"{title} official statement", f"{title} background"]
 
-    def _score_reliability(self, url: str) -> float:
-        """Score source reliability based on domain patterns."""
-        reliability = 0.5
-        if any(d in url for d in [".gov", ".edu", "reuters.com", "apnews.com", "nytimes.com", "bbc.co.uk"]):
-            reliability = 0.9
-        elif any(d in url for d in ["twitter.com", "facebook.com", "reddit.com", "blogspot.com"]):
-            reliability = 0.3
-        return reliability
+    def _score_reliability(self, domain: str) -> float:
+        """Score source reliability based on its (normalized) domain."""
+        host = domain.partition(":")[0]
+        if _HIGH_RELIABILITY_TLD.search(host) or _in_domains(host, _HIGH_RELIABILITY_DOMAINS):
+            return 0.9
+        if _in_domains(host, _LOW_RELIABILITY_DOMAINS):
+            return 0.3
+        return 0.5
+
+    def _completion_key(self, system: str, prompt: str, max_tokens: int) -> str:
+        """_completion_cache key - a completion is only reused for the same provider and length cap."""
+        return cache_key(self.chat_service.provider, system, prompt, str(max_tokens))
 
     async def _answer_prompt(self, question: str, context: dict[str, Any]) -> str:
         """Answer a human prompt using research context."""
-        sources_text = "\n".join([
-            f"- {s.get('title', 'Untitled')}: {s.get('snippet', s.get('full_content', 'No content'))[:150]}"
-            for s in context["sources"][:5]
-        ])
-        
-        context_text = ""
-        if context.get("historical_context"):
-            context_text = "\nHistorical Context:\n" + "\n".join([
-                f"- {h['content'][:150]}..." for h in context["historical_context"][:2]
-            ])
-        
-        prompt = f"""You are a research assistant.
-Story: {context['title']}
-Context: {context['summary']}
-
-Question: {question}
-
-Sources:
-{sources_text}
-{context_text}
-
-Answer the question based on findings.
-"""
+        system = "You are a helpful research assistant."
+        prompt = ANSWER_PROMPT.render(question=question, context=context)
         try:
-            return await self.chat_service.generate(
-                system="You are a helpful research assistant.",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=300,
+            return await _completion_cache.get_or_compute(
+                self._completion_key(system, prompt, 300),
+                lambda: self.chat_service.generate(
+                    system=system,
+                    messages=[{"role": "user", "content": prompt}],
+                    max_tokens=300,
+                ),
             )
         except Exception:
             return "Unable to answer."
 
+    async def _stream_text(self, system: str, prompt: str, max_tokens: int) -> str:
+        """Generate long-form text over a streaming request.
+        
+        If the task is cancelled (e.g. by the watchdog timeout) the stream is
+        aborted mid-generation instead of running to max_tokens.
+        """
+        chunks = []
+        async for chunk in self.chat_service.stream(
+            system=system,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+        ):
+            chunks.append(chunk)
+        return "".join(chunks)
+
+    async def _cached_stream_text(self, system: str, prompt: str, max_tokens: int) -> tuple[str, bool]:
+        """_stream_text through the completion cache; also reports whether it was a cache hit."""
+        key = self._completion_key(system, prompt, max_tokens)
+        cached = _completion_cache.get(key)
+        if cached is not None:
+            return cached, True
+        text = await _completion_cache.get_or_compute(
+            key,
+            lambda: self._stream_text(system=system, prompt=prompt, max_tokens=max_tokens),
+        )
+        return text, False
+
     async def draft(self, task: Task) -> dict[str, Any]:
         """Draft an article."""
         detection_data = task.input.get("detection_data", {})
@@ -230,56 +390,37 @@ Answer the question based on findings.
         verified = research_data.get("verified", False)
         historical_context = research_data.get("historical_context", [])
         
-        # Build context string
-        context_section = ""
-        if historical_context:
-            context_section = "\nHistorical Context/Related Stories:\n" + "\n".join([
-                f"- {item['content']}" for item in historical_context
-            ])
-        
-        prompt = f"""Title: {detection_data.get('title')}
-Original Summary: {detection_data.get('summary')}
-Source URL: {detection_data.get('url')}
-
-Research Findings:
-- Verified: {verified}
-- Number of independent sources: {len(sources)}
-- People: {', '.join(entities.get('people', [])[:5]) or 'None'}
-- Orgs: {', '.join(entities.get('organizations', [])[:5]) or 'None'}
-
-Key facts:
-{chr(10).join(f"- {fact['claim']}" for fact in facts[:5])}
-
-Additional sources:
-{chr(10).join(f"- {s['title']}: {s['snippet'][:100]}..." for s in sources[1:4])}
-{context_section}
-
-Write a clear, factual news article (200-400 words).
-Include a headline and article body.
-Cite sources appropriately.
-If historical context is provided, mention it to add depth (e.g., "This follows...").
-"""
+        prompt = DRAFT_PROMPT.render(
+            detection_data=detection_data,
+            sources=sources,
+            entities=entities,
+            facts=facts,
+            verified=verified,
+            historical_context=historical_context,
+        )
         
         try:
-            article_text = await self.chat_service.generate(
+            article_text, cache_hit = await self._cached_stream_text(
                 system="You are a reporter writing a news article.",
-                messages=[{"role": "user", "content": prompt}],
+                prompt=prompt,
                 max_tokens=1000,
             )
+            word_count = len(article_text.split())
             
             await self.log_event(
                 task.story_id,
                 "draft.completed",
                 {
-                    "word_count": len(article_text.split()),
+                    "word_count": word_count,
                     "provider": self.chat_service.provider,
+                    "cache": "hit" if cache_hit else "miss",
                 },
             )
             
             return {
                 "article": article_text,
                 "headline": detection_data.get("title"),
-                "word_count": len(article_text.split()),
+                "word_count": word_count,
             }
             
         except Exception as e:
@@ -310,25 +451,27 @@ Keep the same general structure unless requested otherwise.
 """
         
         try:
-            revised_text = await self.chat_service.generate(
+            revised_text, cache_hit = await self._cached_stream_text(
                 system="You are a reporter modifying an article based on feedback.",
-                messages=[{"role": "user", "content": prompt}],
+                prompt=prompt,
                 max_tokens=1000,
             )
+            word_count = len(revised_text.split())
             
             await self.log_event(
                 task.story_id,
                 "revision.completed",
                 {
-                    "word_count": len(revised_text.split()),
+                    "word_count": word_count,
                     "provider": self.chat_service.provider,
+                    "cache": "hit" if cache_hit else "miss",
                 },
             )
             
             return {
                 "article": revised_text,
                 "headline": headline,
-                "word_count": len(revised_text.split()),
+                "word_count": word_count,
                 "is_revision": True
             }
             
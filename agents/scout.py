@@ -1,13 +1,90 @@
 """Scout agent - monitors feeds and detects newsworthy content."""
+import asyncio
+import multiprocessing
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 import feedparser
-from typing import Any
-from uuid import uuid4
+import httpx
+import numpy as np
+from typing import Any, Optional
+from uuid import UUID, uuid4
 from agents.base import BaseAgent, AgentRole
+from cache import TTLCache
 from db import Task, event_store, task_queue, TaskStage
 from config.logging import get_logger
+from config.settings import settings
 
 logger = get_logger(__name__)
 
+# spaCy label -> memory metadata key for entities saved with a story
+_MEMORY_ENTITY_KEYS = {"PERSON": "people", "ORG": "orgs", "GPE": "gpe"}
+
+# Cosine similarity above which a new entry is treated as an existing story
+_DUPLICATE_SIMILARITY = 0.85
+
+# Seconds between feed/social scan cycles
+_SCAN_INTERVAL_SECONDS = 300
+
+# The scout only keeps plain-text titles and summaries, so feedparser's HTML
+# sanitizer and relative-URI rewriting (a large share of parse time) are
+# skipped and tags are stripped from just those fields
+_parse_feed = partial(feedparser.parse, sanitize_html=False, resolve_relative_uris=False)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Entry keys the scout reads, copied out of the parsed feed
+_FEED_ENTRY_KEYS = ("id", "title", "summary", "link", "published")
+
+
+def _parse_feed_entries(content: bytes) -> list[dict[str, Any]]:
+    """Parse a feed document into plain entry dicts (runs in a worker process).
+    
+    The FeedParserDict itself isn't sent back: a malformed ("bozo") feed
+    carries the parser's exception, which can't be pickled.
+    """
+    feed = _parse_feed(content)
+    return [
+        {key: entry[key] for key in _FEED_ENTRY_KEYS if key in entry}
+        for entry in feed.entries
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class ScoutEntry:
+    """Fields of a feed entry the scout reads, looked up once.
+    
+    FeedParserDict resolves key aliases on every access, so entries are
+    converted up front rather than queried repeatedly while scoring and logging.
+    """
+    id: Optional[str]  # GUID, falling back to the link
+    title: str
+    summary: str
+    link: Optional[str]
+    published: Optional[str]
+
+    @classmethod
+    def from_feed_entry(cls, entry: Any) -> "ScoutEntry":
+        link = entry.get("link")
+        return cls(
+            id=entry.get("id") or link,
+            title=_TAG_RE.sub("", entry.get("title", "")),
+            summary=_TAG_RE.sub("", entry.get("summary", "")),
+            link=link,
+            published=entry.get("published"),
+        )
+
+
+def _closest_story(
+    vectors: np.ndarray, story_ids: list[UUID], vector: np.ndarray
+) -> Optional[dict[str, Any]]:
+    """Story whose (unit length) vector is most similar to vector, above the duplicate threshold."""
+    scores = vectors @ vector
+    best = int(np.argmax(scores))
+    if scores[best] <= _DUPLICATE_SIMILARITY:
+        return None
+    return {"story_id": story_ids[best], "similarity": float(scores[best])}
+
 
 class ScoutAgent(BaseAgent):
     """Scout agent that monitors RSS feeds for newsworthy content."""
@@ -15,6 +92,47 @@ class ScoutAgent(BaseAgent):
     def __init__(self, feeds: list[str]):
         super().__init__(AgentRole.SCOUT)
         self.feeds = feeds
+        # Entry GUIDs/links already detected - feeds repeat most entries between
+        # scans, and these skip straight past scoring, embedding and recall
+        self._seen_entries = TTLCache(
+            maxsize=settings.scout_seen_entries_size,
+            ttl=settings.scout_seen_entries_ttl_seconds,
+        )
+        self._http_client: Optional[httpx.AsyncClient] = None
+        # feedparser is pure Python and holds the GIL, so feeds parse in
+        # worker processes to run in parallel (started on first use)
+        self._parse_pool: Optional[ProcessPoolExecutor] = None
+        self._feed_validators: dict[str, dict[str, str]] = {}  # feed URL -> conditional GET headers
+        # Validators of downloads not yet scanned, kept only once the scan succeeds
+        self._pending_validators: dict[str, dict[str, str]] = {}
+        # Ring buffer of recently saved story embeddings (unit length), checked
+        # with one matrix-vector product before asking the vector index
+        self._recent_vectors: Optional[np.ndarray] = None
+        self._recent_story_ids: list[UUID] = []
+        self._recent_next = 0
+
+    def _match_recent_story(self, vector: np.ndarray) -> Optional[dict[str, Any]]:
+        """Most similar recently saved story above the duplicate threshold, if any."""
+        if not self._recent_story_ids or len(vector) != self._recent_vectors.shape[1]:
+            return None
+        return _closest_story(
+            self._recent_vectors[:len(self._recent_story_ids)], self._recent_story_ids, vector
+        )
+
+    def _remember_story(self, story_id: UUID, vector: np.ndarray) -> None:
+        """Add a newly saved story to the recent-embedding ring buffer."""
+        size = settings.scout_recent_story_cache_size
+        if self._recent_vectors is None or self._recent_vectors.shape[1] != len(vector):
+            self._recent_vectors = np.zeros((size, len(vector)), dtype=np.float32)
+            self._recent_story_ids = []
+            self._recent_next = 0
+        
+        self._recent_vectors[self._recent_next] = vector
+        if len(self._recent_story_ids) < size:
+            self._recent_story_ids.append(story_id)
+        else:
+            self._recent_story_ids[self._recent_next] = story_id
+        self._recent_next = (self._recent_next + 1) % size
 
     async def handle_task(self, task: Task) -> dict[str, Any]:
         """
@@ -23,12 +141,12 @@ class ScoutAgent(BaseAgent):
         """
         return {"status": "scout_task_not_applicable"}
 
-    def calculate_newsworthiness(self, entry: dict) -> float:
+    def calculate_newsworthiness(self, entry: ScoutEntry) -> float:
         """Calculate newsworthiness score for a feed entry."""
         score = 0.0
         
         # Has title and description
-        if entry.get("title") and entry.get("summary"):
+        if entry.summary and entry.title:
             score += 0.3
         
         # Recent (less than 24 hours old)
@@ -36,12 +154,11 @@ class ScoutAgent(BaseAgent):
         score += 0.2
         
         # Has links/sources
-        if entry.get("link"):
+        if entry.link:
             score += 0.2
         
         # Length indicates substance
-        summary = entry.get("summary", "")
-        if len(summary) > 200:
+        if len(entry.summary) > 200:
             score += 0.2
         
         # TODO: Add semantic novelty check against existing stories
@@ -50,38 +167,175 @@ class ScoutAgent(BaseAgent):
         
         return min(score, 1.0)
 
-    async def scan_feed(self, feed_url: str) -> None:
-        """Scan a single RSS feed for newsworthy content."""
+    def _http(self) -> httpx.AsyncClient:
+        """Shared keep-alive client for feed downloads, built on first use."""
+        if self._http_client is None:
+            # HTTP/2 where the server offers it; idle connections outlive the
+            # scan interval so the next cycle skips the TCP/TLS handshake
+            # (httpx already requests gzip-encoded responses)
+            self._http_client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=settings.scout_feed_max_connections,
+                    max_keepalive_connections=settings.scout_feed_max_connections // 2,
+                    keepalive_expiry=_SCAN_INTERVAL_SECONDS + 60,
+                ),
+                follow_redirects=True,
+                timeout=httpx.Timeout(20.0, connect=5.0),
+                headers={"User-Agent": feedparser.USER_AGENT},
+            )
+        return self._http_client
+
+    def _feed_parse_pool(self) -> ProcessPoolExecutor:
+        """Worker processes for parsing feed documents, built on first use."""
+        if self._parse_pool is None:
+            # Workers are started fresh rather than forked from this process,
+            # whose threads (HTTP, spaCy, embeddings) may hold locks mid-fork
+            methods = multiprocessing.get_all_start_methods()
+            self._parse_pool = ProcessPoolExecutor(
+                max_workers=settings.scout_feed_parse_processes,
+                mp_context=multiprocessing.get_context(
+                    "forkserver" if "forkserver" in methods else "spawn"
+                ),
+            )
+        return self._parse_pool
+
+    async def _fetch_feed(self, feed_url: str) -> Optional[list[dict[str, Any]]]:
+        """
+        Download a feed without blocking the event loop, then parse its entries in a worker process.
+        
+        Sends the ETag/Last-Modified from the previous download, so an
+        unchanged feed costs a 304 and no parse; returns None in that case.
+        """
+        response = await self._http().get(feed_url, headers=self._feed_validators.get(feed_url))
+        if response.status_code == 304:
+            return None
+        response.raise_for_status()
+        
+        entries = await asyncio.get_running_loop().run_in_executor(
+            self._feed_parse_pool(), _parse_feed_entries, response.content
+        )
+        
+        validators = {}
+        if "etag" in response.headers:
+            validators["If-None-Match"] = response.headers["etag"]
+        if "last-modified" in response.headers:
+            validators["If-Modified-Since"] = response.headers["last-modified"]
+        self._pending_validators[feed_url] = validators
+        return entries
+
+    def _save_feed_validators(self, feed_url: str) -> None:
+        """Replay a feed's latest validators now its entries have been scanned.
+        
+        Until then a failed parse or scan must not let the next download
+        come back 304 and skip those entries for good.
+        """
+        validators = self._pending_validators.pop(feed_url, None)
+        if validators is not None:
+            self._feed_validators[feed_url] = validators
+
+    async def _entity_metadata(self, entity_batcher: Any, texts: list[str]) -> list[dict[str, list[str]]]:
+        """Entity metadata for each text, extracted together in one spaCy batch.
+        
+        Requests are queued on the batcher concurrently, so its worker thread
+        runs them through a single nlp.pipe call.
+        """
+        if not entity_batcher:
+            return [{} for _ in texts]
+        try:
+            extracted = await asyncio.gather(*(entity_batcher.extract(text) for text in texts))
+        except Exception as e:
+            logger.warning("Entity extraction failed", error=str(e))
+            return [{} for _ in texts]
+        
+        metadata = []
+        for entities in extracted:
+            # dict buckets dedupe repeat mentions but keep first-seen order
+            buckets = {key: {} for key in _MEMORY_ENTITY_KEYS.values()}
+            for e in entities:
+                key = _MEMORY_ENTITY_KEYS.get(e.label_)
+                if key:
+                    buckets[key][e.text] = None
+            metadata.append({key: list(names) for key, names in buckets.items()})
+        return metadata
+
+    async def scan_feed(self, feed_url: str, entries: Optional[list[dict[str, Any]]] = None) -> None:
+        """Scan a single RSS feed for newsworthy content (fetching its entries unless given)."""
         logger.info("Scanning feed", feed_url=feed_url)
         
         # Import services here to avoid circular imports if any
         from ingestion.embeddings import embedding_service
-        from ingestion import entity_extractor
+        from ingestion import entity_batcher
         from db.memory import memory_store
         
         try:
-            feed = feedparser.parse(feed_url)
+            if entries is None:
+                entries = await self._fetch_feed(feed_url)
+                if entries is None:
+                    return  # Not modified since the last scan
             
-            for entry in feed.entries[:10]:  # Limit to recent 10 entries
+            candidates = []
+            for feed_entry in entries[:10]:  # Limit to recent 10 entries
+                entry = ScoutEntry.from_feed_entry(feed_entry)
+                if entry.id and self._seen_entries.get(entry.id):
+                    continue
+                
                 score = self.calculate_newsworthiness(entry)
                 
                 if score < 0.6:
                     continue
                 
-                title = entry.get("title", "")
-                summary = entry.get("summary", "")[:500]
-                content_for_embedding = f"{title}. {summary}"
-                
-                # Check for duplicates using embeddings
-                try:
-                    embedding = embedding_service.embed(content_for_embedding)
-                    similar_stories = await memory_store.find_similar_stories(
-                        embedding, threshold=0.85, limit=1
-                    )
-                except Exception as e:
-                    logger.error("Embedding generation failed", error=str(e))
-                    embedding = []
-                    similar_stories = []
+                title = entry.title
+                summary = entry.summary[:500]
+                candidates.append((entry, score, title, summary, f"{title}. {summary}"))
+            
+            if not candidates:
+                self._save_feed_validators(feed_url)
+                return
+            
+            # Embed every candidate in one batched forward pass (cached texts skip
+            # the model) while spaCy tags them all in one nlp.pipe batch
+            contents = [content for *_, content in candidates]
+            embeddings, entity_meta = await asyncio.gather(
+                embedding_service.embed_batch_async(contents),
+                self._entity_metadata(entity_batcher, contents),
+                return_exceptions=True,
+            )
+            if isinstance(embeddings, BaseException):
+                logger.error("Embedding generation failed", error=str(embeddings))
+                embeddings = [[] for _ in candidates]
+            # float32 like the ring buffer, converted once per scan, so the
+            # in-process duplicate check never upcasts to a float64 product
+            vectors = [np.asarray(embedding, dtype=np.float32) for embedding in embeddings]
+            
+            detections = []  # (story_id, event data), written together after the loop
+            new_stories = []  # (story_id, memory kwargs, vector), saved once detections are written
+            for (entry, score, title, summary, content_for_embedding), embedding, vector, entities_meta in zip(
+                candidates, embeddings, vectors, entity_meta
+            ):
+                # Check for duplicates using embeddings. Done per entry against
+                # new stories earlier in this scan too, so repeats within one
+                # feed still match.
+                similar_stories = []
+                if embedding:
+                    # Stories from recent scans are matched in-process; only
+                    # misses pay for a vector index query
+                    recent = self._match_recent_story(vector)
+                    if not recent and new_stories:
+                        recent = _closest_story(
+                            np.stack([v for *_, v in new_stories]),
+                            [story_id for story_id, *_ in new_stories],
+                            vector,
+                        )
+                    if recent:
+                        similar_stories = [recent]
+                    else:
+                        try:
+                            similar_stories = await memory_store.find_similar_stories(
+                                embedding, threshold=_DUPLICATE_SIMILARITY, limit=1
+                            )
+                        except Exception as e:
+                            logger.error("Similar story lookup failed", error=str(e))
                 
                 if similar_stories:
                     # Duplicate found - link to existing story
@@ -99,47 +353,28 @@ class ScoutAgent(BaseAgent):
                     story_id = uuid4()
                     is_duplicate = False
                 
-                # Log detection event
-                await self.log_event(
-                    story_id,
-                    "story.detected",
-                    {
-                        "source": feed_url,
-                        "title": title,
-                        "url": entry.get("link"),
-                        "summary": summary,
-                        "score": score,
-                        "published": entry.get("published"),
-                        "is_duplicate": is_duplicate,
-                    },
-                )
+                detections.append((story_id, {
+                    "source": feed_url,
+                    "title": title,
+                    "url": entry.link,
+                    "summary": summary,
+                    "score": score,
+                    "published": entry.published,
+                    "is_duplicate": is_duplicate,
+                }))
                 
                 # If new, save to memory for future deduplication
                 if not is_duplicate and embedding:
-                    # Extract entities for metadata
-                    entities_meta = {}
-                    if entity_extractor:
-                        try:
-                            extracted = entity_extractor.extract(f"{title}. {summary}")
-                            entities_meta = {
-                                "people": [e.text for e in extracted if e.label_ == "PERSON"],
-                                "orgs": [e.text for e in extracted if e.label_ == "ORG"],
-                                "gpe": [e.text for e in extracted if e.label_ == "GPE"],
-                            }
-                        except Exception as e:
-                            logger.warning("Entity extraction failed", error=str(e))
-
-                    await memory_store.add(
-                        story_id=story_id,
-                        content=content_for_embedding,
-                        embedding=embedding,
-                        memory_type="summary",
-                        metadata={
+                    new_stories.append((story_id, {
+                        "content": content_for_embedding,
+                        "embedding": embedding,
+                        "memory_type": "summary",
+                        "metadata": {
                             "source": feed_url, 
-                            "url": entry.get("link"),
+                            "url": entry.link,
                             "entities": entities_meta
-                        }
-                    )
+                        },
+                    }, vector))
                 
                 if not is_duplicate:
                     logger.info(
@@ -148,8 +383,23 @@ class ScoutAgent(BaseAgent):
                         title=title,
                         score=score,
                     )
+            
+            # Submitted together, the appender writes every detection in one INSERT
+            await asyncio.gather(*(
+                self.log_event(story_id, "story.detected", data)
+                for story_id, data in detections
+            ))
+            # Only stories whose detection was written become dedupe targets
+            for story_id, memory, vector in new_stories:
+                await memory_store.add(story_id=story_id, **memory)
+                self._remember_story(story_id, vector)
+            for entry, *_ in candidates:
+                if entry.id:
+                    self._seen_entries.set(entry.id, True)
+            self._save_feed_validators(feed_url)
                 
         except Exception as e:
+            self._pending_validators.pop(feed_url, None)
             logger.error("Feed scan failed", feed_url=feed_url, error=str(e))
 
     async def scan_bluesky(self) -> None:
@@ -163,15 +413,17 @@ class ScoutAgent(BaseAgent):
         # Search for broad news signals
         signals = await bluesky_monitor.get_trending_signals(limit=10)
         
+        detections = []
         for signal in signals:
             # Reformat signal to look like a feed entry for calculate_newsworthiness
             # This allows us to reuse the same scoring logic
-            entry = {
-                "title": signal["text"][:100],
-                "summary": signal["text"],
-                "link": signal["uri"],
-                "published": signal["created_at"]
-            }
+            entry = ScoutEntry(
+                id=signal["uri"],
+                title=signal["text"][:100],
+                summary=signal["text"],
+                link=signal["uri"],
+                published=signal["created_at"],
+            )
             
             score = self.calculate_newsworthiness(entry)
             
@@ -180,25 +432,28 @@ class ScoutAgent(BaseAgent):
                 continue
                 
             # Log as a detection
-            await self.log_event(
+            detections.append(self.log_event(
                 uuid4(),
                 "story.detected",
                 {
                     "source": "bluesky",
-                    "title": entry["title"],
-                    "url": entry["link"],
-                    "summary": entry["summary"],
+                    "title": entry.title,
+                    "url": entry.link,
+                    "summary": entry.summary,
                     "score": score,
                     "author": signal["author"],
                     "is_duplicate": False, # Simplified for social MVP
                 },
-            )
+            ))
             
             logger.info(
                 "Bluesky signal detected",
                 author=signal["author"],
                 score=score,
             )
+        
+        # Submitted together, the appender writes every detection in one INSERT
+        await asyncio.gather(*detections)
 
     async def run(self) -> None:
         """Override run to proactively scan feeds and social."""
@@ -207,19 +462,56 @@ class ScoutAgent(BaseAgent):
         
         logger.info(
             "Scout started",
-            agent_id=str(self.agent_id),
+            agent_id=self._agent_id_str,
             feed_count=len(self.feeds),
         )
         
+        # Heartbeats run on their own cadence so a long scan can't starve them
+        heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+        try:
+            await self._scan_loop()
+        finally:
+            heartbeat_task.cancel()
+            await asyncio.gather(heartbeat_task, return_exceptions=True)
+
+    async def _heartbeat_loop(self) -> None:
+        """Refresh the agent row every heartbeat interval while running."""
+        while self._running:
+            await asyncio.sleep(settings.agent_heartbeat_interval_seconds)
+            try:
+                await self.heartbeat()
+            except Exception as e:
+                logger.warning("Scout heartbeat failed", agent_id=self._agent_id_str, error=str(e))
+
+    async def _scan_loop(self) -> None:
+        """Scan every feed and social source, then wait for the next cycle."""
         while self._running:
-            # Scan RSS feeds
-            for feed_url in self.feeds:
-                await self.scan_feed(feed_url)
+            # Download every RSS feed concurrently, then scan them in order so a
+            # story carried by two feeds is still matched against the first
+            feeds = await asyncio.gather(
+                *(self._fetch_feed(feed_url) for feed_url in self.feeds),
+                return_exceptions=True,
+            )
+            for feed_url, entries in zip(self.feeds, feeds):
+                if isinstance(entries, BaseException):
+                    logger.error("Feed fetch failed", feed_url=feed_url, error=str(entries))
+                    continue
+                if entries is None:
+                    continue  # Not modified since the last scan
+                await self.scan_feed(feed_url, entries)
             
             # Scan Social (Bluesky)
             await self.scan_bluesky()
             
             # Wait before next scan
-            import asyncio
-            await asyncio.sleep(300)  # Scan every 5 minutes
-            await self.heartbeat()
+            await asyncio.sleep(_SCAN_INTERVAL_SECONDS)
+
+    async def stop(self) -> None:
+        """Stop the scout and release its feed HTTP client and parser processes."""
+        await super().stop()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
@@ -1,7 +1,9 @@
 """FastAPI application for News Town API."""
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from db.connection import db
 from publishing.scheduler import scheduler
 from api.publishing import router as publishing_router
@@ -9,11 +11,23 @@ from api.governance import router as governance_router
 from api.dashboard import router as dashboard_router
 from api.auth_routes import router as auth_router
 from db.users import user_store
+from db.governance import article_review_store
 from config.logging import get_logger
+from config.settings import settings
 
 logger = get_logger(__name__)
 
 
+async def refresh_review_rollup() -> None:
+    """Periodically refresh the daily review rollup behind the quality dashboard."""
+    while True:
+        try:
+            await article_review_store.refresh_daily_rollup()
+        except Exception as e:
+            logger.error("Review rollup refresh failed", error=str(e))
+        await asyncio.sleep(settings.review_rollup_refresh_seconds)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events."""
@@ -32,11 +46,16 @@ async def lifespan(app: FastAPI):
     await scheduler.start()
     logger.info("Publishing scheduler started")
     
+    rollup_task = asyncio.create_task(refresh_review_rollup())
+    
     yield
     
     # Shutdown
     logger.info("Shutting down News Town API")
     
+    rollup_task.cancel()
+    await asyncio.gather(rollup_task, return_exceptions=True)
+    
     # Stop scheduler
     await scheduler.stop()
     
@@ -51,16 +70,20 @@ app = FastAPI(
     description="Multi-agent news reporting system",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson renders JSON bodies several times faster
 )
 
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # Configure appropriately for production
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS only for configured cross-origin clients - without any, every request
+# skips the middleware entirely
+if settings.cors_origins:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.cors_origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        max_age=86400,  # Browsers cache preflights for a day
+    )
 
 # Include routers
 app.include_router(dashboard_router, prefix="/dashboard", tags=["dashboard"])
@@ -79,7 +102,7 @@ async def root():
     }
 
 
-@app.get("/health")
+@app.get("/health", include_in_schema=False)
 async def health():
     """Health check endpoint."""
     return {"status": "healthy"}
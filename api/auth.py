@@ -1,8 +1,10 @@
 """Authentication utilities for News Town."""
+import time
 from datetime import datetime, timedelta
 from typing import Optional, Union, Any
-from jose import jwt
+from jose import jwk, jwt
 from passlib.context import CryptContext
+from cache import TTLCache
 from config.settings import settings
 
 # Password hashing configuration
@@ -13,6 +15,14 @@ SECRET_KEY = settings.anthropic_api_key[:32] # Use a part of the API key as a se
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 # 24 hours
 
+# HMAC key built once - given the raw secret, jose re-parses and re-wraps it
+# on every encode/decode
+_SIGNING_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
+
+# Verified token payloads, so repeat requests with the same cookie skip the
+# HMAC check and JSON decode. Entries never outlive the token's own expiry.
+_token_cache = TTLCache(maxsize=4096, ttl=300)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hash."""
     return pwd_context.verify(plain_password, hashed_password)
@@ -29,13 +39,19 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 def decode_access_token(token: str) -> Optional[dict]:
     """Decode and verify a JWT access token."""
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    payload = _token_cache.get(token)
+    if payload is not None:
         return payload
+    try:
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=[ALGORITHM])
     except Exception:
         return None
+    remaining = payload.get("exp", 0) - time.time()
+    if remaining > 0:
+        _token_cache.set(token, payload, ttl=min(remaining, _token_cache.ttl))
+    return payload
@@ -1,4 +1,5 @@
 """Login and authentication routes."""
+import asyncio
 from fastapi import APIRouter, Request, Depends, HTTPException, status, Response
 from fastapi.responses import RedirectResponse, HTMLResponse
 from fastapi.templating import Jinja2Templates
@@ -22,7 +23,10 @@ async def login(
 ):
     """Handle login and set token in a cookie."""
     user = await user_store.get_user_by_username(form_data.username)
-    if not user or not verify_password(form_data.password, user["password_hash"]):
+    # Key stretching is deliberately CPU-heavy; keep it off the event loop
+    if not user or not await asyncio.to_thread(
+        verify_password, form_data.password, user["password_hash"]
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
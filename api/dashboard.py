@@ -1,62 +1,151 @@
 """Dashboard routes for News Town monitoring."""
+import asyncio
+import time
+from decimal import Decimal
+import orjson
+from asyncpg import Record
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
-from typing import Dict, Any
+from typing import Dict, Any, Awaitable, Callable, Hashable, List
 from datetime import datetime, timedelta
+from uuid import UUID
 from api.auth_routes import get_current_user
 from fastapi import Depends
+from cache import TTLCache
 from db.connection import db
+from config.logging import get_logger
+
+logger = get_logger(__name__)
 
 router = APIRouter()
 templates = Jinja2Templates(directory="templates")
 
+# Dashboard payloads are global rather than per-user, so every open (auto-
+# refreshing) dashboard shares one aggregation per endpoint per TTL window
+_response_cache = TTLCache(maxsize=64, ttl=10)
+# Last good payload per endpoint, served if a refresh fails
+_stale_responses = TTLCache(maxsize=64, ttl=3600)
+
+# Per-endpoint (min, max) freshness in seconds. Within that range a payload
+# stays fresh for _TTL_PER_GENERATION_SECOND times as long as it took to
+# build, so slow aggregations are recomputed less often than cheap ones.
+_TTL_POLICIES = {
+    "stats": (5, 30),
+    "quality": (30, 120),
+    "performance": (10, 60),
+    "stories": (5, 30),
+}
+_TTL_PER_GENERATION_SECOND = 10
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for the asyncpg values it can't encode natively."""
+    if isinstance(obj, Record):
+        return dict(obj)
+    if isinstance(obj, UUID):
+        return str(obj)  # asyncpg's UUID subclass, which orjson doesn't take
+    if isinstance(obj, Decimal):
+        # Same as FastAPI's encoder: integral values stay ints
+        return int(obj) if obj.as_tuple().exponent >= 0 else float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class RecordJSONResponse(ORJSONResponse):
+    """orjson response that serializes asyncpg Records as JSON objects.
+    
+    Returning a Response skips FastAPI's jsonable_encoder, which otherwise
+    walks the whole payload in Python (copying every row into a new dict and
+    converting each datetime/UUID) before orjson sees it.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_json_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+async def _cached(key: Hashable, policy: str, compute: Callable[[], Awaitable[Any]]) -> Any:
+    """Serve a dashboard payload from cache, falling back to the last good one on error."""
+    min_ttl, max_ttl = _TTL_POLICIES[policy]
+    generation_seconds = None
+    
+    async def timed_compute() -> Any:
+        nonlocal generation_seconds
+        started = time.perf_counter()
+        payload = await compute()
+        generation_seconds = time.perf_counter() - started
+        return payload
+    
+    try:
+        payload = await _response_cache.get_or_compute(key, timed_compute, ttl=min_ttl)
+    except Exception as e:
+        stale = _stale_responses.get(key)
+        if stale is None:
+            raise
+        logger.warning("Dashboard query failed, serving stale data", key=str(key), error=str(e))
+        return stale
+    if generation_seconds is not None:
+        # This call built the payload - stretch its lifetime to match the cost
+        ttl = min(max(generation_seconds * _TTL_PER_GENERATION_SECOND, min_ttl), max_ttl)
+        _response_cache.set(key, payload, ttl)
+    _stale_responses.set(key, payload)
+    return payload
+
 
 async def get_dashboard_stats() -> Dict[str, Any]:
     """Gather all dashboard statistics."""
     
-    async with db.acquire() as conn:
-        # Article stats
-        total_articles = await conn.fetchval("SELECT COUNT(*) FROM articles")
-        articles_today = await conn.fetchval(
-            "SELECT COUNT(*) FROM articles WHERE published_at > NOW() - INTERVAL '24 hours'"
-        )
-        
-        # Story stats  
-        total_stories = await conn.fetchval("SELECT COUNT(DISTINCT story_id) FROM story_events")
-        active_pipelines = await conn.fetchval(
-            "SELECT COUNT(DISTINCT story_id) FROM story_tasks WHERE status IN ('pending', 'active')"
-        )
-        
-        # Publication stats
-        total_publications = await conn.fetchval("SELECT COUNT(*) FROM publications WHERE status = 'published'")
-        rss_pubs = await conn.fetchval("SELECT COUNT(*) FROM publications WHERE channel = 'rss' AND status = 'published'")
-        
-        # Governance stats
-        pending_approvals = await conn.fetchval("SELECT COUNT(*) FROM approval_requests WHERE status = 'pending'")
-        
+    # The four queries are independent, so each takes its own pooled
+    # connection and they run concurrently
+    counts, recent_articles, recent_activity, agent_activity = await asyncio.gather(
+        # Every counter in one round-trip; tables feeding several counters are
+        # scanned once, with FILTER splitting the counts
+        db.fetchrow(
+            """
+            SELECT
+                a.total_articles, a.articles_today,
+                (SELECT COUNT(DISTINCT story_id) FROM story_events) AS total_stories,
+                (SELECT COUNT(DISTINCT story_id) FROM story_tasks
+                 WHERE status IN ('pending', 'active')) AS active_pipelines,
+                p.total_publications, p.rss_publications,
+                (SELECT COUNT(*) FROM approval_requests WHERE status = 'pending') AS pending_approvals,
+                r.avg_score, r.avg_verification, r.avg_style
+            FROM
+                (SELECT COUNT(*) AS total_articles,
+                        COUNT(*) FILTER (WHERE published_at > NOW() - INTERVAL '24 hours') AS articles_today
+                 FROM articles) a,
+                (SELECT COUNT(*) AS total_publications,
+                        COUNT(*) FILTER (WHERE channel = 'rss') AS rss_publications
+                 FROM publications WHERE status = 'published') p,
+                (SELECT AVG(score) AS avg_score,
+                        AVG(verification_score) AS avg_verification,
+                        AVG(style_score) AS avg_style
+                 FROM article_reviews) r
+            """
+        ),
         # Recent articles
-        recent_articles = await conn.fetch(
+        db.fetch(
             """
             SELECT id, headline, byline, published_at
             FROM articles
             ORDER BY published_at DESC
             LIMIT 10
             """
-        )
-        
+        ),
         # Recent activity (from audit log)
-        recent_activity = await conn.fetch(
+        db.fetch(
             """
             SELECT event_type, severity, timestamp, details
             FROM audit_log
             ORDER BY timestamp DESC
             LIMIT 20
             """
-        )
-        
+        ),
         # Agent activity
-        agent_activity = await conn.fetch(
+        db.fetch(
             """
             SELECT agent_id, event_type, created_at as occurred_at
             FROM story_events
@@ -64,83 +153,89 @@ async def get_dashboard_stats() -> Dict[str, Any]:
             ORDER BY created_at DESC
             LIMIT 50
             """
-        )
-
-        # Quality stats overview
-        avg_score = await conn.fetchval("SELECT AVG(score) FROM article_reviews")
-        avg_v_score = await conn.fetchval("SELECT AVG(verification_score) FROM article_reviews")
-        avg_s_score = await conn.fetchval("SELECT AVG(style_score) FROM article_reviews")
+        ),
+    )
     
     return {
         "stats": {
-            "total_articles": total_articles or 0,
-            "articles_today": articles_today or 0,
-            "total_stories": total_stories or 0,
-            "active_pipelines": active_pipelines or 0,
-            "total_publications": total_publications or 0,
-            "rss_publications": rss_pubs or 0,
-            "pending_approvals": pending_approvals or 0,
-            "avg_quality_score": round(avg_score or 0, 2),
-            "avg_verification": round(avg_v_score or 0, 2),
-            "avg_style": round(avg_s_score or 0, 2),
+            "total_articles": counts["total_articles"] or 0,
+            "articles_today": counts["articles_today"] or 0,
+            "total_stories": counts["total_stories"] or 0,
+            "active_pipelines": counts["active_pipelines"] or 0,
+            "total_publications": counts["total_publications"] or 0,
+            "rss_publications": counts["rss_publications"] or 0,
+            "pending_approvals": counts["pending_approvals"] or 0,
+            "avg_quality_score": round(counts["avg_score"] or 0, 2),
+            "avg_verification": round(counts["avg_verification"] or 0, 2),
+            "avg_style": round(counts["avg_style"] or 0, 2),
         },
-        "recent_articles": [dict(row) for row in recent_articles] if recent_articles else [],
-        "recent_activity": [dict(row) for row in recent_activity] if recent_activity else [],
-        "agent_activity": [dict(row) for row in agent_activity] if agent_activity else [],
+        # Rows stay asyncpg Records; RecordJSONResponse encodes them directly
+        "recent_articles": recent_articles,
+        "recent_activity": recent_activity,
+        "agent_activity": agent_activity,
         "last_updated": datetime.now().isoformat(),
     }
 
 
 async def get_extended_quality_stats() -> Dict[str, Any]:
     """Gather detailed newsroom quality analytics."""
-    async with db.acquire() as conn:
+    # Review figures come from the article_reviews_daily rollup (one row per
+    # day, refreshed every few minutes) rather than scanning every review
+    counts, trends = await asyncio.gather(
         # Common violations (we store them in JSON metadata)
         # We'll need to parse this if we want specific counts, 
-        # but for now let's get rejection rate
-        total_reviews = await conn.fetchval("SELECT COUNT(*) FROM article_reviews")
-        rejected_reviews = await conn.fetchval("SELECT COUNT(*) FROM article_reviews WHERE decision = 'REJECT'")
-        rejection_rate = (rejected_reviews / total_reviews * 100) if total_reviews > 0 else 0
-
-        # Revision throughput
-        # Average number of revisions for completed stories
-        avg_revisions = await conn.fetchval("""
-            SELECT AVG(rev_count) FROM (
-                SELECT story_id, COUNT(*) as rev_count 
-                FROM story_tasks 
-                WHERE stage = 'edit' 
-                GROUP BY story_id
-            ) sub
-        """)
-
-        # Quality trends (last 7 days)
-        trends = await conn.fetch("""
-            SELECT 
-                DATE_TRUNC('day', created_at) as day,
-                AVG(score) as avg_score,
-                COUNT(*) as volume
-            FROM article_reviews
-            WHERE created_at > NOW() - INTERVAL '7 days'
-            GROUP BY day
+        # but for now let's get rejection rate.
+        # Revision throughput: average number of revisions for completed stories.
+        # Both come back in one round-trip.
+        db.fetchrow("""
+            SELECT
+                r.total_reviews, r.rejected_reviews,
+                (SELECT AVG(rev_count) FROM (
+                    SELECT story_id, COUNT(*) as rev_count 
+                    FROM story_tasks 
+                    WHERE stage = 'edit' 
+                    GROUP BY story_id
+                ) sub) AS avg_revisions
+            FROM (
+                SELECT COALESCE(SUM(volume), 0)::BIGINT AS total_reviews,
+                       COALESCE(SUM(rejected), 0)::BIGINT AS rejected_reviews
+                FROM article_reviews_daily
+            ) r
+        """),
+        # Quality trends (last 7 days), fetched concurrently on another connection
+        db.fetch("""
+            SELECT day, avg_score, volume
+            FROM article_reviews_daily
+            WHERE day >= DATE_TRUNC('day', NOW() - INTERVAL '7 days')
             ORDER BY day ASC
-        """)
+        """),
+    )
+    total_reviews = counts["total_reviews"]
+    rejection_rate = (counts["rejected_reviews"] / total_reviews * 100) if total_reviews > 0 else 0
+    avg_revisions = counts["avg_revisions"]
 
     return {
         "rejection_rate": round(rejection_rate, 1),
         "total_reviews": total_reviews,
         "avg_revisions": round(avg_revisions or 0, 1),
-        "trends": [dict(row) for row in trends]
+        "trends": trends
     }
 
 
 @router.get("/api/quality")
 async def quality_metrics(user: dict = Depends(get_current_user)):
     """API endpoint for detailed quality analytics."""
-    return await get_extended_quality_stats()
+    return RecordJSONResponse(await _cached("quality", "quality", get_extended_quality_stats))
 
 
 @router.get("/api/performance")
 async def performance_metrics(user: dict = Depends(get_current_user)):
     """API endpoint for agent performance tracking."""
+    return RecordJSONResponse(await _cached("performance", "performance", _get_performance_stats))
+
+
+async def _get_performance_stats() -> List[Record]:
+    """Task successes and failures per agent role."""
     # Simplified performance metric: success vs failure in tasks
     rows = await db.fetch("""
         SELECT 
@@ -151,13 +246,13 @@ async def performance_metrics(user: dict = Depends(get_current_user)):
         JOIN story_tasks t ON t.assigned_agent = a.id
         GROUP BY role
     """)
-    return [dict(row) for row in rows]
+    return rows
 
 
 @router.get("/", response_class=HTMLResponse)
 async def dashboard(request: Request, user: dict = Depends(get_current_user)):
     """Render main dashboard page."""
-    stats = await get_dashboard_stats()
+    stats = await _cached("stats", "stats", get_dashboard_stats)
     return templates.TemplateResponse(
         "dashboard_v2.html",
         {"request": request, "user": user, **stats}
@@ -167,24 +262,48 @@ async def dashboard(request: Request, user: dict = Depends(get_current_user)):
 @router.get("/api/stats")
 async def live_stats(user: dict = Depends(get_current_user)):
     """API endpoint for live stats."""
-    return await get_dashboard_stats()
+    return RecordJSONResponse(await _cached("stats", "stats", get_dashboard_stats))
 
 
 @router.get("/api/stories")
 async def list_stories(limit: int = 50, user: dict = Depends(get_current_user)):
     """Get active story pipelines."""
+    return RecordJSONResponse(
+        await _cached(("stories", limit), "stories", lambda: _get_story_pipelines(limit))
+    )
+
+
+async def _get_story_pipelines(limit: int) -> List[Record]:
+    """Most recently active stories with their current stage."""
+    # One GROUP BY pass picks the most recently active stories; only those
+    # rows then look up their title and latest task (stage and status together)
     rows = await db.fetch("""
         SELECT 
             s.id,
-            (SELECT data->>'title' FROM story_events WHERE story_id = s.id AND event_type = 'story.detected' LIMIT 1) as title,
-            (SELECT MAX(created_at) FROM story_events WHERE story_id = s.id) as last_activity,
-            (SELECT stage FROM story_tasks WHERE story_id = s.id ORDER BY created_at DESC LIMIT 1) as current_stage,
-            (SELECT status FROM story_tasks WHERE story_id = s.id ORDER BY created_at DESC LIMIT 1) as status
-        FROM (SELECT DISTINCT story_id as id FROM story_events) s
-        ORDER BY last_activity DESC
-        LIMIT $1
+            d.title,
+            s.last_activity,
+            t.stage as current_stage,
+            t.status
+        FROM (
+            SELECT story_id as id, MAX(created_at) as last_activity
+            FROM story_events
+            GROUP BY story_id
+            ORDER BY last_activity DESC
+            LIMIT $1
+        ) s
+        LEFT JOIN LATERAL (
+            SELECT data->>'title' as title FROM story_events
+            WHERE story_id = s.id AND event_type = 'story.detected'
+            ORDER BY id LIMIT 1
+        ) d ON true
+        LEFT JOIN LATERAL (
+            SELECT stage, status FROM story_tasks
+            WHERE story_id = s.id
+            ORDER BY created_at DESC LIMIT 1
+        ) t ON true
+        ORDER BY s.last_activity DESC
     """, limit)
-    return [dict(row) for row in rows]
+    return rows
 
 
 @router.get("/api/prompts")
@@ -217,4 +336,4 @@ async def list_sources(story_id: str = None, user: dict = Depends(get_current_us
         return sources
     else:
         rows = await db.fetch("SELECT * FROM story_sources ORDER BY added_at DESC LIMIT 50")
-        return [dict(row) for row in rows]
+        return RecordJSONResponse(rows)
@@ -0,0 +1,109 @@
+"""In-process caching utilities."""
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+__all__ = ["TTLCache", "cache_key"]
+
+_MISSING = object()
+
+
+def cache_key(*parts: str) -> str:
+    """Build a compact, stable cache key from one or more strings."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")  # Separator so ("ab", "c") != ("a", "bc")
+    return digest.hexdigest()
+
+
+class TTLCache:
+    """
+    Bounded LRU cache with per-entry expiry.
+    
+    get_or_compute() also coalesces concurrent misses: callers asking for a
+    key that is already being computed await the same result instead of
+    issuing a duplicate (e.g. LLM or search) request. Failures are never cached.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 3600):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a cached value, or default if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return default
+        
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Drop a single entry, if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._data.clear()
+
+    async def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+    ) -> Any:
+        """Return the cached value for key, computing it at most once on a miss.
+        
+        A computed value is stored for ttl seconds (the cache default if None).
+        If the caller computing the value is cancelled, waiters retry rather
+        than inherit the cancellation.
+        """
+        while True:
+            value = self.get(key, _MISSING)
+            if value is not _MISSING:
+                return value
+            
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            value = await asyncio.shield(pending)
+            if value is not _MISSING:
+                return value
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.set_result(_MISSING)  # Wake waiters to retry the miss
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved - waiters (if any) re-raise it
+            raise
+        else:
+            self.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
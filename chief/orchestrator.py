@@ -1,6 +1,7 @@
 """Chief agent - central orchestrator for News Town."""
 import asyncio
 import json
+import logging
 from typing import Any
 from uuid import UUID
 from agents.base import BaseAgent, AgentRole
@@ -387,75 +388,86 @@ class Chief(BaseAgent):
         from db.human_oversight import human_prompt_store
         
         prompts = await human_prompt_store.get_pending_prompts()
+        if not prompts:
+            return 0
         
-        count = 0
+        # Look up each story's detection event concurrently (once per story)
+        story_ids = list({prompt.story_id for prompt in prompts})
+        story_events = await asyncio.gather(
+            *(event_store.get_story_events(story_id) for story_id in story_ids)
+        )
+        detections = {
+            story_id: next((e for e in events if e.event_type == "story.detected"), None)
+            for story_id, events in zip(story_ids, story_events)
+        }
+        
+        dispatchable = []
         for prompt in prompts:
-            # Get story events to find detection data
-            events = await event_store.get_story_events(prompt.story_id)
-            detection_event = next(
-                (e for e in events if e.event_type == "story.detected"),
-                None
-            )
-            
-            if not detection_event:
+            if detections[prompt.story_id] is None:
                 logger.warning(
                     "Cannot process prompt - no detection event found",
                     story_id=str(prompt.story_id),
                     prompt_id=prompt.id,
                 )
                 continue
-            
-            # Create a high-priority research task for this prompt
-            await task_queue.create(
+            dispatchable.append(prompt)
+        
+        # Create a high-priority research task for every prompt at once
+        await asyncio.gather(*(
+            task_queue.create(
                 story_id=prompt.story_id,
                 stage=TaskStage.RESEARCH,
                 priority=10,  # High priority for human requests
                 input_data={
-                    "detection_data": detection_event.data,
+                    "detection_data": detections[prompt.story_id].data,
                     "human_prompt_id": prompt.id,
                     "human_prompt_text": prompt.prompt_text,
                 },
             )
-            
+            for prompt in dispatchable
+        ))
+        
+        for prompt in dispatchable:
             logger.info(
                 "Created research task for human prompt",
                 story_id=str(prompt.story_id),
                 prompt_id=prompt.id,
                 prompt_text=prompt.prompt_text[:50] + "..." if len(prompt.prompt_text) > 50 else prompt.prompt_text,
             )
-            
-            count += 1
         
-        return count
+        # One UPDATE for the whole batch, so the next cycle doesn't re-dispatch them
+        await human_prompt_store.mark_processing_many([prompt.id for prompt in dispatchable])
+        
+        return len(dispatchable)
 
     async def run(self) -> None:
         """Main Chief loop."""
         await self.register()
         self._running = True
         
-        logger.info("Chief started", agent_id=str(self.agent_id))
+        logger.info("Chief started", agent_id=self._agent_id_str)
         
         while self._running:
             try:
                 # Process human prompts FIRST (highest priority)
                 prompt_count = await self.process_human_prompts()
                 if prompt_count > 0:
-                    logger.info(f"Processed {prompt_count} human prompts")
+                    logger.info("Processed human prompts", count=prompt_count)
                 
                 # Process new detections
                 new_count = await self.process_new_detections()
                 if new_count > 0:
-                    logger.info(f"Created {new_count} new story pipelines")
+                    logger.info("Created new story pipelines", count=new_count)
                 
                 # Advance stories through pipeline
                 advanced_count = await self.advance_stories()
                 if advanced_count > 0:
-                    logger.info(f"Advanced {advanced_count} stories")
+                    logger.info("Advanced stories", count=advanced_count)
                 
                 # Recover stalled work
                 recovered_count = await self.recover_stalled_tasks()
                 if recovered_count > 0:
-                    logger.warning(f"Recovered {recovered_count} stalled tasks")
+                    logger.warning("Recovered stalled tasks", count=recovered_count)
                 
                 # Send heartbeat
                 await self.heartbeat()
@@ -464,5 +476,9 @@ class Chief(BaseAgent):
                 await asyncio.sleep(settings.task_poll_interval_seconds)
                 
             except Exception as e:
-                logger.error("Chief loop error", error=str(e), exc_info=True)
+                logger.error(
+                    "Chief loop error",
+                    error=str(e),
+                    exc_info=logger.is_enabled_for(logging.DEBUG),
+                )
                 await asyncio.sleep(5)
@@ -1,13 +1,15 @@
 """Make db a package."""
 from db.connection import db, Database
-from db.events import event_store, EventStore, Event
+from db.events import event_store, event_appender, EventStore, BatchingAppender, Event
 from db.tasks import task_queue, TaskQueue, Task, TaskStage, TaskStatus
 
 __all__ = [
     "db",
     "Database",
     "event_store",
+    "event_appender",
     "EventStore",
+    "BatchingAppender",
     "Event",
     "task_queue",
     "TaskQueue",
@@ -5,7 +5,9 @@ from uuid import UUID
 from datetime import datetime
 from pydantic import BaseModel
 from db.connection import db
+from cache import TTLCache
 from config.logging import get_logger
+from config.settings import settings
 
 logger = get_logger(__name__)
 
@@ -41,6 +43,11 @@ class ArticleReview(BaseModel):
 class ArticleStore:
     """Manage published articles."""
     
+    def __init__(self):
+        # Read-through cache for hot lookups (publishing, retries); only found
+        # articles are cached and update_article() invalidates its entry
+        self._cache = TTLCache(maxsize=1024, ttl=settings.article_cache_ttl_seconds)
+    
     async def record_review(
         self,
         article_id: UUID,
@@ -159,6 +166,15 @@ class ArticleStore:
         
         return Article(**row_dict)
     
+    async def get_article_cached(self, article_id: UUID) -> Optional[Article]:
+        """Get an article by ID, served from the in-process cache when fresh."""
+        article = self._cache.get(article_id)
+        if article is None:
+            article = await self.get_article(article_id)
+            if article is not None:
+                self._cache.set(article_id, article)
+        return article
+    
     async def get_story_article(self, story_id: UUID) -> Optional[Article]:
         """Get the latest article for a story."""
         row = await db.fetchrow(
@@ -208,6 +224,43 @@ class ArticleStore:
         
         return articles
     
+    async def list_published_on_channel(
+        self,
+        channel: str,
+        limit: int = 50,
+    ) -> list[tuple[Article, datetime]]:
+        """Get live articles on a channel with their publication time, newest first.
+        
+        Joins publications to articles in one query, rather than fetching
+        each publication's article separately.
+        """
+        rows = await db.fetch(
+            """
+            SELECT a.*, p.published_at AS channel_published_at
+            FROM publications p
+            JOIN articles a ON a.id = p.article_id
+            WHERE p.channel = $1 AND p.status = 'published'
+            ORDER BY p.published_at DESC
+            LIMIT $2
+            """,
+            channel,
+            limit,
+        )
+        
+        entries = []
+        for row in rows:
+            row_dict = dict(row)
+            channel_published_at = row_dict.pop('channel_published_at')
+            if isinstance(row_dict['sources'], str):
+                row_dict['sources'] = json.loads(row_dict['sources'])
+            if isinstance(row_dict['entities'], str):
+                row_dict['entities'] = json.loads(row_dict['entities'])
+            if isinstance(row_dict['metadata'], str):
+                row_dict['metadata'] = json.loads(row_dict['metadata'])
+            entries.append((Article(**row_dict), channel_published_at))
+        
+        return entries
+    
     async def update_article(
         self,
         article_id: UUID,
@@ -244,6 +297,7 @@ class ArticleStore:
         """
         
         await db.execute(query, *values)
+        self._cache.delete(article_id)
         logger.info("Article updated", article_id=str(article_id))
     
     def render_html(self, article: Article) -> str:
@@ -25,6 +25,9 @@ class Database:
             min_size=2,
             max_size=10,
             command_timeout=60,
+            # Candidate list size for HNSW memory searches; wider than pgvector's
+            # default so the memory_type filter still leaves `limit` matches
+            server_settings={"hnsw.ef_search": str(settings.memory_hnsw_ef_search)},
         )
         logger.info("Database connected")
 
@@ -48,6 +51,16 @@ class Database:
         async with self._pool.acquire() as conn:
             yield conn
 
+    async def listen(self, channel: str, callback) -> asyncpg.Connection:
+        """Open a dedicated connection subscribed to a NOTIFY channel.
+        
+        LISTEN is session-scoped, so this deliberately bypasses the pool.
+        The caller owns the returned connection and must close it.
+        """
+        conn = await asyncpg.connect(settings.database_url)
+        await conn.add_listener(channel, callback)
+        return conn
+
     async def execute(self, query: str, *args) -> str:
         """Execute a query."""
         async with self.acquire() as conn:
@@ -1,4 +1,5 @@
 """Event sourcing system - core of News Town."""
+import asyncio
 import json
 from typing import Any, Optional
 from uuid import UUID
@@ -6,6 +7,7 @@ from datetime import datetime
 from pydantic import BaseModel, Field
 from db.connection import db
 from config.logging import get_logger
+from config.settings import settings
 
 logger = get_logger(__name__)
 
@@ -53,6 +55,59 @@ class EventStore:
         
         return event_id
 
+    async def append_many(self, events: list[Event]) -> list[int]:
+        """Append several events with a single multi-row INSERT (COPY for large batches).
+        
+        Returns event IDs in the same order as the input.
+        """
+        if not events:
+            return []
+        
+        if len(events) >= settings.event_copy_threshold:
+            return await self._copy_many(events)
+        
+        rows = await db.fetch(
+            """
+            INSERT INTO story_events (story_id, agent_id, event_type, data)
+            SELECT * FROM unnest($1::UUID[], $2::UUID[], $3::TEXT[], $4::JSONB[])
+            RETURNING id
+            """,
+            [e.story_id for e in events],
+            [e.agent_id for e in events],
+            [e.event_type for e in events],
+            [json.dumps(e.data) for e in events],
+        )
+        
+        logger.info("Events appended", count=len(rows))
+        
+        return [row["id"] for row in rows]
+
+    async def _copy_many(self, events: list[Event]) -> list[int]:
+        """Bulk-load events with COPY, using IDs reserved up front from the sequence."""
+        async with db.acquire() as conn:
+            ids = [
+                row["id"]
+                for row in await conn.fetch(
+                    """
+                    SELECT nextval(pg_get_serial_sequence('story_events', 'id')) AS id
+                    FROM generate_series(1, $1)
+                    """,
+                    len(events),
+                )
+            ]
+            await conn.copy_records_to_table(
+                "story_events",
+                columns=["id", "story_id", "agent_id", "event_type", "data"],
+                records=[
+                    (event_id, e.story_id, e.agent_id, e.event_type, json.dumps(e.data))
+                    for event_id, e in zip(ids, events)
+                ],
+            )
+        
+        logger.info("Events copied", count=len(ids))
+        
+        return ids
+
     async def get_story_events(self, story_id: UUID) -> list[Event]:
         """Get all events for a story."""
         rows = await db.fetch(
@@ -112,5 +167,76 @@ class EventStore:
         return {row["event_type"]: row["count"] for row in rows}
 
 
+class BatchingAppender:
+    """
+    Coalesce concurrent event appends into multi-row INSERTs.
+    
+    A background flusher drains the queue and writes whatever has
+    accumulated as soon as the queue is empty or max_batch is reached, so a
+    lone event is written immediately while bursts share one round-trip.
+    submit() resolves once the event is durable, preserving read-your-writes.
+    """
+
+    def __init__(self, store: EventStore, max_batch: int = 100):
+        self.store = store
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+
+    async def submit(
+        self,
+        story_id: UUID,
+        event_type: str,
+        data: dict[str, Any],
+        agent_id: Optional[UUID] = None,
+    ) -> int:
+        """Queue an event for the next batch and wait for its ID."""
+        self._ensure_flusher()
+        future = asyncio.get_running_loop().create_future()
+        event = Event(story_id=story_id, agent_id=agent_id, event_type=event_type, data=data)
+        await self._queue.put((event, future))
+        return await future
+
+    def _ensure_flusher(self) -> None:
+        """Start (or restart, e.g. on a new event loop) the flusher task."""
+        if self._flusher is not None and not self._flusher.done():
+            if self._flusher.get_loop() is asyncio.get_running_loop():
+                return
+        self._queue = asyncio.Queue()
+        self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Drain the queue into batched INSERTs."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            try:
+                event_ids = await self.store.append_many([event for event, _ in batch])
+            except Exception as e:
+                logger.error("Event batch append failed", count=len(batch), error=str(e))
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), event_id in zip(batch, event_ids):
+                    if not future.done():
+                        future.set_result(event_id)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def close(self) -> None:
+        """Stop the flusher once queued events have been written."""
+        if self._flusher is None:
+            return
+        await self._queue.join()
+        self._flusher.cancel()
+        await asyncio.gather(self._flusher, return_exceptions=True)
+        self._flusher = None
+
+
 # Global event store instance
 event_store = EventStore()
+event_appender = BatchingAppender(event_store, max_batch=settings.event_batch_max_size)
@@ -288,7 +288,80 @@ class ArticleReviewStore:
             json.dumps(meta or {}),
         )
         return result["id"]
-    
+
+    async def create_with_completion(
+        self,
+        task_id: UUID,
+        task_output: Dict[str, Any],
+        event_type: str,
+        agent_status: str,
+        story_id: UUID,
+        editor_agent_id: UUID,
+        score: float,
+        decision: str,
+        article_id: Optional[UUID] = None,
+        verification_score: Optional[float] = None,
+        style_score: Optional[float] = None,
+        feedback: Optional[str] = None,
+        meta: Optional[Dict[str, Any]] = None,
+    ) -> UUID:
+        """Record a review, complete its task and log the completion event atomically.
+
+        Everything happens in a single statement, so the review can never be
+        persisted without its task being completed (or vice versa).
+        """
+        import json
+
+        query = """
+            WITH review AS (
+                INSERT INTO article_reviews (
+                    story_id, article_id, editor_agent_id, score,
+                    verification_score, style_score, feedback, decision, meta
+                )
+                VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
+                RETURNING id
+            ),
+            completed AS (
+                UPDATE story_tasks
+                SET status = 'completed',
+                    output = $11,
+                    completed_at = now()
+                WHERE id = $10
+            ),
+            heartbeat AS (
+                UPDATE agents
+                SET last_heartbeat = now(), status = $12
+                WHERE id = $3
+            ),
+            event AS (
+                INSERT INTO story_events (story_id, agent_id, event_type, data)
+                VALUES ($1, $3, $13, $14)
+            )
+            SELECT id FROM review
+        """
+        result = await db.fetchrow(
+            query,
+            story_id,
+            article_id,
+            editor_agent_id,
+            score,
+            verification_score,
+            style_score,
+            feedback,
+            decision,
+            json.dumps(meta or {}),
+            task_id,
+            json.dumps(task_output),
+            agent_status,
+            event_type,
+            json.dumps({"task_id": str(task_id), "output": task_output}),
+        )
+        return result["id"]
+
+    async def refresh_daily_rollup(self) -> None:
+        """Recompute the article_reviews_daily view without blocking its readers."""
+        await db.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY article_reviews_daily")
+
     async def get_for_story(self, story_id: UUID) -> List[ArticleReview]:
         """Get all review passes for a story."""
         query = """
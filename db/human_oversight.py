@@ -124,6 +124,15 @@ class HumanPromptStore:
             prompt_id,
         )
     
+    async def mark_processing_many(self, prompt_ids: list[int]) -> None:
+        """Mark several prompts as being processed in one UPDATE."""
+        if not prompt_ids:
+            return
+        await db.execute(
+            "UPDATE human_prompts SET status = 'processing' WHERE id = ANY($1::int[])",
+            prompt_ids,
+        )
+    
     async def get_prompt_history(self, story_id: UUID) -> list[HumanPrompt]:
         """Get all prompts for a story."""
         rows = await db.fetch(
@@ -8,6 +8,15 @@ from config.logging import get_logger
 logger = get_logger(__name__)
 
 
+def vector_literal(embedding: List[float]) -> str:
+    """Format an embedding as a pgvector text literal.
+    
+    pgvector stores float32, so 9 significant digits round-trip exactly;
+    Python's float repr would send up to 17 per dimension for nothing.
+    """
+    return "[" + ",".join([format(x, ".9g") for x in embedding]) + "]"
+
+
 class MemoryStore:
     """Store and retrieve story memories (vectors)."""
 
@@ -38,16 +47,11 @@ class MemoryStore:
         RETURNING id
         """
         
-        # pgvector expects string representation for list insertion often, 
-        # but asyncpg handles list[float] mapping to vector type automatically 
-        # in newer versions. If not, we might need str(embedding).
-        # Let's try direct list first.
-        
         return await db.fetchval(
             query,
             story_id,
             content,
-            str(embedding), # Explicit string conversion often safer for generic vector types
+            vector_literal(embedding),
             memory_type,
             json.dumps(metadata) if metadata else "{}"
         )
@@ -72,6 +76,8 @@ class MemoryStore:
         # Cosine distance <=> 0 means identical, 2 means opposite.
         # Similarity = 1 - distance.
         # We want similarity > threshold, so distance < (1 - threshold).
+        # ORDER BY distance + LIMIT is served by the HNSW index
+        # (idx_memory_embedding_hnsw) instead of scanning every memory.
         
         distance_threshold = 1.0 - threshold
         
@@ -87,7 +93,7 @@ class MemoryStore:
         LIMIT $3
         """
         
-        rows = await db.fetch(query, str(embedding), distance_threshold, limit)
+        rows = await db.fetch(query, vector_literal(embedding), distance_threshold, limit)
         
         return [
             {
@@ -98,5 +104,42 @@ class MemoryStore:
             for row in rows
         ]
 
-# Global instance
+class EmbeddingCacheStore:
+    """Persistent (model, text) -> embedding cache backing the in-process one."""
+
+    async def get_many(self, keys: List[str], max_age_seconds: float) -> Dict[str, bytes]:
+        """Fetch fresh cached vectors (raw float32 bytes) for the given keys."""
+        rows = await db.fetch(
+            """
+            SELECT cache_key, embedding FROM embedding_cache
+            WHERE cache_key = ANY($1::text[])
+              AND created_at > now() - make_interval(secs => $2)
+            """,
+            keys,
+            float(max_age_seconds),
+        )
+        return {row["cache_key"]: row["embedding"] for row in rows}
+
+    async def put_many(self, items: Dict[str, bytes], max_age_seconds: float) -> None:
+        """Upsert vectors in one statement and drop entries past max age."""
+        if not items:
+            return
+        await db.execute(
+            """
+            INSERT INTO embedding_cache (cache_key, embedding)
+            SELECT * FROM unnest($1::text[], $2::bytea[])
+            ON CONFLICT (cache_key) DO UPDATE
+            SET embedding = EXCLUDED.embedding, created_at = now()
+            """,
+            list(items.keys()),
+            list(items.values()),
+        )
+        await db.execute(
+            "DELETE FROM embedding_cache WHERE created_at < now() - make_interval(secs => $1)",
+            float(max_age_seconds),
+        )
+
+
+# Global instances
 memory_store = MemoryStore()
+embedding_cache_store = EmbeddingCacheStore()
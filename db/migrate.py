@@ -40,6 +40,7 @@ async def reset_database() -> None:
     async with db.acquire() as conn:
         # Drop functions
         await conn.execute("DROP FUNCTION IF EXISTS claim_task(uuid,text) CASCADE")
+        await conn.execute("DROP FUNCTION IF EXISTS claim_tasks(uuid,text,integer) CASCADE")
         
         # Drop tables
         await conn.execute("DROP MATERIALIZED VIEW IF EXISTS stories CASCADE")
@@ -53,6 +54,7 @@ async def reset_database() -> None:
         await conn.execute("DROP TABLE IF EXISTS story_sources CASCADE")
         await conn.execute("DROP TABLE IF EXISTS human_prompts CASCADE")
         await conn.execute("DROP TABLE IF EXISTS story_memory CASCADE")
+        await conn.execute("DROP TABLE IF EXISTS embedding_cache CASCADE")
         await conn.execute("DROP TABLE IF EXISTS agents CASCADE")
         await conn.execute("DROP TABLE IF EXISTS story_tasks CASCADE")
         await conn.execute("DROP TABLE IF EXISTS story_events CASCADE")
@@ -20,7 +20,10 @@ CREATE TABLE IF NOT EXISTS story_events (
 
 CREATE INDEX IF NOT EXISTS idx_events_story ON story_events(story_id, created_at);
 CREATE INDEX IF NOT EXISTS idx_events_type ON story_events(event_type);
-CREATE INDEX IF NOT EXISTS idx_events_created ON story_events(created_at DESC);
+-- Covers the dashboard's recent agent activity, so it is read from the index alone
+DROP INDEX IF EXISTS idx_events_created;
+CREATE INDEX IF NOT EXISTS idx_events_created_covering ON story_events(created_at DESC)
+    INCLUDE (agent_id, event_type);
 
 COMMENT ON TABLE story_events IS 'Immutable event log - single source of truth';
 COMMENT ON COLUMN story_events.event_type IS 'Event types: story.detected, task.created, fact.added, story.published, etc.';
@@ -93,12 +96,26 @@ CREATE TABLE IF NOT EXISTS story_memory (
 
 CREATE INDEX IF NOT EXISTS idx_memory_story ON story_memory(story_id);
 CREATE INDEX IF NOT EXISTS idx_memory_type ON story_memory(memory_type);
-CREATE INDEX IF NOT EXISTS idx_memory_embedding ON story_memory USING ivfflat (embedding vector_cosine_ops)
-  WITH (lists = 100);
+-- HNSW rather than IVFFlat: no training step, so it stays accurate on a table
+-- that starts empty (IVFFlat lists built at creation time never rebalance)
+DROP INDEX IF EXISTS idx_memory_embedding;
+CREATE INDEX IF NOT EXISTS idx_memory_embedding_hnsw ON story_memory USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 128);
 
 COMMENT ON TABLE story_memory IS 'Story facts and embeddings for semantic search';
 COMMENT ON COLUMN story_memory.memory_type IS 'Types: fact, quote, source, summary';
 
+-- Text embeddings keyed by (model, text) digest, so restarts don't re-run the model
+CREATE TABLE IF NOT EXISTS embedding_cache (
+  cache_key TEXT PRIMARY KEY,
+  embedding BYTEA NOT NULL,
+  created_at TIMESTAMPTZ DEFAULT now()
+);
+
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_created ON embedding_cache(created_at);
+
+COMMENT ON TABLE embedding_cache IS 'Persistent embedding cache (raw float32 vectors)';
+
 
 -- ============================================================================
 -- MATERIALIZED VIEW: Stories
@@ -222,6 +239,50 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+DROP FUNCTION IF EXISTS claim_tasks(UUID, TEXT, INTEGER) CASCADE;
+
+-- Function to claim a batch of tasks (atomic, non-contending across agents)
+CREATE OR REPLACE FUNCTION claim_tasks(
+  p_agent_id UUID,
+  p_role TEXT,
+  p_limit INTEGER
+)
+RETURNS TABLE (
+  task_id UUID,
+  story_id UUID,
+  stage TEXT,
+  priority INTEGER,
+  input JSONB
+) AS $$
+BEGIN
+  RETURN QUERY
+  UPDATE story_tasks st
+  SET 
+    status = 'active',
+    assigned_agent = p_agent_id,
+    started_at = now()
+  FROM (
+    SELECT st2.id
+    FROM story_tasks st2
+    WHERE st2.status = 'pending'
+      AND st2.stage IN (
+        SELECT UNNEST(CASE p_role
+          WHEN 'scout' THEN ARRAY['detect']
+          WHEN 'reporter' THEN ARRAY['research', 'draft', 'edit']
+          WHEN 'editor' THEN ARRAY['review']
+          WHEN 'publisher' THEN ARRAY['publish']
+          ELSE ARRAY[]::TEXT[]
+        END)
+      )
+    ORDER BY st2.priority DESC, st2.created_at ASC
+    FOR UPDATE SKIP LOCKED
+    LIMIT p_limit
+  ) subquery
+  WHERE st.id = subquery.id
+  RETURNING st.id, st.story_id, st.stage, st.priority, st.input;
+END;
+$$ LANGUAGE plpgsql;
+
 -- ============================================================================
 -- HUMAN OVERSIGHT (Phase 2)
 -- ============================================================================
@@ -282,7 +343,10 @@ CREATE TABLE IF NOT EXISTS articles (
 );
 
 CREATE INDEX IF NOT EXISTS idx_articles_story ON articles(story_id);
-CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_at DESC);
+-- Covers the dashboard's recent-articles list and articles-today count
+DROP INDEX IF EXISTS idx_articles_published;
+CREATE INDEX IF NOT EXISTS idx_articles_published_covering ON articles(published_at DESC)
+    INCLUDE (id, headline, byline);
 CREATE INDEX IF NOT EXISTS idx_articles_tags ON articles USING gin(tags);
 
 COMMENT ON TABLE articles IS 'Published articles in structured format';
@@ -410,6 +474,22 @@ CREATE INDEX IF NOT EXISTS idx_reviews_created ON article_reviews(created_at DES
 
 COMMENT ON TABLE article_reviews IS 'Record of editorial review passes and quality scores';
 
+-- Daily review rollup backing the dashboard's quality analytics, so reads
+-- touch one row per day instead of every review. Refreshed periodically by
+-- the API (CONCURRENTLY, which needs the unique index).
+CREATE MATERIALIZED VIEW IF NOT EXISTS article_reviews_daily AS
+SELECT
+    DATE_TRUNC('day', created_at) AS day,
+    AVG(score) AS avg_score,
+    AVG(verification_score) AS avg_verification,
+    AVG(style_score) AS avg_style,
+    COUNT(*) AS volume,
+    COUNT(*) FILTER (WHERE decision = 'REJECT') AS rejected
+FROM article_reviews
+GROUP BY 1;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_reviews_daily_day ON article_reviews_daily(day);
+
 -- ============================================================================
 -- AUTHENTICATION (Phase 4.2)
 -- ============================================================================
@@ -29,6 +29,22 @@ class TaskStatus(str, Enum):
     FAILED = "failed"
 
 
+# Role that claims each stage - mirrors the mapping in claim_task() (schema.sql)
+STAGE_ROLES: dict[TaskStage, str] = {
+    TaskStage.DETECT: "scout",
+    TaskStage.RESEARCH: "reporter",
+    TaskStage.DRAFT: "reporter",
+    TaskStage.EDIT: "reporter",
+    TaskStage.REVIEW: "editor",
+    TaskStage.PUBLISH: "publisher",
+}
+
+
+def task_channel(role: str) -> str:
+    """NOTIFY channel that agents of a role listen on for new tasks."""
+    return f"tasks_{role}"
+
+
 class Task(BaseModel):
     """Task model."""
     id: UUID = Field(default_factory=uuid4)
@@ -56,18 +72,22 @@ class TaskQueue:
         input_data: Optional[dict[str, Any]] = None,
         deadline: Optional[datetime] = None,
     ) -> UUID:
-        """Create a new task."""
+        """Create a new task and wake up idle agents for its role."""
         task_id = await db.fetchval(
             """
-            INSERT INTO story_tasks (story_id, stage, priority, input, deadline)
-            VALUES ($1, $2, $3, $4, $5)
-            RETURNING id
+            WITH inserted AS (
+                INSERT INTO story_tasks (story_id, stage, priority, input, deadline)
+                VALUES ($1, $2, $3, $4, $5)
+                RETURNING id
+            )
+            SELECT id, pg_notify($6, id::TEXT) FROM inserted
             """,
             story_id,
             stage.value,
             priority,
             json.dumps(input_data or {}),  # Serialize to JSON string
             deadline,
+            task_channel(STAGE_ROLES[stage]),
         )
         
         logger.info(
@@ -91,15 +111,7 @@ class TaskQueue:
         if not row:
             return None
         
-        task = Task(
-            id=row["task_id"],
-            story_id=row["story_id"],
-            stage=TaskStage(row["stage"]),
-            status=TaskStatus.ACTIVE,
-            priority=row["priority"],
-            assigned_agent=agent_id,
-            input=json.loads(row["input"]) if isinstance(row["input"], str) else row["input"],
-        )
+        task = self._claimed_task(row, agent_id)
         
         logger.info(
             "Task claimed",
@@ -110,6 +122,45 @@ class TaskQueue:
         
         return task
 
+    async def claim_many(
+        self,
+        agent_id: UUID,
+        role: str,
+        limit: int,
+    ) -> list[Task]:
+        """Claim up to `limit` available tasks for an agent role in one round-trip."""
+        rows = await db.fetch(
+            "SELECT * FROM claim_tasks($1, $2, $3)",
+            agent_id,
+            role,
+            limit,
+        )
+        
+        tasks = [self._claimed_task(row, agent_id) for row in rows]
+        
+        if tasks:
+            logger.info(
+                "Tasks claimed",
+                task_ids=[str(t.id) for t in tasks],
+                agent_id=str(agent_id),
+                count=len(tasks),
+            )
+        
+        return tasks
+
+    @staticmethod
+    def _claimed_task(row, agent_id: UUID) -> Task:
+        """Build a Task from a claim_task/claim_tasks row."""
+        return Task(
+            id=row["task_id"],
+            story_id=row["story_id"],
+            stage=TaskStage(row["stage"]),
+            status=TaskStatus.ACTIVE,
+            priority=row["priority"],
+            assigned_agent=agent_id,
+            input=json.loads(row["input"]) if isinstance(row["input"], str) else row["input"],
+        )
+
     async def complete(
         self,
         task_id: UUID,
@@ -150,6 +201,82 @@ class TaskQueue:
         
         logger.warning("Task failed", task_id=str(task_id), error=error)
 
+    async def complete_and_heartbeat(
+        self,
+        task_id: UUID,
+        output_data: dict[str, Any],
+        agent_id: UUID,
+        agent_status: str,
+    ) -> None:
+        """Mark a task as completed and refresh the agent's heartbeat in one round-trip."""
+        await db.execute(
+            """
+            WITH completed AS (
+                UPDATE story_tasks
+                SET status = 'completed',
+                    output = $2,
+                    completed_at = now()
+                WHERE id = $1
+            )
+            UPDATE agents
+            SET last_heartbeat = now(), status = $4
+            WHERE id = $3
+            """,
+            task_id,
+            json.dumps(output_data),  # Serialize to JSON string
+            agent_id,
+            agent_status,
+        )
+        
+        logger.info("Task completed", task_id=str(task_id))
+
+    async def fail_and_heartbeat(
+        self,
+        task_id: UUID,
+        error: str,
+        agent_id: UUID,
+        agent_status: str,
+    ) -> None:
+        """Mark a task as failed and refresh the agent's heartbeat in one round-trip."""
+        await db.execute(
+            """
+            WITH failed AS (
+                UPDATE story_tasks
+                SET status = 'failed',
+                    output = jsonb_build_object('error', $2::TEXT),
+                    completed_at = now()
+                WHERE id = $1
+            )
+            UPDATE agents
+            SET last_heartbeat = now(), status = $4
+            WHERE id = $3
+            """,
+            task_id,
+            error,
+            agent_id,
+            agent_status,
+        )
+        
+        logger.warning("Task failed", task_id=str(task_id), error=error)
+
+    async def release_many(self, task_ids: list[UUID], agent_id: UUID) -> None:
+        """Hand claimed tasks an agent never started back to the pending queue."""
+        await db.execute(
+            """
+            UPDATE story_tasks
+            SET status = 'pending',
+                assigned_agent = NULL,
+                started_at = NULL
+            WHERE id = ANY($1::UUID[])
+              AND status = 'active'
+              AND assigned_agent = $2
+            """,
+            task_ids,
+            agent_id,
+        )
+        
+        logger.info("Tasks released", task_ids=[str(t) for t in task_ids], agent_id=str(agent_id))
+
     async def get_task(self, task_id: UUID) -> Optional[Task]:
         """Get a task by ID."""
         row = await db.fetchrow(
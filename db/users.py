@@ -1,4 +1,5 @@
 """User store for authentication."""
+import asyncio
 from typing import Optional, Dict, Any
 from uuid import UUID
 from db.connection import db
@@ -17,7 +18,7 @@ class UserStore:
 
     async def create_user(self, username: str, password: str, role: str = "viewer") -> UUID:
         """Create a new user with a hashed password."""
-        password_hash = get_password_hash(password)
+        password_hash = await asyncio.to_thread(get_password_hash, password)
         user_id = await db.fetchval(
             """
             INSERT INTO users (username, password_hash, role)
@@ -3,11 +3,12 @@ from ingestion.search import search_service, SearchService, SearchResult
 
 # Try to import entity extractor - may fail on Python 3.12 due to spaCy/Pydantic incompatibility
 try:
-    from ingestion.entities import entity_extractor, EntityExtractor, Entity
+    from ingestion.entities import entity_extractor, entity_batcher, EntityExtractor, Entity
 except (ImportError, TypeError) as e:
     # Create dummy placeholders for when spaCy is unavailable
     print(f"Warning: Entity extraction unavailable due to: {e}")
     entity_extractor = None
+    entity_batcher = None
     EntityExtractor = None
     Entity = None
 
@@ -16,6 +17,7 @@ __all__ = [
     "SearchService",
     "SearchResult",
     "entity_extractor",
+    "entity_batcher",
     "EntityExtractor",
     "Entity",
 ]
@@ -1,7 +1,11 @@
 """Embedding service using local sentence-transformers."""
+import asyncio
+import threading
+import numpy as np
 import torch
 from typing import List, Optional
 from sentence_transformers import SentenceTransformer
+from cache import TTLCache, cache_key
 from config.settings import settings
 from config.logging import get_logger
 
@@ -21,6 +25,9 @@ class EmbeddingService:
         self.model_name = settings.embedding_model
         self.model: Optional[SentenceTransformer] = None
         self._device = self._get_device()
+        # Vectors kept as float32 arrays (~4x smaller than lists of Python floats)
+        self._cache = TTLCache(settings.embedding_cache_size, settings.embedding_cache_ttl_seconds)
+        self._cache_lock = threading.Lock()  # embed() is called from worker threads
 
     def _get_device(self) -> str:
         """Determine the best available device."""
@@ -65,34 +72,140 @@ class EmbeddingService:
         """
         if not text:
             return []
+
+        cached = self._get_cached(text)
+        if cached is not None:
+            return cached
             
         self._load_model()
         if not self.model:
             return []
 
-        # sentence-transformers returns numpy array, convert to list
-        embedding = self.model.encode(text, convert_to_tensor=False)
+        # sentence-transformers returns numpy array, convert to list.
+        # Normalized to unit length, so cosine and inner-product rankings agree.
+        embedding = np.asarray(
+            self.model.encode(text, convert_to_tensor=False, normalize_embeddings=True),
+            dtype=np.float32,
+        )
+        with self._cache_lock:
+            self._cache.set(cache_key(self.model_name, text), embedding)
         return embedding.tolist()
 
+    async def embed_async(self, text: str) -> List[float]:
+        """
+        Generate embedding for a single string without blocking the event loop.
+        
+        Cached vectors are returned inline; only a miss pays for a worker
+        thread to run the model.
+        """
+        cached = self._get_cached(text) if text else None
+        if cached is not None:
+            return cached
+        return await asyncio.to_thread(self.embed, text)
+
+    def _get_cached(self, text: str) -> Optional[List[float]]:
+        """Cached embedding for text, if any."""
+        with self._cache_lock:
+            cached = self._cache.get(cache_key(self.model_name, text))
+        return cached.tolist() if cached is not None else None
+
     def embed_batch(self, texts: List[str]) -> List[List[float]]:
         """
         Generate embeddings for a batch of strings.
         
+        Cached texts are served from the cache; the remaining (distinct)
+        texts share a single model forward pass.
+        
         Args:
             texts: List of input texts
             
         Returns:
-            List of vectors
+            List of vectors, in input order
         """
         if not texts:
             return []
+        
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        misses: dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if not text:
+                results[i] = []
+                continue
+            cached = self._get_cached(text)
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.setdefault(text, []).append(i)
+        
+        if misses:
+            self._load_model()
+            if not self.model:
+                return [r if r is not None else [] for r in results]
             
-        self._load_model()
-        if not self.model:
-            return []
+            embeddings = np.asarray(
+                self.model.encode(list(misses), convert_to_tensor=False, normalize_embeddings=True),
+                dtype=np.float32,
+            )
+            with self._cache_lock:
+                for text, embedding in zip(misses, embeddings):
+                    self._cache.set(cache_key(self.model_name, text), embedding)
+            for (text, indices), embedding in zip(misses.items(), embeddings):
+                vector = embedding.tolist()
+                for i in indices:
+                    results[i] = vector
+        
+        return results
+
+    async def embed_batch_async(self, texts: List[str]) -> List[List[float]]:
+        """
+        embed_batch() without blocking the event loop.
+        
+        Texts missing from the in-process cache are looked up in the
+        persistent cache first, so a restarted scout doesn't re-embed every
+        unchanged feed entry; vectors the model does compute are written back.
+        """
+        missing = [t for t in dict.fromkeys(texts) if t and self._get_cached(t) is None]
+        if missing:
+            await self._load_persisted(missing)
+            missing = [t for t in missing if self._get_cached(t) is None]
+        if not missing:
+            return self.embed_batch(texts)
+        
+        results = await asyncio.to_thread(self.embed_batch, texts)
+        await self._persist(missing)
+        return results
 
-        embeddings = self.model.encode(texts, convert_to_tensor=False)
-        return embeddings.tolist()
+    async def _load_persisted(self, texts: List[str]) -> None:
+        """Warm the in-process cache from the persistent one."""
+        from db.memory import embedding_cache_store
+        
+        try:
+            rows = await embedding_cache_store.get_many(
+                [cache_key(self.model_name, t) for t in texts],
+                settings.embedding_cache_ttl_seconds,
+            )
+        except Exception as e:
+            logger.warning("Persistent embedding cache unavailable", error=str(e))
+            return
+        with self._cache_lock:
+            for key, blob in rows.items():
+                self._cache.set(key, np.frombuffer(blob, dtype=np.float32))
+
+    async def _persist(self, texts: List[str]) -> None:
+        """Write freshly computed vectors to the persistent cache."""
+        from db.memory import embedding_cache_store
+        
+        items = {}
+        with self._cache_lock:
+            for text in texts:
+                key = cache_key(self.model_name, text)
+                embedding = self._cache.get(key)
+                if embedding is not None:
+                    items[key] = embedding.tobytes()
+        try:
+            await embedding_cache_store.put_many(items, settings.embedding_cache_ttl_seconds)
+        except Exception as e:
+            logger.warning("Failed to persist embeddings", error=str(e))
 
 
 # Global instance
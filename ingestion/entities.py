@@ -1,7 +1,11 @@
 """Entity extraction using spaCy."""
+import asyncio
+import threading
 from typing import Optional
 from dataclasses import dataclass
+from cache import TTLCache, cache_key
 from config.logging import get_logger
+from config.settings import settings
 
 logger = get_logger(__name__)
 
@@ -16,9 +20,25 @@ except (ImportError, TypeError) as e:
     spacy = None
 
 
-@dataclass
+# Entity types worth keeping
+_ENTITY_LABELS = frozenset({
+    "PERSON",
+    "ORG",
+    "GPE",  # Geo-political entity (countries, cities)
+    "PRODUCT",
+    "LAW",
+    "EVENT",
+    "MONEY",
+    "PERCENT",
+})
+
+# Pipeline components extract() never reads - only doc.ents is consumed
+_UNUSED_PIPES = ("tagger", "parser", "attribute_ruler", "lemmatizer", "senter")
+
+
+@dataclass(frozen=True, slots=True)
 class Entity:
-    """Extracted entity."""
+    """Extracted entity (plain values - holds no reference to the spaCy Doc)."""
     text: str
     label_: str  # PERSON, ORG, GPE, etc.
     start: int
@@ -41,7 +61,8 @@ class EntityExtractor:
         
         try:
             self.nlp = spacy.load(model_name)
-            logger.info(f"Loaded spaCy model: {model_name}")
+            self.nlp.select_pipes(disable=[p for p in _UNUSED_PIPES if p in self.nlp.pipe_names])
+            logger.info(f"Loaded spaCy model: {model_name}", pipes=self.nlp.pipe_names)
         except OSError:
             logger.error(
                 f"spaCy model '{model_name}' not found. "
@@ -49,6 +70,10 @@ class EntityExtractor:
             )
             self.nlp = None
 
+        # Scout and reporter run the same title/summary through the pipeline
+        self._cache = TTLCache(settings.entity_cache_size, settings.entity_cache_ttl_seconds)
+        self._cache_lock = threading.Lock()  # extract() may run in worker threads
+
     def extract(self, text: str) -> list[Entity]:
         """
         Extract entities from text.
@@ -59,49 +84,67 @@ class EntityExtractor:
         Returns:
             List of extracted entities
         """
+        return self.extract_many([text])[0]
+
+    def extract_many(self, texts: list[str], batch_size: int = 32) -> list[list[Entity]]:
+        """
+        Extract entities from several texts, running uncached ones through nlp.pipe.
+        
+        Args:
+            texts: Texts to extract entities from
+            batch_size: spaCy batch size
+            
+        Returns:
+            One entity list per input text, in order
+        """
         if not self.nlp:
             logger.warning("spaCy model not loaded, returning empty entities")
-            return []
-
-        if not text or not text.strip():
-            return []
-
-        try:
-            doc = self.nlp(text)
-
-            entities = []
-            for ent in doc.ents:
-                # Filter for relevant entity types
-                if ent.label_ in [
-                    "PERSON",
-                    "ORG",
-                    "GPE",  # Geo-political entity (countries, cities)
-                    "PRODUCT",
-                    "LAW",
-                    "EVENT",
-                    "MONEY",
-                    "PERCENT",
-                ]:
-                    entities.append(
+            return [[] for _ in texts]
+
+        results: list[Optional[list[Entity]]] = [None] * len(texts)
+        pending: dict[str, list[int]] = {}  # Uncached text -> positions
+        with self._cache_lock:
+            for i, text in enumerate(texts):
+                if not text or not text.strip():
+                    results[i] = []
+                    continue
+                cached = self._cache.get(cache_key(text))
+                if cached is not None:
+                    results[i] = list(cached)
+                else:
+                    pending.setdefault(text, []).append(i)
+
+        if pending:
+            try:
+                docs = self.nlp.pipe(pending, batch_size=batch_size)
+                for (text, positions), doc in zip(pending.items(), docs):
+                    # Copy out plain values so the Doc can be freed right away
+                    entities = tuple(
                         Entity(
                             text=ent.text,
                             label_=ent.label_,
                             start=ent.start_char,
                             end=ent.end_char,
                         )
+                        for ent in doc.ents
+                        if ent.label_ in _ENTITY_LABELS
                     )
+                    del doc
+                    with self._cache_lock:
+                        self._cache.set(cache_key(text), entities)
+                    for i in positions:
+                        results[i] = list(entities)
 
-            logger.info(
-                "Entities extracted",
-                text_length=len(text),
-                entity_count=len(entities),
-            )
+                logger.info(
+                    "Entities extracted",
+                    text_count=len(pending),
+                    entity_count=sum(len(results[p[0]]) for p in pending.values()),
+                )
 
-            return entities
+            except Exception as e:
+                logger.error("Entity extraction failed", error=str(e))
 
-        except Exception as e:
-            logger.error("Entity extraction failed", error=str(e))
-            return []
+        return [r if r is not None else [] for r in results]
 
     def extract_by_type(self, text: str, entity_type: str) -> list[Entity]:
         """Extract only entities of a specific type."""
@@ -124,5 +167,72 @@ class EntityExtractor:
         return [e.text for e in entities]
 
 
-# Global entity extractor instance
+class EntityBatcher:
+    """
+    Coalesce concurrent extract() calls into spaCy nlp.pipe batches.
+    
+    A background worker drains whatever texts have queued up (at most
+    max_batch) and extracts them together in a worker thread, so a lone
+    request is handled immediately while bursts from concurrent research
+    tasks share one batched pass off the event loop.
+    """
+
+    def __init__(self, extractor: EntityExtractor, max_batch: int = 32):
+        self.extractor = extractor
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def extract(self, text: str) -> list[Entity]:
+        """Queue text for the next batch and wait for its entities."""
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    def _ensure_worker(self) -> None:
+        """Start (or restart, e.g. on a new event loop) the worker task."""
+        if self._worker is not None and not self._worker.done():
+            if self._worker.get_loop() is asyncio.get_running_loop():
+                return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._work_loop())
+
+    async def _work_loop(self) -> None:
+        """Drain the queue into batched extractions."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            
+            try:
+                results = await asyncio.to_thread(
+                    self.extractor.extract_many,
+                    [text for text, _ in batch],
+                    self.max_batch,
+                )
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for (_, future), entities in zip(batch, results):
+                    if not future.done():
+                        future.set_result(entities)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def close(self) -> None:
+        """Stop the worker once queued texts have been extracted."""
+        if self._worker is None:
+            return
+        await self._queue.join()
+        self._worker.cancel()
+        await asyncio.gather(self._worker, return_exceptions=True)
+        self._worker = None
+
+
+# Global entity extractor instances
 entity_extractor = EntityExtractor()
+entity_batcher = EntityBatcher(entity_extractor)
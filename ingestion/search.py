@@ -1,10 +1,15 @@
 """Search abstraction layer - supports multiple search providers with fallback."""
 from typing import List
 from dataclasses import dataclass
+from cache import TTLCache, cache_key
 from config.logging import get_logger
+from config.settings import settings
 
 logger = get_logger(__name__)
 
+# Queries recur across related stories (e.g. "<title> official statement")
+_search_cache = TTLCache(maxsize=2048, ttl=settings.search_cache_ttl_seconds)
+
 
 @dataclass
 class SearchResult:
@@ -25,6 +30,11 @@ async def search(query: str, num_results: int = 5) -> List[SearchResult]:
     
     Automatically tries Brave, then DuckDuckGo if rate limited.
     """
+    key = cache_key(query, str(num_results))
+    cached = _search_cache.get(key)
+    if cached is not None:
+        return list(cached)
+    
     try:
         fallback_search = get_fallback_search()
         results = await fallback_search.search(query, max_results=num_results)
@@ -32,14 +42,16 @@ async def search(query: str, num_results: int = 5) -> List[SearchResult]:
         # Convert to our SearchResult format
         converted = []
         for r in results:
-            source_domain = r.url.split("/")[2] if "/" in r.url else ""
             converted.append(SearchResult(
                 title=r.title,
                 url=r.url,
                 snippet=r.snippet,
-                source=source_domain
+                source=r.domain
             ))
         
+        # Empty results are usually a provider hiccup - don't pin them
+        if converted:
+            _search_cache.set(key, converted)
         return converted
         
     except Exception as e:
@@ -1,14 +1,41 @@
 """Multi-provider search with automatic fallback."""
 import asyncio
+import re
+import sys
 from abc import ABC, abstractmethod
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from urllib.parse import parse_qsl, urlencode, urlparse, urlsplit, urlunsplit
 import httpx
 from config.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+def source_domain(url: str) -> str:
+    """Normalized domain for a URL: lowercased netloc without a leading "www."."""
+    netloc = urlparse(url).netloc.lower()
+    if netloc.startswith("www."):
+        netloc = netloc[4:]
+    # Interned so repeated domains across source records share one string
+    return sys.intern(netloc)
+
+
+_TRACKING_PARAM = re.compile(r"^(utm_|fbclid$|gclid$)", re.IGNORECASE)
+
+
+def canonical_url(url: str) -> str:
+    """URL identity for de-duplication: lowercased host, no fragment,
+    tracking parameters or trailing slash, scheme-insensitive."""
+    parts = urlsplit(url.strip())
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not _TRACKING_PARAM.match(k)
+    ])
+    path = parts.path.rstrip("/")
+    return urlunsplit(("", parts.netloc.lower(), path, query, ""))
+
+
 @dataclass
 class SearchResult:
     """Unified search result across providers."""
@@ -16,6 +43,10 @@ class SearchResult:
     url: str
     snippet: str
     provider: str  # Which provider returned this result
+    domain: str = field(init=False)  # Computed once from url
+
+    def __post_init__(self):
+        self.domain = source_domain(self.url)
 
 
 class SearchProvider(ABC):
@@ -3,12 +3,14 @@ import asyncio
 import signal
 from config.logging import configure_logging, get_logger
 from config.settings import settings
-from db import db
+from db import db, event_appender
 from db.migrate import run_migrations
 from chief import Chief
 from agents.scout import ScoutAgent
 from agents.reporter import ReporterAgent
 from agents.editor import EditorAgent
+from agents.llm import chat_service
+from ingestion import entity_batcher
 
 logger = get_logger(__name__)
 
@@ -75,8 +77,12 @@ class NewsTown:
         for agent in self.agents:
             await agent.stop()
         
-        # Disconnect from database
+        # Flush buffered events, then disconnect from database
+        await event_appender.close()
+        if entity_batcher:
+            await entity_batcher.close()
         await db.disconnect()
+        await chat_service.close()
         
         logger.info("News Town stopped")
 
@@ -1,4 +1,5 @@
 """Email newsletter publisher using SendGrid."""
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
 from sendgrid import SendGridAPIClient
@@ -65,7 +66,8 @@ class SendGridProvider(EmailProvider):
                 html_content=Content("text/html", html),
             )
             
-            response = self.client.send(message)
+            # The SendGrid client is synchronous - keep it off the event loop
+            response = await asyncio.to_thread(self.client.send, message)
             success = response.status_code in (200, 201, 202)
             
             if success:
@@ -90,16 +92,57 @@ class SendGridProvider(EmailProvider):
         html: str,
         text: str,
     ) -> Dict[str, bool]:
-        """Send to multiple recipients."""
+        """Send to multiple recipients, one API request per chunk.
+        
+        Each recipient gets its own personalization, so nobody sees the
+        other addresses.
+        """
         results = {}
-        for recipient in recipients:
-            results[recipient] = await self.send_email(
-                recipient,
-                subject,
-                html,
-                text,
-            )
+        size = settings.email_batch_size
+        for start in range(0, len(recipients), size):
+            chunk = recipients[start:start + size]
+            success = await self._send_chunk(chunk, subject, html, text)
+            results.update(dict.fromkeys(chunk, success))
         return results
+    
+    async def _send_chunk(
+        self,
+        recipients: List[str],
+        subject: str,
+        html: str,
+        text: str,
+    ) -> bool:
+        """Send one multi-personalization request."""
+        try:
+            message = Mail(
+                from_email=Email(
+                    settings.email_from_address,
+                    settings.email_from_name,
+                ),
+                to_emails=[To(r) for r in recipients],
+                subject=subject,
+                plain_text_content=Content("text/plain", text),
+                html_content=Content("text/html", html),
+                is_multiple=True,
+            )
+            
+            response = await asyncio.to_thread(self.client.send, message)
+            success = response.status_code in (200, 201, 202)
+            
+            if success:
+                logger.info("Email batch sent", count=len(recipients), subject=subject)
+            else:
+                logger.warning(
+                    "Email batch send failed",
+                    count=len(recipients),
+                    status=response.status_code,
+                )
+            
+            return success
+            
+        except Exception as e:
+            logger.error("SendGrid error", error=str(e), count=len(recipients))
+            return False
 
 
 class EmailPublisher(Publisher):
@@ -243,10 +286,41 @@ News Town | Multi-agent news reporting
         article: Article,
         recipients: List[str],
     ) -> Dict[str, PublishResult]:
-        """Send article to multiple recipients."""
-        results = {}
-        for recipient in recipients:
-            results[recipient] = await self.send_to(article, recipient)
+        """Send article to multiple recipients through the provider's batch API."""
+        # Render once for the whole batch rather than per recipient
+        html = self._format_html(article)
+        text = self._format_text(article)
+        
+        try:
+            delivered = await self.provider.send_batch(
+                recipients,
+                article.headline,
+                html,
+                text,
+            )
+        except Exception as e:
+            logger.error("Email batch publish failed", error=str(e))
+            return {r: PublishResult(success=False, error=str(e)) for r in recipients}
+        
+        sent = [r for r in recipients if delivered.get(r)]
+        pub_ids = await asyncio.gather(*[
+            publication_store.create(
+                article_id=article.id,
+                channel=self.channel_name,
+                metadata={"recipient": recipient}
+            )
+            for recipient in sent
+        ])
+        
+        results = {
+            r: PublishResult(success=False, error="Email send failed") for r in recipients
+        }
+        for recipient, pub_id in zip(sent, pub_ids):
+            results[recipient] = PublishResult(
+                success=True,
+                publication_id=pub_id,
+                metadata={"recipient": recipient}
+            )
         return results
     
     def _format_html(self, article: Article) -> str:
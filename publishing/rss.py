@@ -101,15 +101,12 @@ class RSSPublisher(Publisher):
         Returns:
             RSS feed as XML string
         """
-        # Get recent published articles
-        publications = await publication_store.list_by_channel(
+        # Get recent live articles on this channel (single JOIN query)
+        entries = await article_store.list_published_on_channel(
             self.channel_name,
             limit=self.max_items,
         )
         
-        # Filter out retracted
-        publications = [p for p in publications if p.status == "published"]
-        
         # Create feed
         fg = FeedGenerator()
         fg.title(self.feed_title)
@@ -118,19 +115,14 @@ class RSSPublisher(Publisher):
         fg.language("en")
         
         # Add items
-        for pub in publications:
-            # Get article
-            article = await article_store.get_article(pub.article_id)
-            if not article:
-                continue
-            
+        for article, published_at in entries:
             # Create feed entry
             fe = fg.add_entry()
             fe.title(article.headline)
             fe.link(href=f"{self.feed_link}/articles/{article.id}")
             fe.description(article.summary or article.body[:200] + "...")
-            fe.published(pub.published_at)
-            fe.updated(article.updated_at or article.created_at)
+            fe.published(published_at)
+            fe.updated(article.updated_at)
             
             # Add author if available
             if article.byline:
@@ -160,7 +152,7 @@ class RSSPublisher(Publisher):
         
         logger.info(
             "RSS feed generated",
-            item_count=len(publications),
+            item_count=len(entries),
             feed_title=self.feed_title,
         )
         
@@ -1,6 +1,5 @@
 """Controlled E2E verification for the Editor flow."""
 import asyncio
-import json
 import uuid
 import sys
 import os
@@ -134,11 +133,13 @@ async def verify_pipeline():
         
         mock_search.return_value = []
         
-        # Mock analysis then claim verification (2 claims)
+        # Mock analysis then batched claim verification (2 claims)
         mock_gen.side_effect = [
-            json.dumps({"score": 0.9, "claims": ["c1", "c2"], "tone": "Objective", "style_issues": [], "grammar_issues": []}), # analyze
-            json.dumps({"supported": True, "reason": "Consistent with search"}), # verify claim 1
-            json.dumps({"supported": True, "reason": "Consistent with search"}), # verify claim 2
+            {"score": 0.9, "claims": ["c1", "c2"], "tone": "Objective", "style_issues": [], "grammar_issues": []}, # analyze
+            {"verdicts": [  # verify both claims in one batched call
+                {"supported": True, "reason": "Consistent with search"},
+                {"supported": True, "reason": "Consistent with search"},
+            ]},
         ]
         
         async with db.acquire() as conn:
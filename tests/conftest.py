@@ -36,7 +36,7 @@ async def db():
                 users, human_prompts, story_sources, articles, 
                 publications, publishing_schedule, governance_rules, 
                 approval_requests, audit_log, article_reviews,
-                story_tasks, story_events
+                story_tasks, story_events, story_memory, embedding_cache
             RESTART IDENTITY CASCADE
         """)
     
@@ -177,6 +177,52 @@ async def test_update_article(db, sample_story_id):
     assert article.updated_at > article.published_at
 
 
+@pytest.mark.asyncio
+async def test_get_article_cached_invalidated_on_update(db, sample_story_id):
+    """Test that cached lookups skip the database until the article changes."""
+    from unittest.mock import patch
+    
+    article_id = await article_store.create_article(
+        story_id=sample_story_id,
+        headline="Cached Headline",
+        body="Body",
+    )
+    
+    first = await article_store.get_article_cached(article_id)
+    with patch.object(article_store, "get_article") as get_article:
+        assert await article_store.get_article_cached(article_id) is first
+        get_article.assert_not_called()
+    
+    await article_store.update_article(article_id, headline="Fresh Headline")
+    article = await article_store.get_article_cached(article_id)
+    assert article.headline == "Fresh Headline"
+
+
+@pytest.mark.asyncio
+async def test_list_published_on_channel(db, sample_story_id):
+    """Test fetching a channel's live articles with their publication times."""
+    from db.publications import publication_store
+    
+    channel = f"test-{uuid4().hex[:8]}"
+    live_id = await article_store.create_article(
+        story_id=sample_story_id, headline="Live", body="Body", tags=["a"]
+    )
+    retracted_id = await article_store.create_article(
+        story_id=sample_story_id, headline="Retracted", body="Body", tags=["a"]
+    )
+    await publication_store.create(live_id, channel)
+    pub_id = await publication_store.create(retracted_id, channel)
+    await db.execute("UPDATE publications SET status = 'retracted' WHERE id = $1", pub_id)
+    
+    entries = await article_store.list_published_on_channel(channel)
+    
+    assert len(entries) == 1
+    article, published_at = entries[0]
+    assert article.id == live_id
+    assert article.headline == "Live"
+    assert published_at is not None
+
+
 @pytest.mark.asyncio
 async def test_update_article_sources(db, sample_story_id):
     """Test updating article sources."""
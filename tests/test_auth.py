@@ -46,3 +46,13 @@ def test_token_expiration():
     
     payload = decode_access_token(token)
     assert payload is None
+
+def test_decoded_tokens_are_cached_until_expiry():
+    from unittest.mock import patch
+    from api import auth
+    
+    token = create_access_token({"sub": "carol"}, expires_delta=timedelta(minutes=5))
+    assert decode_access_token(token)["sub"] == "carol"
+    
+    with patch.object(auth.jwt, "decode", side_effect=AssertionError("not cached")):
+        assert decode_access_token(token)["sub"] == "carol"
@@ -0,0 +1,115 @@
+"""Tests for the in-process cache."""
+import asyncio
+import pytest
+from cache import TTLCache, cache_key
+
+
+def test_cache_key_is_stable_and_separated():
+    """Keys are deterministic and part boundaries matter."""
+    assert cache_key("a", "b") == cache_key("a", "b")
+    assert cache_key("ab", "c") != cache_key("a", "bc")
+
+
+def test_ttl_cache_lru_eviction():
+    """Least recently used entry is evicted when full."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_delete():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.delete("a")
+    cache.delete("missing")
+    
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_expiry():
+    """Expired entries are treated as missing."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("a", 1, ttl=-1)
+    
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_coalesces_concurrent_misses():
+    """Concurrent callers for one key share a single computation."""
+    cache = TTLCache()
+    calls = 0
+    
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+    
+    results = await asyncio.gather(*[cache.get_or_compute("k", compute) for _ in range(5)])
+    
+    assert results == ["value"] * 5
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_does_not_cache_failures():
+    """A failed computation is retried on the next call."""
+    cache = TTLCache()
+    
+    async def boom():
+        raise RuntimeError("nope")
+    
+    async def ok():
+        return 42
+    
+    with pytest.raises(RuntimeError):
+        await cache.get_or_compute("k", boom)
+    
+    assert await cache.get_or_compute("k", ok) == 42
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_owner_cancelled_waiter_retries():
+    """Cancelling the computing caller doesn't cancel callers waiting on it."""
+    cache = TTLCache()
+    calls = 0
+    
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+    
+    owner = asyncio.create_task(cache.get_or_compute("k", compute))
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(cache.get_or_compute("k", compute))
+    await asyncio.sleep(0)
+    
+    owner.cancel()
+    
+    assert await waiter == "value"
+    assert calls == 2
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+
+
+@pytest.mark.asyncio
+async def test_get_or_compute_ttl_override():
+    """A per-call ttl overrides the cache default for the computed value."""
+    cache = TTLCache(ttl=3600)
+    
+    async def compute():
+        return "value"
+    
+    await cache.get_or_compute("k", compute, ttl=-1)
+    
+    assert cache.get("k") is None
@@ -155,3 +155,23 @@ async def test_chief_recovers_stalled_tasks(db):
     task = await task_queue.get_task(task_id)
     assert task.status.value == "pending"
     assert task.assigned_agent is None
+
+
+@pytest.mark.asyncio
+async def test_chief_dispatches_human_prompts_once(db, sample_detection_event):
+    """Test Chief turns pending prompts into research tasks exactly once."""
+    from db.human_oversight import human_prompt_store
+    
+    story_id = uuid4()
+    await event_store.append(story_id, "story.detected", sample_detection_event)
+    for text in ("Who funded this?", "What did the mayor say?"):
+        await human_prompt_store.create_prompt(story_id=story_id, prompt_text=text, created_by="user")
+    
+    chief = Chief()
+    
+    assert await chief.process_human_prompts() == 2
+    tasks = await task_queue.get_story_tasks(story_id)
+    assert sorted(t.input["human_prompt_text"] for t in tasks) == ["What did the mayor say?", "Who funded this?"]
+    
+    # Prompts are marked processing, so the next cycle dispatches nothing
+    assert await chief.process_human_prompts() == 0
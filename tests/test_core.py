@@ -70,6 +70,129 @@ async def test_agent_task_processing():
     assert agent.status.value == "idle"
 
 
+@pytest.mark.asyncio
+async def test_process_task_times_out_hung_handler(monkeypatch):
+    """Test that a hung handle_task is failed by the watchdog."""
+    import asyncio
+    from agents import base
+    from config.settings import settings
+    
+    class HungAgent(MockAgent):
+        async def handle_task(self, task):
+            await asyncio.sleep(10)
+    
+    agent = HungAgent()
+    agent.heartbeat = AsyncMock()
+    agent.log_event = AsyncMock()
+    fail = AsyncMock()
+    monkeypatch.setattr(base.task_queue, "fail_and_heartbeat", fail)
+    monkeypatch.setattr(settings, "task_timeout_seconds", 0.05)
+    
+    await agent.process_task(Task(story_id=uuid4(), stage=TaskStage.RESEARCH))
+    
+    assert "timed out" in fail.call_args.args[1]
+    assert agent.success_count == 0
+    assert set(agent.task_duration_percentiles()) == {"p50", "p99"}
+
+
+@pytest.mark.asyncio
+async def test_process_task_fails_on_stray_cancellation(monkeypatch):
+    """Test that a CancelledError not aimed at the worker fails the task."""
+    import asyncio
+    from agents import base
+    
+    class CancelledAgent(MockAgent):
+        async def handle_task(self, task):
+            raise asyncio.CancelledError()
+    
+    agent = CancelledAgent()
+    agent.heartbeat = AsyncMock()
+    agent.log_event = AsyncMock()
+    fail = AsyncMock()
+    monkeypatch.setattr(base.task_queue, "fail_and_heartbeat", fail)
+    
+    # Returns normally, so the dispatch worker running it stays alive
+    await agent.process_task(Task(story_id=uuid4(), stage=TaskStage.RESEARCH))
+    
+    assert fail.call_args.args[1] == "CancelledError"
+    assert agent.task_count == 1
+
+
+@pytest.mark.asyncio
+async def test_poll_loop_claims_only_free_workers(monkeypatch):
+    """Test that each claim round is capped by the idle worker count."""
+    from agents import base
+    from config.settings import settings
+    
+    agent = MockAgent()
+    agent.heartbeat = AsyncMock()
+    agent.wait_for_tasks = AsyncMock()
+    
+    async def claim_many(agent_id, role, limit):
+        agent._running = False
+        return []
+    
+    claim = AsyncMock(side_effect=claim_many)
+    monkeypatch.setattr(base.task_queue, "claim_many", claim)
+    monkeypatch.setattr(settings, "max_concurrent_tasks", 3)
+    monkeypatch.setattr(settings, "claim_batch_size", 5)
+    
+    agent._running = True
+    agent._active_tasks = 2
+    await agent._poll_loop()
+    
+    assert claim.call_args.args[2] == 1
+
+
+@pytest.mark.asyncio
+async def test_stop_finishes_in_flight_and_releases_queued_tasks(monkeypatch):
+    """Test that stop lets running tasks complete and hands back unstarted ones."""
+    import asyncio
+    from agents import base
+    from config.settings import settings
+    
+    gate = asyncio.Event()
+    started = asyncio.Event()
+    
+    class SlowAgent(MockAgent):
+        async def handle_task(self, task):
+            started.set()
+            await gate.wait()
+            return {"status": "success"}
+    
+    running = Task(story_id=uuid4(), stage=TaskStage.RESEARCH)
+    queued = Task(story_id=uuid4(), stage=TaskStage.RESEARCH)
+    
+    agent = SlowAgent()
+    agent.register = AsyncMock()
+    agent.listen_for_tasks = AsyncMock()
+    agent.heartbeat = AsyncMock()
+    agent.log_event = AsyncMock()
+    complete = AsyncMock()
+    release = AsyncMock()
+    monkeypatch.setattr(base.task_queue, "claim_many", AsyncMock(side_effect=[[running]]))
+    monkeypatch.setattr(base.task_queue, "complete_and_heartbeat", complete)
+    monkeypatch.setattr(base.task_queue, "release_many", release)
+    monkeypatch.setattr(settings, "max_concurrent_tasks", 1)
+    
+    runner = asyncio.create_task(agent.run())
+    await asyncio.wait_for(started.wait(), timeout=1)
+    # Claimed but waiting behind the busy worker
+    agent._task_channel.put_nowait(queued)
+    
+    stopper = asyncio.create_task(agent.stop())
+    await asyncio.sleep(0.01)
+    assert not stopper.done()
+    release.assert_awaited_once_with([queued.id], agent.agent_id)
+    
+    gate.set()
+    await asyncio.wait_for(stopper, timeout=1)
+    await asyncio.wait_for(runner, timeout=1)
+    
+    assert complete.call_args.args[0] == running.id
+    assert agent.success_count == 1
+
+
 def test_agent_roles():
     """Test agent role enum."""
     assert AgentRole.CHIEF.value == "chief"
@@ -87,3 +210,62 @@ def test_task_stages():
     assert TaskStage.EDIT.value == "edit"
     assert TaskStage.REVIEW.value == "review"
     assert TaskStage.PUBLISH.value == "publish"
+
+
+@pytest.mark.asyncio
+async def test_agent_wakes_on_task_notification():
+    """Test that a NOTIFY callback wakes an idle agent before the poll interval."""
+    import asyncio
+    
+    agent = MockAgent()
+    
+    waiter = asyncio.create_task(agent.wait_for_tasks())
+    await asyncio.sleep(0)
+    agent._on_task_notification(None, 0, "tasks_reporter", "")
+    
+    await asyncio.wait_for(waiter, timeout=1)
+    assert not agent._new_task_event.is_set()
+
+
+@pytest.mark.asyncio
+async def test_periodic_heartbeat_skipped_after_recent_write():
+    """Test that the periodic heartbeat is skipped while the agent row is fresh."""
+    import time
+    from agents.base import AgentStatus
+    from config.settings import settings
+    
+    agent = MockAgent()
+    agent.heartbeat = AsyncMock()
+    
+    agent._last_heartbeat_at = time.monotonic()
+    await agent.heartbeat_if_stale(agent._heartbeat_interval())
+    agent.heartbeat.assert_not_called()
+    
+    # Idle agents back off further than working ones
+    assert agent._heartbeat_interval() == settings.idle_heartbeat_backoff_seconds
+    agent.status = AgentStatus.WORKING
+    assert agent._heartbeat_interval() == settings.agent_heartbeat_interval_seconds
+    
+    agent._last_heartbeat_at -= settings.agent_heartbeat_interval_seconds
+    await agent.heartbeat_if_stale(agent._heartbeat_interval())
+    agent.heartbeat.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_batching_appender_coalesces_events():
+    """Test that concurrent appends share one batched write."""
+    import asyncio
+    from db.events import BatchingAppender
+    
+    store = Mock()
+    store.append_many = AsyncMock(side_effect=lambda events: list(range(1, len(events) + 1)))
+    appender = BatchingAppender(store, max_batch=10)
+    story_id = uuid4()
+    
+    ids = await asyncio.gather(*[
+        appender.submit(story_id, "test.event", {"n": n}) for n in range(3)
+    ])
+    await appender.close()
+    
+    assert sorted(ids) == [1, 2, 3]
+    assert store.append_many.await_count < 3
@@ -65,3 +65,70 @@ async def test_health_check():
         response = await ac.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
+
+@pytest.mark.asyncio
+async def test_no_cors_headers_without_configured_origins():
+    """Cross-origin requests get no CORS grant unless origins are configured."""
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get("/health", headers={"Origin": "http://evil.example"})
+    assert response.status_code == 200
+    assert "access-control-allow-origin" not in response.headers
+
+@pytest.mark.asyncio
+async def test_dashboard_payloads_cached_with_stale_fallback():
+    """Repeat requests share one computation; a failed refresh serves the last good payload."""
+    from api import dashboard
+    calls = 0
+    
+    async def compute():
+        nonlocal calls
+        calls += 1
+        return {"calls": calls}
+    
+    async def boom():
+        raise RuntimeError("database down")
+    
+    key = "test-payload"
+    assert await dashboard._cached(key, "quality", compute) == {"calls": 1}
+    assert await dashboard._cached(key, "quality", compute) == {"calls": 1}
+    
+    dashboard._response_cache.delete(key)
+    assert await dashboard._cached(key, "quality", boom) == {"calls": 1}
+    
+    dashboard._stale_responses.delete(key)
+    with pytest.raises(RuntimeError):
+        await dashboard._cached(key, "quality", boom)
+
+@pytest.mark.asyncio
+async def test_dashboard_cache_ttl_follows_generation_time():
+    """Slow payloads stay cached longer, within the endpoint's bounds."""
+    from unittest.mock import patch
+    from api import dashboard
+    
+    async def compute():
+        return {}
+    
+    with patch.object(dashboard._response_cache, "set") as mock_set, \
+         patch.object(dashboard.time, "perf_counter", side_effect=[0.0, 4.0]):
+        await dashboard._cached("test-slow", "quality", compute)
+    
+    assert mock_set.call_args.args == ("test-slow", {}, 40.0)
+
+@pytest.mark.asyncio
+async def test_record_response_matches_jsonable_encoder(db):
+    """Records serialize to the same JSON FastAPI's encoder produced from row dicts."""
+    from decimal import Decimal
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import ORJSONResponse
+    from api.dashboard import RecordJSONResponse
+    
+    rows = await db.fetch("""
+        SELECT gen_random_uuid() AS id, 'Storm hits coast' AS title,
+               now() AS last_activity, 2.5::NUMERIC AS avg_revisions, 3::NUMERIC AS volume
+    """)
+    payload = {"trends": rows, "avg_revisions": Decimal("1.5")}
+    expected = ORJSONResponse(jsonable_encoder({
+        "trends": [dict(row) for row in rows], "avg_revisions": Decimal("1.5"),
+    }))
+    
+    assert RecordJSONResponse(payload).body == expected.body
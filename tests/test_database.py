@@ -116,6 +116,47 @@ async def test_task_queue_concurrent_claim(db, sample_story_id):
     assert len(successful_claims) == 1
 
 
+@pytest.mark.asyncio
+async def test_task_queue_claim_many(db, sample_story_id):
+    """Test claiming a batch of tasks in one round-trip."""
+    for _ in range(3):
+        await task_queue.create(
+            story_id=sample_story_id,
+            stage=TaskStage.RESEARCH,
+        )
+    
+    agent_id = uuid4()
+    claimed = await task_queue.claim_many(agent_id, "reporter", 2)
+    
+    assert len(claimed) == 2
+    assert all(t.assigned_agent == agent_id for t in claimed)
+    
+    # Only one task left to claim
+    remaining = await task_queue.claim_many(uuid4(), "reporter", 5)
+    assert len(remaining) == 1
+
+
+@pytest.mark.asyncio
+async def test_task_queue_release_many(db, sample_story_id):
+    """Test handing unstarted claimed tasks back to the pending queue."""
+    await task_queue.create(
+        story_id=sample_story_id,
+        stage=TaskStage.RESEARCH,
+    )
+    
+    agent_id = uuid4()
+    claimed = await task_queue.claim_many(agent_id, "reporter", 1)
+    await task_queue.release_many([t.id for t in claimed], agent_id)
+    
+    task = await task_queue.get_task(claimed[0].id)
+    assert task.status == TaskStatus.PENDING
+    assert task.assigned_agent is None
+    
+    # Another agent can pick it up straight away
+    reclaimed = await task_queue.claim_many(uuid4(), "reporter", 5)
+    assert [t.id for t in reclaimed] == [claimed[0].id]
+
+
 @pytest.mark.asyncio
 async def test_task_queue_complete(db, sample_story_id):
     """Test completing a task."""
@@ -159,6 +200,32 @@ async def test_task_queue_fail(db, sample_story_id):
     assert task.output["error"] == "Something went wrong"
 
 
+@pytest.mark.asyncio
+async def test_task_queue_complete_and_heartbeat(db, sample_story_id):
+    """Test completing a task and refreshing the agent row in one statement."""
+    task_id = await task_queue.create(
+        story_id=sample_story_id,
+        stage=TaskStage.RESEARCH,
+    )
+    
+    agent_id = uuid4()
+    await db.execute(
+        "INSERT INTO agents (id, role, status) VALUES ($1, 'reporter', 'working')",
+        agent_id,
+    )
+    await task_queue.claim(agent_id, "reporter")
+    
+    await task_queue.complete_and_heartbeat(task_id, {"result": "success"}, agent_id, "idle")
+    
+    task = await task_queue.get_task(task_id)
+    assert task.status == TaskStatus.COMPLETED
+    assert task.output == {"result": "success"}
+    
+    agent = await db.fetchrow("SELECT status, last_heartbeat FROM agents WHERE id = $1", agent_id)
+    assert agent["status"] == "idle"
+    assert agent["last_heartbeat"] is not None
+
+
 @pytest.mark.asyncio
 async def test_task_priority_ordering(db, sample_story_id):
     """Test that higher priority tasks are claimed first."""
@@ -174,3 +241,154 @@ async def test_task_priority_ordering(db, sample_story_id):
     # Should get the highest priority task
     assert claimed.id == high_priority_id
     assert claimed.priority == 9
+
+
+@pytest.mark.asyncio
+async def test_event_store_append_many(db, sample_story_id):
+    """Test appending a batch of events in one INSERT."""
+    from db.events import Event
+    
+    event_ids = await event_store.append_many([
+        Event(story_id=sample_story_id, event_type="test.one", data={"n": 1}),
+        Event(story_id=sample_story_id, event_type="test.two", data={"n": 2}),
+    ])
+    
+    assert len(event_ids) == 2
+    events = await event_store.get_story_events(sample_story_id)
+    assert [e.event_type for e in events] == ["test.one", "test.two"]
+    assert events[1].data == {"n": 2}
+
+
+@pytest.mark.asyncio
+async def test_event_store_append_many_copy(db, sample_story_id, monkeypatch):
+    """Test that large batches are bulk-loaded with COPY and keep their IDs."""
+    from db.events import Event
+    from config.settings import settings
+    
+    monkeypatch.setattr(settings, "event_copy_threshold", 3)
+    event_ids = await event_store.append_many([
+        Event(story_id=sample_story_id, event_type=f"test.{n}", data={"n": n})
+        for n in range(3)
+    ])
+    
+    assert len(set(event_ids)) == 3
+    events = {e.id: e for e in await event_store.get_story_events(sample_story_id)}
+    assert [events[i].data for i in event_ids] == [{"n": 0}, {"n": 1}, {"n": 2}]
+
+
+@pytest.mark.asyncio
+async def test_article_review_create_with_completion(db, sample_story_id):
+    """Test persisting a review with its task completion and event in one statement."""
+    from db.governance import article_review_store
+
+    task_id = await task_queue.create(
+        story_id=sample_story_id,
+        stage=TaskStage.REVIEW,
+    )
+
+    agent_id = uuid4()
+    await db.execute(
+        "INSERT INTO agents (id, role, status) VALUES ($1, 'editor', 'working')",
+        agent_id,
+    )
+    await task_queue.claim(agent_id, "editor")
+
+    review_id = await article_review_store.create_with_completion(
+        task_id=task_id,
+        task_output={"decision": "APPROVE", "score": 0.9},
+        event_type="task.completed.review",
+        agent_status="idle",
+        story_id=sample_story_id,
+        editor_agent_id=agent_id,
+        score=0.9,
+        decision="APPROVE",
+    )
+
+    review = await db.fetchrow("SELECT * FROM article_reviews WHERE id = $1", review_id)
+    assert review["decision"] == "APPROVE"
+
+    task = await task_queue.get_task(task_id)
+    assert task.status == TaskStatus.COMPLETED
+    assert task.output == {"decision": "APPROVE", "score": 0.9}
+
+    events = await event_store.get_story_events(sample_story_id)
+    assert [e.event_type for e in events] == ["task.completed.review"]
+    assert events[0].agent_id == agent_id
+
+
+@pytest.mark.asyncio
+async def test_agent_register_and_heartbeat_use_server_time(db):
+    """Test that register/heartbeat stamp last_heartbeat with the server clock."""
+    from agents.base import BaseAgent, AgentRole, AgentStatus
+    
+    class _Agent(BaseAgent):
+        async def handle_task(self, task):
+            return {}
+    
+    agent = _Agent(AgentRole.REPORTER)
+    await agent.register()
+    registered = await db.fetchval("SELECT last_heartbeat FROM agents WHERE id = $1", agent.agent_id)
+    
+    agent.status = AgentStatus.WORKING
+    await agent.heartbeat()
+    row = await db.fetchrow("SELECT status, last_heartbeat FROM agents WHERE id = $1", agent.agent_id)
+    
+    assert row["status"] == "working"
+    assert row["last_heartbeat"] >= registered
+
+
+@pytest.mark.asyncio
+async def test_memory_store_similarity_roundtrip(db, sample_story_id):
+    """Test memories stored via compact vector literals are found by similarity."""
+    from db.memory import memory_store, vector_literal
+    
+    assert vector_literal([0.1, -0.5, 1.0]) == "[0.1,-0.5,1]"
+    
+    dim = await db.fetchval(
+        "SELECT atttypmod FROM pg_attribute "
+        "WHERE attrelid = 'story_memory'::regclass AND attname = 'embedding'"
+    )
+    embedding = [0.0] * dim
+    embedding[0] = 0.6
+    embedding[1] = 0.8
+    other = [0.0] * dim
+    other[2] = 1.0
+    
+    await memory_store.add(sample_story_id, "Storm hits coast", embedding)
+    await memory_store.add(uuid4(), "Unrelated", other)
+    
+    similar = await memory_store.find_similar_stories(embedding, threshold=0.9, limit=3)
+    
+    assert [m["story_id"] for m in similar] == [sample_story_id]
+    assert similar[0]["similarity"] == pytest.approx(1.0)
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_store_roundtrip(db):
+    """Test persisted embeddings come back byte-for-byte and expire."""
+    import numpy as np
+    from db.memory import embedding_cache_store
+    
+    vector = np.array([0.25, -1.0, 3.5], dtype=np.float32)
+    await embedding_cache_store.put_many({"k1": vector.tobytes()}, max_age_seconds=3600)
+    
+    cached = await embedding_cache_store.get_many(["k1", "missing"], max_age_seconds=3600)
+    assert list(cached) == ["k1"]
+    assert np.frombuffer(cached["k1"], dtype=np.float32).tolist() == [0.25, -1.0, 3.5]
+    
+    await db.execute("UPDATE embedding_cache SET created_at = now() - interval '2 hours'")
+    assert await embedding_cache_store.get_many(["k1"], max_age_seconds=3600) == {}
+
+
+@pytest.mark.asyncio
+async def test_article_review_daily_rollup(db, sample_story_id):
+    """Test that refreshing the daily rollup aggregates review volume and rejections."""
+    from db.governance import article_review_store
+
+    await article_review_store.create(sample_story_id, uuid4(), 0.8, "APPROVE")
+    await article_review_store.create(sample_story_id, uuid4(), 0.4, "REJECT")
+    await article_review_store.refresh_daily_rollup()
+
+    row = await db.fetchrow("SELECT SUM(volume) AS volume, SUM(rejected) AS rejected FROM article_reviews_daily")
+    assert row["volume"] == 2
+    assert row["rejected"] == 1
@@ -37,10 +37,10 @@ async def test_editor_decision_logic(editor):
             mock_verify.return_value = {"claims_checked": 1, "verified_count": 1, "details": {}}
             with patch.object(editor, "heartbeat", new_callable=AsyncMock), \
                  patch.object(editor, "log_event", new_callable=AsyncMock), \
-                 patch("agents.base.task_queue.complete", new_callable=AsyncMock):
+                 patch("agents.base.task_queue.complete_and_heartbeat", new_callable=AsyncMock):
                 
                 result = await editor.process_task(task)
-                # Note: process_task returns None, the output is sent to task_queue.complete
+                # Note: process_task returns None, the output is sent to task_queue.complete_and_heartbeat
                 # But we can check if it completed successfully
                 assert editor.success_count == 1
 
@@ -67,3 +67,145 @@ async def test_compile_feedback(editor):
     assert "Too wordy" in feedback
     assert "Claim 1" in feedback
     assert "No evidence" in feedback
+
+@pytest.mark.asyncio
+async def test_verify_claims_batches_llm_and_isolates_failures(editor):
+    """Claims share one LLM request; a failing search must not sink the others."""
+    async def fake_search(claim):
+        if claim == "bad":
+            raise RuntimeError("search down")
+        return f"context for {claim} {uuid4()}"
+    
+    verdicts = {"verdicts": [{"supported": True, "reason": "ok"}, {"supported": True, "reason": "ok"}]}
+    with patch.object(editor, "_search_context", side_effect=fake_search), \
+         patch.object(editor.chat_service, "generate", new_callable=AsyncMock, return_value=verdicts) as mock_gen:
+        result = await editor._verify_claims(["c1", "bad", "c2"])
+    
+    mock_gen.assert_awaited_once()
+    assert result["claims_checked"] == 3
+    assert result["verified_count"] == 2
+    assert result["details"]["bad"] == {"supported": False, "reason": "Verification failed"}
+    assert list(result["details"]) == ["c1", "bad", "c2"]
+
+@pytest.mark.asyncio
+async def test_verify_claims_rejects_malformed_batch_verdicts(editor):
+    """A verdict without a bool "supported" fails its claim and isn't cached."""
+    from agents.editor import _claim_support_cache
+    from cache import cache_key
+    
+    contexts = {"c1": f"context {uuid4()}", "c2": f"context {uuid4()}", "c3": f"context {uuid4()}"}
+    verdicts = {"verdicts": [{"supported": True, "reason": "ok"}, {"reason": "unsure"}, "yes"]}
+    with patch.object(editor, "_search_context", side_effect=lambda claim: contexts[claim]), \
+         patch.object(editor.chat_service, "generate", new_callable=AsyncMock, return_value=verdicts):
+        result = await editor._verify_claims(["c1", "c2", "c3"])
+    
+    assert result["verified_count"] == 1
+    assert result["details"]["c2"] == {"supported": False, "reason": "LLM output parse error"}
+    assert result["details"]["c3"] == {"supported": False, "reason": "LLM output parse error"}
+    assert _claim_support_cache.get(cache_key("c1", contexts["c1"])) is not None
+    assert _claim_support_cache.get(cache_key("c2", contexts["c2"])) is None
+
+def test_extract_json_skips_prose_and_string_braces():
+    from agents.llm import extract_json
+    
+    content = 'Sure! {"reason": "uses } and { inside", "supported": true} Hope that {helps}.'
+    assert extract_json(content) == {"reason": "uses } and { inside", "supported": True}
+    assert extract_json('Queries: ["a ]", "b"] done', opener="[") == ["a ]", "b"]
+    
+    with pytest.raises(ValueError):
+        extract_json("no json here")
+    with pytest.raises(ValueError):
+        extract_json('{"unterminated": ')
+
+@pytest.mark.asyncio
+async def test_chat_service_structured_output_uses_forced_tool():
+    from types import SimpleNamespace
+    from agents.llm import ChatService
+    from agents.editor import CLAIM_SUPPORT_SCHEMA
+    
+    service = ChatService()
+    service.provider = "anthropic"
+    service.client = SimpleNamespace(messages=SimpleNamespace(create=AsyncMock(
+        return_value=SimpleNamespace(content=[
+            SimpleNamespace(type="tool_use", input={"supported": True, "reason": "ok"})
+        ])
+    )))
+    
+    result = await service.generate(
+        messages=[{"role": "user", "content": "Claim"}],
+        json_schema=CLAIM_SUPPORT_SCHEMA,
+    )
+    
+    assert result == {"supported": True, "reason": "ok"}
+    kwargs = service.client.messages.create.call_args.kwargs
+    assert kwargs["tool_choice"] == {"type": "tool", "name": "emit"}
+    assert kwargs["tools"][0]["input_schema"] is CLAIM_SUPPORT_SCHEMA
+
+@pytest.mark.asyncio
+async def test_claim_support_uses_fastcheck_model(editor):
+    with patch.object(editor.chat_service, "generate", new_callable=AsyncMock) as mock_gen:
+        mock_gen.return_value = {"supported": True, "reason": "ok"}
+        result = await editor._ask_claim_support("Claim", "Context")
+    
+    assert result["supported"] is True
+    assert mock_gen.call_args.kwargs["model"] == editor.chat_service.fastcheck_model
+
+@pytest.mark.asyncio
+async def test_verify_claims_dedupes_repeated_claims(editor):
+    """Reworded repeats of a claim are searched and checked only once."""
+    search = AsyncMock(side_effect=lambda claim: f"context {uuid4()}")
+    with patch.object(editor, "_search_context", search), \
+         patch.object(editor.chat_service, "generate", new_callable=AsyncMock,
+                      return_value={"supported": True, "reason": "ok"}) as mock_gen:
+        result = await editor._verify_claims(["Sales rose 5%.", "  sales   rose 5%", "Sales rose 5%"])
+    
+    assert search.await_count == 1
+    mock_gen.assert_awaited_once()
+    assert result["claims_checked"] == 3
+    assert result["verified_count"] == 3
+    assert set(result["details"]) == {"Sales rose 5%.", "  sales   rose 5%", "Sales rose 5%"}
+
+def test_chat_service_builds_client_lazily():
+    from agents.llm import ChatService
+    
+    service = ChatService()
+    assert service._client is None
+    
+    client = service.client
+    assert client is not None
+    assert service.client is client
+
+@pytest.mark.asyncio
+async def test_chat_service_stream_yields_local_deltas():
+    from types import SimpleNamespace
+    from agents.llm import ChatService
+    
+    class FakeStream:
+        def __init__(self, deltas):
+            self._chunks = [
+                SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=d))])
+                for d in deltas
+            ]
+            self.close = AsyncMock()
+        
+        def __aiter__(self):
+            return self._iter()
+        
+        async def _iter(self):
+            for chunk in self._chunks:
+                yield chunk
+    
+    response = FakeStream(["Hello", None, " world"])
+    service = ChatService()
+    service.provider = "local"
+    service.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(
+        create=AsyncMock(return_value=response)
+    )))
+    
+    chunks = [c async for c in service.stream(messages=[{"role": "user", "content": "Hi"}], system="S")]
+    
+    assert chunks == ["Hello", " world"]
+    kwargs = service.client.chat.completions.create.call_args.kwargs
+    assert kwargs["stream"] is True
+    assert kwargs["messages"][0] == {"role": "system", "content": "S"}
+    response.close.assert_awaited_once()
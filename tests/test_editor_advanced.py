@@ -11,10 +11,11 @@ async def test_editor_ap_style_analysis():
     
     # Mock chat service
     with mock.patch.object(agent.chat_service, 'generate') as mock_gen:
-        mock_gen.return_value = '{"claims": ["Fact 1"], "tone": "Biased", "ap_violations": ["Oxford comma used", "Lowercase title"], "style_issues": [], "grammar_issues": [], "score": 0.5}'
+        mock_gen.return_value = {"claims": ["Fact 1"], "tone": "Biased", "ap_violations": ["Oxford comma used", "Lowercase title"], "style_issues": [], "grammar_issues": [], "score": 0.5}
         
         analysis = await agent._analyze_text("Test article text.")
         
+        assert mock_gen.call_args.kwargs["json_schema"] is not None
         assert "ap_violations" in analysis
         assert len(analysis["ap_violations"]) == 2
         assert analysis["tone"] == "Biased"
@@ -33,11 +34,12 @@ async def test_editor_review_persistence():
     # Mock analyze, verify, and store
     with mock.patch.object(agent, '_analyze_text', return_value={"claims": [], "score": 0.9, "ap_violations": []}), \
          mock.patch.object(agent, '_verify_claims', return_value={"claims_checked": 0, "verified_count": 0, "details": {}}), \
-         mock.patch("db.governance.article_review_store.create") as mock_create:
+         mock.patch("db.governance.article_review_store.create_with_completion") as mock_create:
         
         mock_create.return_value = uuid4()
         
         result = await agent.review_article(task)
+        await agent.complete_task(task, result)
         
         assert result["decision"] == "APPROVE"
         mock_create.assert_called_once()
@@ -45,6 +47,7 @@ async def test_editor_review_persistence():
         args, kwargs = mock_create.call_args
         assert kwargs["decision"] == "APPROVE"
         assert kwargs["score"] >= 0.8
+        assert kwargs["task_id"] == task.id
 
 @pytest.mark.asyncio
 async def test_editor_rejection_criteria():
@@ -110,6 +110,24 @@ async def test_mark_prompt_processing(db, sample_story_id):
     assert history[0].status == "processing"
 
 
+@pytest.mark.asyncio
+async def test_mark_many_prompts_processing(db, sample_story_id):
+    """Test marking a batch of prompts as processing at once."""
+    prompt_ids = [
+        await human_prompt_store.create_prompt(
+            story_id=sample_story_id,
+            prompt_text=f"Question {i}",
+            created_by="user",
+        )
+        for i in range(3)
+    ]
+    
+    await human_prompt_store.mark_processing_many(prompt_ids[:2])
+    
+    pending = await human_prompt_store.get_pending_prompts(sample_story_id)
+    assert [p.id for p in pending] == [prompt_ids[2]]
+
+
 @pytest.mark.asyncio
 async def test_add_url_source(db, sample_story_id):
     """Test adding a URL source to a story."""
@@ -0,0 +1,109 @@
+"""Tests for the publisher agent."""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+from agents.publisher import PublisherAgent
+from db import Task, TaskStage
+
+
+@pytest.mark.asyncio
+async def test_publish_channels_concurrently():
+    """Channels are dispatched concurrently and fail independently."""
+    agent = PublisherAgent()
+    agent.log_event = AsyncMock()
+    task = Task(
+        story_id=uuid4(),
+        stage=TaskStage.PUBLISH,
+        input={"article_id": str(uuid4()), "channels": ["rss", "bluesky", "fax"]},
+    )
+    
+    both_started = asyncio.Event()
+    started = []
+    
+    async def slow_publish(article):
+        started.append(article)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return Mock(success=True, publication_id=None, error=None)
+    
+    bluesky = Mock(publish=AsyncMock(side_effect=slow_publish))
+    with patch("agents.publisher.article_store.get_article_cached", new_callable=AsyncMock, return_value=Mock()), \
+         patch("agents.publisher.publication_store.list_by_article", new_callable=AsyncMock, return_value=[]), \
+         patch("agents.publisher.rss_publisher.publish", side_effect=slow_publish), \
+         patch("agents.publisher.bluesky_publisher", bluesky):
+        result = await agent.publish(task)
+    
+    assert result["results"]["rss"]["success"] is True
+    assert result["results"]["bluesky"]["success"] is True
+    assert result["results"]["fax"] == {"success": False, "error": "Unknown channel: fax"}
+    assert result["success_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_publish_retry_skips_already_published_channels():
+    """A retried task reuses live publications instead of publishing again."""
+    agent = PublisherAgent()
+    agent.log_event = AsyncMock()
+    task = Task(
+        story_id=uuid4(),
+        stage=TaskStage.PUBLISH,
+        input={
+            "article_id": str(uuid4()),
+            "channels": ["rss", "email"],
+            "recipients": ["a@x.com", "b@x.com"],
+        },
+    )
+    rss_pub = Mock(id=uuid4(), channel="rss", status="published", metadata={})
+    email_pub = Mock(id=uuid4(), channel="email", status="published", metadata={"recipient": "a@x.com"})
+    retracted = Mock(id=uuid4(), channel="email", status="retracted", metadata={"recipient": "b@x.com"})
+    email = Mock(send_batch=AsyncMock(return_value={"b@x.com": Mock(success=True)}))
+    
+    with patch("agents.publisher.article_store.get_article_cached", new_callable=AsyncMock, return_value=Mock()), \
+         patch("agents.publisher.publication_store.list_by_article", new_callable=AsyncMock,
+               return_value=[rss_pub, email_pub, retracted]), \
+         patch("agents.publisher.rss_publisher.publish", new_callable=AsyncMock) as rss_publish, \
+         patch("agents.publisher.email_publisher", email):
+        result = await agent.publish(task)
+    
+    rss_publish.assert_not_awaited()
+    assert result["results"]["rss"]["publication_id"] == str(rss_pub.id)
+    assert result["results"]["rss"]["already_published"] is True
+    assert email.send_batch.call_args.args[1] == ["b@x.com"]
+    assert result["results"]["email"] == {"success": True, "sent": 2, "total": 2}
+
+
+@pytest.mark.asyncio
+async def test_publish_rejects_invalid_input():
+    """Missing or malformed article ids fail before any lookup."""
+    agent = PublisherAgent()
+    
+    with patch("agents.publisher.article_store.get_article_cached", new_callable=AsyncMock) as get:
+        with pytest.raises(ValueError):
+            await agent.publish(Task(story_id=uuid4(), stage=TaskStage.PUBLISH, input={}))
+        with pytest.raises(ValueError):
+            await agent.publish(Task(story_id=uuid4(), stage=TaskStage.PUBLISH, input={"article_id": "nope"}))
+    
+    get.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_email_send_batch_uses_provider_batch(monkeypatch):
+    """Emails are rendered once and sent through the provider in chunks."""
+    from publishing.email import EmailPublisher, SendGridProvider
+    from config.settings import settings
+    
+    monkeypatch.setattr(settings, "email_batch_size", 2)
+    provider = SendGridProvider("test-key")
+    provider.client = Mock()
+    provider.client.send = Mock(side_effect=[Mock(status_code=202), Mock(status_code=500)])
+    publisher = EmailPublisher(provider=provider)
+    article = Mock(id=uuid4(), headline="Headline", byline=None, summary=None, body="Body", sources=[])
+    
+    with patch("publishing.email.publication_store.create", new_callable=AsyncMock, return_value=uuid4()) as create:
+        results = await publisher.send_batch(article, ["a@x.com", "b@x.com", "c@x.com"])
+    
+    assert provider.client.send.call_count == 2
+    assert [r.success for r in results.values()] == [True, True, False]
+    assert create.await_count == 2
@@ -51,3 +51,32 @@ async def test_editor_source_diversity():
         {"url": "https://ap.org/c", "type": "corroboration"}
     ]
     assert agent._check_source_diversity(sources_high) == 1.0
+
+@pytest.mark.asyncio
+async def test_editor_source_diversity_uses_domain():
+    """Precomputed domains are used and www./case variants collapse."""
+    agent = EditorAgent()
+    
+    sources = [
+        {"url": "https://www.News.com/a", "type": "original"},
+        {"url": "https://news.com/b", "domain": "news.com", "type": "corroboration"},
+    ]
+    assert agent._check_source_diversity(sources) == 0.0
+    
+    sources.append({"url": "https://ignored.example/c", "domain": "reuters.com"})
+    assert agent._check_source_diversity(sources) == 0.5
+
+def test_reporter_reliability_scoring_by_domain():
+    """Verify reliability tiers match on domain (including subdomains), not URL substrings."""
+    agent = ReporterAgent()
+    
+    assert agent._score_reliability("reuters.com") == 0.9
+    assert agent._score_reliability("edition.bbc.co.uk") == 0.9
+    assert agent._score_reliability("census.gov") == 0.9
+    assert agent._score_reliability("ox.ac.uk") == 0.5
+    assert agent._score_reliability("gov.uk") == 0.5
+    assert agent._score_reliability("data.gov.uk") == 0.9
+    assert agent._score_reliability("old.reddit.com") == 0.3
+    assert agent._score_reliability("example.com") == 0.5
+    # A path mentioning a trusted domain doesn't borrow its reputation
+    assert agent._score_reliability("notreuters.com") == 0.5
@@ -5,23 +5,30 @@ from uuid import uuid4
 from db import Task, TaskStage
 from agents.reporter import ReporterAgent
 
+async def _stream(*chunks):
+    for chunk in chunks:
+        yield chunk
+
 @pytest.fixture
 def mock_services():
     with patch("ingestion.embeddings.embedding_service") as embed, \
-         patch("db.memory.memory_store") as memory, \
-         patch("ingestion.search_service") as search, \
-         patch("ingestion.entity_extractor") as entity, \
+         patch("agents.reporter.memory_store") as memory, \
+         patch("agents.reporter.search_service") as search, \
+         patch("agents.reporter.entity_batcher") as entity, \
          patch("db.human_oversight.human_prompt_store") as prompts, \
          patch("db.human_oversight.source_store") as sources, \
          patch("agents.llm.chat_service") as chat:
         
-        embed.embed.return_value = [0.1, 0.2]
+        embed.embed_async = AsyncMock(return_value=[0.1, 0.2])
         memory.find_similar_stories = AsyncMock(return_value=[])
         search.search = AsyncMock(return_value=[])
-        entity.extract.return_value = []
+        entity.extract = AsyncMock(return_value=[])
         prompts.get_pending_prompts = AsyncMock(return_value=[])
         sources.get_story_sources = AsyncMock(return_value=[])
-        chat.generate = AsyncMock(return_value="Drafted article content.")
+        chat.generate = AsyncMock(
+            side_effect=lambda json_schema=None, **kwargs: {} if json_schema else "Drafted article content."
+        )
+        chat.stream = MagicMock(side_effect=lambda **kwargs: _stream("Drafted ", "article content."))
         chat.provider = "mock_provider"
         
         yield {
@@ -60,7 +67,7 @@ async def test_research_contextual_memory(reporter, mock_services):
     # Verify
     assert "historical_context" in result
     assert result["historical_context"][0]["content"] == "Old Story Content"
-    mock_services["embed"].embed.assert_called_once()
+    mock_services["embed"].embed_async.assert_awaited_once()
 
 @pytest.mark.asyncio
 async def test_research_entity_first(reporter, mock_services):
@@ -110,7 +117,7 @@ async def test_draft_uses_context(reporter, mock_services):
     await reporter.draft(task)
     
     # Verify prompt contains context
-    args, kwargs = mock_services["chat"].generate.call_args
+    args, kwargs = mock_services["chat"].stream.call_args
     # Check messages argument (passed as kwarg in code)
     messages = kwargs.get("messages") or (args[1] if len(args) > 1 else [])
     
@@ -34,6 +34,16 @@ def test_search_result_model():
     assert result.source == "example.com"
 
 
+def test_canonical_url_ignores_tracking_and_formatting():
+    """Test that URL variants of the same page dedupe to one key."""
+    from ingestion.search_fallback import canonical_url
+    
+    base = canonical_url("https://example.com/story")
+    assert canonical_url("http://Example.com/story/") == base
+    assert canonical_url("https://example.com/story?utm_source=x&fbclid=y#top") == base
+    assert canonical_url("https://example.com/story?id=2") != base
+
+
 def test_entity_extraction_with_text():
     """Test entity extraction with sample text."""
     extractor = EntityExtractor()
@@ -64,6 +74,51 @@ def test_entity_extraction_empty_text():
     assert entities == []
 
 
+def test_entity_extraction_is_cached():
+    """Test that re-extracting the same text doesn't rerun the spaCy pipeline."""
+    from types import SimpleNamespace
+    from unittest.mock import Mock
+    
+    extractor = EntityExtractor()
+    span = SimpleNamespace(text="Tim Cook", label_="PERSON", start_char=0, end_char=8)
+    extractor.nlp = Mock()
+    extractor.nlp.pipe = Mock(side_effect=lambda texts, batch_size: [SimpleNamespace(ents=[span]) for _ in texts])
+    
+    first = extractor.extract("Tim Cook spoke.")
+    second = extractor.extract("Tim Cook spoke.")
+    
+    assert extractor.nlp.pipe.call_count == 1
+    assert first == second == [Entity(text="Tim Cook", label_="PERSON", start=0, end=8)]
+    
+    # Callers get their own list, so mutating a result can't corrupt the cache
+    second.clear()
+    assert extractor.extract("Tim Cook spoke.") == first
+
+
+@pytest.mark.asyncio
+async def test_entity_batcher_coalesces_concurrent_requests():
+    """Test that concurrent extractions share one nlp.pipe pass, in order."""
+    import asyncio
+    from types import SimpleNamespace
+    from unittest.mock import Mock
+    from ingestion.entities import EntityBatcher
+    
+    extractor = EntityExtractor()
+    extractor.nlp = Mock()
+    extractor.nlp.pipe = Mock(side_effect=lambda texts, batch_size: [
+        SimpleNamespace(ents=[SimpleNamespace(text=t, label_="ORG", start_char=0, end_char=len(t))])
+        for t in texts
+    ])
+    batcher = EntityBatcher(extractor)
+    
+    results = await asyncio.gather(*[batcher.extract(t) for t in ("Acme", "Globex", "Acme", "")])
+    await batcher.close()
+    
+    assert [[e.text for e in r] for r in results] == [["Acme"], ["Globex"], ["Acme"], []]
+    assert extractor.nlp.pipe.call_count == 1
+    assert list(extractor.nlp.pipe.call_args.args[0]) == ["Acme", "Globex"]
+
+
 def test_entity_extraction_by_type():
     """Test filtering entities by type."""
     extractor = EntityExtractor()
@@ -81,3 +136,201 @@ def test_entity_extraction_by_type():
     assert isinstance(people, list)
     assert isinstance(orgs, list)
     assert isinstance(locations, list)
+
+
+@pytest.mark.asyncio
+async def test_search_results_are_memoized():
+    """Test that repeated queries are served from the search cache."""
+    from unittest.mock import AsyncMock, Mock, patch
+    from ingestion import search as search_module
+    from ingestion.search_fallback import SearchResult as FallbackSearchResult
+    
+    search_module._search_cache.clear()
+    fallback = Mock()
+    fallback.search = AsyncMock(side_effect=[
+        [],
+        [FallbackSearchResult(title="T", url="https://www.example.com/a", snippet="S", provider="Brave")],
+    ])
+    
+    with patch.object(search_module, "get_fallback_search", return_value=fallback):
+        assert await search_module.search("query", 3) == []  # empty results aren't cached
+        first = await search_module.search("query", 3)
+        second = await search_module.search("query", 3)
+    
+    assert fallback.search.await_count == 2
+    assert first == second
+    assert second[0].source == "example.com"
+
+
+@pytest.mark.asyncio
+async def test_investigative_questions_use_structured_output():
+    """Test that deep-dive queries come back as a parsed list, not scraped text."""
+    from unittest.mock import AsyncMock
+    from agents.reporter import ReporterAgent, QUERIES_SCHEMA
+    
+    reporter = ReporterAgent()
+    reporter.chat_service = AsyncMock()
+    reporter.chat_service.generate = AsyncMock(return_value={"queries": ["q1", "q2"]})
+    
+    questions = await reporter._generate_investigative_questions("Title", "Summary", {}, [])
+    
+    assert questions == ["q1", "q2"]
+    assert reporter.chat_service.generate.call_args.kwargs["json_schema"] is QUERIES_SCHEMA
+    
+    # Malformed structured output falls back to generic leads
+    reporter.chat_service.generate = AsyncMock(return_value={})
+    questions = await reporter._generate_investigative_questions("Title", "Summary", {}, [])
+    assert questions == ["Title official statement", "Title background"]
+
+
+def test_draft_prompt_template_renders_research():
+    """Test the precompiled draft prompt includes facts, sources and history."""
+    from agents.reporter import DRAFT_PROMPT
+    
+    prompt = DRAFT_PROMPT.render(
+        detection_data={"title": "Storm hits coast", "summary": "S", "url": "https://a.com"},
+        sources=[{"title": "Original", "snippet": "o"}, {"title": "Wire", "snippet": "w"}],
+        entities={"people": ["Jane Doe"]},
+        facts=[{"claim": "Core topic: Storm hits coast"}],
+        verified=False,
+        historical_context=[{"content": "Previous storm in 2020"}],
+    )
+    
+    assert "Title: Storm hits coast" in prompt
+    assert "- People: Jane Doe" in prompt
+    assert "- Orgs: None" in prompt
+    assert "- Core topic: Storm hits coast\n" in prompt
+    assert "- Wire: w..." in prompt
+    assert "- Original:" not in prompt  # The original source isn't "additional"
+    assert "Historical Context/Related Stories:\n- Previous storm in 2020" in prompt
+
+
+@pytest.mark.asyncio
+async def test_draft_streams_article_text():
+    """Test that draft assembles the article from streamed chunks."""
+    from unittest.mock import AsyncMock, MagicMock
+    from uuid import uuid4
+    from agents.reporter import ReporterAgent, _completion_cache
+    from db import Task, TaskStage
+    
+    _completion_cache.clear()
+    
+    async def chunks(**kwargs):
+        for chunk in ("Storm ", "hits ", "coast."):
+            yield chunk
+    
+    reporter = ReporterAgent()
+    reporter.log_event = AsyncMock()
+    reporter.chat_service = MagicMock(provider="mock")
+    reporter.chat_service.stream = MagicMock(side_effect=chunks)
+    task = Task(
+        id=uuid4(),
+        story_id=uuid4(),
+        stage=TaskStage.DRAFT,
+        input={"detection_data": {"title": "Storm"}, "research_data": {}},
+    )
+    
+    result = await reporter.draft(task)
+    
+    assert result["article"] == "Storm hits coast."
+    assert result["word_count"] == 3
+    assert reporter.chat_service.stream.call_args.kwargs["max_tokens"] == 1000
+    
+    # A retry with the same research reuses the completed draft
+    assert (await reporter.draft(task))["article"] == "Storm hits coast."
+    assert reporter.chat_service.stream.call_count == 1
+    cache_status = [c.args[2]["cache"] for c in reporter.log_event.call_args_list]
+    assert cache_status == ["miss", "hit"]
+
+
+@pytest.mark.asyncio
+async def test_answer_prompt_cache_is_per_provider():
+    """Test that a cached prompt answer isn't reused for another provider."""
+    from unittest.mock import AsyncMock, MagicMock
+    from agents.reporter import ReporterAgent, _completion_cache
+    
+    _completion_cache.clear()
+    context = {"title": "Storm", "summary": "Heavy rain.", "sources": []}
+    
+    reporter = ReporterAgent()
+    reporter.chat_service = MagicMock(provider="openai")
+    reporter.chat_service.generate = AsyncMock(return_value="From OpenAI")
+    assert await reporter._answer_prompt("Who?", context) == "From OpenAI"
+    
+    reporter.chat_service = MagicMock(provider="anthropic")
+    reporter.chat_service.generate = AsyncMock(return_value="From Anthropic")
+    assert await reporter._answer_prompt("Who?", context) == "From Anthropic"
+    assert await reporter._answer_prompt("Who?", context) == "From Anthropic"
+    reporter.chat_service.generate.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_reporter_searches_are_bounded():
+    """Test that research searches run concurrently up to the reporter's limit."""
+    import asyncio
+    from unittest.mock import patch
+    from agents.reporter import ReporterAgent
+    
+    reporter = ReporterAgent()
+    reporter._search_semaphore = asyncio.Semaphore(2)
+    active = peak = 0
+    
+    async def fake_search(query, num_results):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return [query]
+    
+    with patch("ingestion.search_service.search", side_effect=fake_search):
+        results = await asyncio.gather(*[reporter._search(f"q{i}", 2) for i in range(5)])
+    
+    assert results == [[f"q{i}"] for i in range(5)]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_research_extracts_entities_off_the_event_loop():
+    """Test that spaCy extraction runs in a worker thread and feeds refinement."""
+    import threading
+    from unittest.mock import AsyncMock, Mock, patch
+    from agents.reporter import ReporterAgent
+    from ingestion.entities import EntityBatcher
+    
+    reporter = ReporterAgent()
+    reporter._refine_entities = AsyncMock(return_value={"people": ["Jane"]})
+    loop_thread = threading.get_ident()
+    extractor = Mock()
+    extractor.extract_many = Mock(side_effect=lambda texts, batch_size: [[threading.get_ident()] for _ in texts])
+    
+    batcher = EntityBatcher(extractor)
+    with patch("agents.reporter.entity_batcher", batcher):
+        refined = await reporter._extract_and_refine_entities("Storm", "Jane evacuates", "Storm. Jane evacuates the coast")
+    await batcher.close()
+    
+    assert refined == {"people": ["Jane"]}
+    assert extractor.extract_many.call_args.args[0] == ["Storm. Jane evacuates the coast"]
+    initial = reporter._refine_entities.call_args.kwargs["initial_entities"]
+    assert initial[0] != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_research_skips_semantic_lookups_for_tiny_text():
+    """Test that empty detections don't trigger embedding, recall or NER."""
+    from unittest.mock import AsyncMock, Mock, patch
+    from uuid import uuid4
+    from agents.reporter import ReporterAgent
+    from db import Task, TaskStage
+    
+    reporter = ReporterAgent()
+    reporter._refine_entities = AsyncMock(return_value={})
+    batcher = Mock(extract=AsyncMock())
+    task = Task(id=uuid4(), story_id=uuid4(), stage=TaskStage.RESEARCH, input={})
+    
+    with patch("agents.reporter.entity_batcher", batcher):
+        assert await reporter._recall_similar_stories(task, ". ") == []
+        await reporter._extract_and_refine_entities("", "", ". ")
+    
+    batcher.extract.assert_not_awaited()
+    assert reporter._refine_entities.call_args.kwargs["initial_entities"] == []
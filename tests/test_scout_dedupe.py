@@ -8,13 +8,13 @@ from agents.scout import ScoutAgent
 @pytest.fixture
 def mock_embedding_service():
     with patch("ingestion.embeddings.embedding_service") as mock:
-        mock.embed.return_value = [0.1, 0.2, 0.3]  # Dummy vector
+        mock.embed_batch_async = AsyncMock(side_effect=lambda texts: [[0.1, 0.2, 0.3] for _ in texts])  # Dummy vectors
         yield mock
 
 @pytest.fixture
 def mock_entity_extractor():
-    with patch("ingestion.entity_extractor") as mock:
-        mock.extract.return_value = []
+    with patch("ingestion.entity_batcher") as mock:
+        mock.extract = AsyncMock(return_value=[])
         yield mock
 
 @pytest.fixture
@@ -34,22 +34,22 @@ async def test_scout_detects_new_story(scout, mock_embedding_service, mock_memor
     # Setup
     mock_memory_store.find_similar_stories.return_value = []  # No duplicates
     
-    # Mock feedparser
-    with patch("feedparser.parse") as mock_parse:
+    # Mock the feed download
+    with patch.object(scout, "_fetch_feed", new_callable=AsyncMock) as mock_fetch:
         mock_entry = {
             "title": "New Tech Invention",
             "summary": "Scientists discover new physics.",
             "link": "http://example.com/story1",
             "published": "Mon, 07 Feb 2026 12:00:00 GMT"
         }
-        mock_parse.return_value.entries = [mock_entry]
+        mock_fetch.return_value = [mock_entry]
         
         # Run
         with patch.object(scout, "log_event", new_callable=AsyncMock) as mock_log:
             await scout.scan_feed("http://example.com/rss")
             
             # Verify
-            assert mock_embedding_service.embed.called
+            assert mock_embedding_service.embed_batch_async.called
             assert mock_memory_store.find_similar_stories.called
             assert mock_memory_store.add.called  # Should add to memory
             
@@ -68,22 +68,22 @@ async def test_scout_detects_duplicate_story(scout, mock_embedding_service, mock
         {"story_id": existing_id, "similarity": 0.95, "content": "Old content"}
     ]
     
-    # Mock feedparser
-    with patch("feedparser.parse") as mock_parse:
+    # Mock the feed download
+    with patch.object(scout, "_fetch_feed", new_callable=AsyncMock) as mock_fetch:
         mock_entry = {
             "title": "New Tech Invention (Updated)",
             "summary": "Scientists discover new physics.",
             "link": "http://example.com/story1-update",
             "published": "Mon, 07 Feb 2026 13:00:00 GMT"
         }
-        mock_parse.return_value.entries = [mock_entry]
+        mock_fetch.return_value = [mock_entry]
         
         # Run
         with patch.object(scout, "log_event", new_callable=AsyncMock) as mock_log:
             await scout.scan_feed("http://example.com/rss")
             
             # Verify
-            assert mock_embedding_service.embed.called
+            assert mock_embedding_service.embed_batch_async.called
             assert mock_memory_store.find_similar_stories.called
             assert not mock_memory_store.add.called  # Should NOT add duplicate to memory
             
@@ -94,3 +94,259 @@ async def test_scout_detects_duplicate_story(scout, mock_embedding_service, mock
             
             assert str(story_id_arg) == str(existing_id)
             assert event_data["is_duplicate"] is True
+
+
+@pytest.mark.asyncio
+async def test_scout_skips_already_seen_entries(scout, mock_embedding_service, mock_memory_store, mock_entity_extractor):
+    """Test that an entry detected on one scan is skipped on the next."""
+    mock_memory_store.find_similar_stories.return_value = []
+    
+    with patch.object(scout, "_fetch_feed", new_callable=AsyncMock) as mock_fetch:
+        mock_fetch.return_value = [{
+            "id": "guid-1",
+            "title": "New Tech Invention",
+            "summary": "Scientists discover new physics.",
+            "link": "http://example.com/story1",
+        }]
+        
+        with patch.object(scout, "log_event", new_callable=AsyncMock) as mock_log:
+            await scout.scan_feed("http://example.com/rss")
+            await scout.scan_feed("http://example.com/rss")
+    
+    assert mock_log.call_count == 1
+    assert mock_embedding_service.embed_batch_async.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_scout_fetches_feed_over_async_http(scout):
+    """Test that feeds are downloaded with the shared async client and parsed."""
+    import httpx
+    
+    rss = b"""<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>
+    <item><title>Storm hits coast</title><link>http://example.com/a</link></item>
+    </channel></rss>"""
+    scout._http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=rss))
+    )
+    
+    entries = await scout._fetch_feed("http://example.com/rss")
+    await scout._http_client.aclose()
+    
+    assert [e["title"] for e in entries] == ["Storm hits coast"]
+
+
+@pytest.mark.asyncio
+async def test_scout_parses_malformed_feed_in_worker_process(scout):
+    """Test that a bozo feed's entries still come back from the parser process."""
+    import httpx
+    
+    # Unescaped "&" - feedparser flags the feed as bozo with an unpicklable error
+    rss = b"""<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>
+    <item><title>Storm hits coast & town</title><link>http://example.com/a</link></item>
+    </channel></rss>"""
+    scout._http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=rss))
+    )
+    
+    entries = await scout._fetch_feed("http://example.com/rss")
+    with patch.object(scout, "heartbeat", new_callable=AsyncMock):
+        await scout.stop()
+    
+    assert [e["link"] for e in entries] == ["http://example.com/a"]
+    assert scout._parse_pool is None
+
+
+@pytest.mark.asyncio
+async def test_scout_sends_conditional_get_for_unchanged_feeds(scout):
+    """Test that a feed's ETag is replayed and a 304 skips parsing."""
+    import httpx
+    
+    seen_headers = []
+    
+    def respond(request):
+        seen_headers.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"<rss version='2.0'><channel></channel></rss>", headers={"ETag": '"v1"'})
+    
+    scout._http_client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+    
+    await scout.scan_feed("http://example.com/rss")
+    assert await scout._fetch_feed("http://example.com/rss") is None
+    await scout._http_client.aclose()
+    
+    assert seen_headers == [None, '"v1"']
+
+
+@pytest.mark.asyncio
+async def test_scout_keeps_validators_only_after_successful_scan(scout, mock_embedding_service, mock_memory_store, mock_entity_extractor):
+    """Test that a failed scan doesn't let the next download come back 304."""
+    import httpx
+    
+    mock_memory_store.find_similar_stories.return_value = []
+    rss = b"""<rss version="2.0"><channel><item><title>Storm hits coast</title>
+    <description>Heavy rain.</description><link>http://example.com/a</link></item></channel></rss>"""
+    seen_headers = []
+    
+    def respond(request):
+        seen_headers.append(request.headers.get("if-none-match"))
+        return httpx.Response(200, content=rss, headers={"ETag": '"v1"'})
+    
+    scout._http_client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+    
+    with patch.object(scout, "log_event", new_callable=AsyncMock, side_effect=RuntimeError("db down")):
+        await scout.scan_feed("http://example.com/rss")
+    with patch.object(scout, "log_event", new_callable=AsyncMock) as mock_log:
+        await scout.scan_feed("http://example.com/rss")
+        await scout.scan_feed("http://example.com/rss")
+    await scout._http_client.aclose()
+    
+    assert seen_headers == [None, None, '"v1"']
+    assert mock_log.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_scout_matches_recent_stories_in_process(scout, mock_embedding_service, mock_memory_store, mock_entity_extractor):
+    """Test that a repeat of a story saved this session skips the vector index."""
+    mock_memory_store.find_similar_stories.return_value = []
+    mock_embedding_service.embed_batch_async = AsyncMock(side_effect=lambda texts: [[0.6, 0.8, 0.0] for _ in texts])
+    
+    entries = [
+        {"id": "a", "title": "Storm hits coast", "summary": "Heavy rain.", "link": "http://example.com/a"},
+        {"id": "b", "title": "Storm hits the coast", "summary": "Heavy rain.", "link": "http://example.com/b"},
+    ]
+    with patch.object(scout, "_fetch_feed", new_callable=AsyncMock) as mock_fetch:
+        mock_fetch.return_value = entries
+        with patch.object(scout, "log_event", new_callable=AsyncMock) as mock_log:
+            await scout.scan_feed("http://example.com/rss")
+    
+    assert mock_memory_store.find_similar_stories.call_count == 1
+    first, second = mock_log.call_args_list
+    assert second.args[2]["is_duplicate"] is True
+    assert second.args[0] == first.args[0]
+
+
+@pytest.mark.asyncio
+async def test_scout_extracts_entities_for_all_candidates_in_one_batch(scout, mock_embedding_service, mock_memory_store):
+    """Test that candidate entries are tagged by spaCy in a single batch."""
+    from types import SimpleNamespace
+    from ingestion.entities import EntityBatcher
+    
+    mock_memory_store.find_similar_stories.return_value = []
+    mock_embedding_service.embed_batch_async = AsyncMock(side_effect=lambda texts: [[1.0, 0.0], [0.0, 1.0]])
+    extractor = MagicMock()
+    extractor.extract_many = MagicMock(side_effect=lambda texts, batch_size: [
+        [SimpleNamespace(text="Jane", label_="PERSON"), SimpleNamespace(text="Jane", label_="PERSON")] for _ in texts
+    ])
+    batcher = EntityBatcher(extractor)
+    
+    entries = [
+        {"id": "a", "title": "Storm hits coast", "summary": "Heavy rain.", "link": "http://example.com/a"},
+        {"id": "b", "title": "Council passes budget", "summary": "Vote is 5-2.", "link": "http://example.com/b"},
+    ]
+    with patch("ingestion.entity_batcher", batcher), \
+         patch.object(scout, "_fetch_feed", new_callable=AsyncMock) as mock_fetch, \
+         patch.object(scout, "log_event", new_callable=AsyncMock):
+        mock_fetch.return_value = entries
+        await scout.scan_feed("http://example.com/rss")
+    await batcher.close()
+    
+    assert extractor.extract_many.call_count == 1
+    assert len(extractor.extract_many.call_args.args[0]) == 2
+    metadata = mock_memory_store.add.call_args.kwargs["metadata"]
+    assert metadata["entities"]["people"] == ["Jane"]
+
+
+def test_scout_entry_reads_feed_fields_once(scout):
+    """Test that feed entries convert to ScoutEntry and score from its attributes."""
+    import feedparser
+    from agents.scout import ScoutEntry
+    
+    feed_entry = feedparser.FeedParserDict(
+        id="guid-1", title="Storm hits coast", summary="x" * 250, link="http://example.com/a"
+    )
+    entry = ScoutEntry.from_feed_entry(feed_entry)
+    
+    assert entry.id == "guid-1"
+    assert entry.summary == "x" * 250
+    assert entry.published is None
+    assert scout.calculate_newsworthiness(entry) == pytest.approx(0.9)
+
+
+@pytest.mark.asyncio
+async def test_scout_heartbeats_during_long_scan(scout):
+    """Test that heartbeats keep running while a scan cycle is in progress."""
+    import asyncio
+    
+    async def long_scan():
+        await asyncio.sleep(0.1)
+        scout._running = False
+    
+    with patch.object(scout, "register", new_callable=AsyncMock), \
+         patch.object(scout, "heartbeat", new_callable=AsyncMock) as mock_heartbeat, \
+         patch.object(scout, "_scan_loop", side_effect=long_scan), \
+         patch("agents.scout.settings.agent_heartbeat_interval_seconds", 0.01):
+        await scout.run()
+    
+    assert mock_heartbeat.await_count >= 2
+
+
+@pytest.mark.asyncio
+async def test_scout_writes_detections_in_one_batch(scout, mock_embedding_service, mock_memory_store, mock_entity_extractor):
+    """Test that a scan's detection events are appended with one multi-row write."""
+    from db.events import BatchingAppender
+    
+    mock_memory_store.find_similar_stories.return_value = []
+    mock_embedding_service.embed_batch_async = AsyncMock(side_effect=lambda texts: [[1.0, 0.0], [0.0, 1.0]])
+    store = MagicMock()
+    store.append_many = AsyncMock(side_effect=lambda events: list(range(len(events))))
+    appender = BatchingAppender(store)
+    
+    entries = [
+        {"id": "a", "title": "Storm hits coast", "summary": "Heavy rain.", "link": "http://example.com/a"},
+        {"id": "b", "title": "Council passes budget", "summary": "Vote is 5-2.", "link": "http://example.com/b"},
+    ]
+    with patch("agents.base.event_appender", appender), \
+         patch.object(scout, "_fetch_feed", new_callable=AsyncMock) as mock_fetch:
+        mock_fetch.return_value = entries
+        await scout.scan_feed("http://example.com/rss")
+    await appender.close()
+    
+    assert store.append_many.await_count == 1
+    events = store.append_many.call_args.args[0]
+    assert [e.data["title"] for e in events] == ["Storm hits coast", "Council passes budget"]
+
+
+@pytest.mark.asyncio
+async def test_scout_saves_story_memory_only_after_detection_is_written(scout, mock_embedding_service, mock_memory_store, mock_entity_extractor):
+    """Test that a failed detection write leaves no dedupe target behind."""
+    mock_memory_store.find_similar_stories.return_value = []
+    entries = [{"id": "a", "title": "Storm hits coast", "summary": "Heavy rain.", "link": "http://example.com/a"}]
+    
+    with patch.object(scout, "_fetch_feed", new_callable=AsyncMock) as mock_fetch:
+        mock_fetch.return_value = entries
+        with patch.object(scout, "log_event", new_callable=AsyncMock, side_effect=RuntimeError("db down")):
+            await scout.scan_feed("http://example.com/rss")
+        
+        assert not mock_memory_store.add.called
+        assert scout._recent_story_ids == []
+        
+        with patch.object(scout, "log_event", new_callable=AsyncMock) as mock_log:
+            await scout.scan_feed("http://example.com/rss")
+    
+    # The retry is a new story, not a duplicate of the one never written
+    assert mock_log.call_args.args[2]["is_duplicate"] is False
+    assert mock_memory_store.add.call_args.kwargs["story_id"] == mock_log.call_args.args[0]
+
+
+def test_scout_entry_strips_markup():
+    """Test that titles and summaries are reduced to plain text."""
+    from agents.scout import ScoutEntry
+    
+    entry = ScoutEntry.from_feed_entry({
+        "title": "Storm <em>hits</em> coast",
+        "summary": '<p>Heavy rain.<br/> <a href="/x">More</a></p>',
+    })
+    
+    assert entry.title == "Storm hits coast"
+    assert entry.summary == "Heavy rain. More"